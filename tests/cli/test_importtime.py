@@ -0,0 +1,89 @@
+"""Tests that the command line tools only import what they need at startup."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import tomllib
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SCRIPTS = tomllib.loads((REPO_ROOT / "pyproject.toml").read_text(encoding="utf-8"))[
+    "project"
+]["scripts"]
+
+# Modules only needed for some options, which are imported when used
+LAZY_MODULES = {
+    "concurrent.futures.process",
+    "multiprocessing",
+    "numpy",
+    "sqlite3",
+    "translate.filters.checkcache",
+    "translate.misc.sqlitecache",
+    "translate.search.tmindex",
+    "translate.tools.statscache",
+}
+
+# Modules only needed for XML based formats and rich strings
+XML_MODULES = {"lxml.etree", "translate.storage.placeables"}
+
+NON_XML_SCRIPTS = {
+    "csv2po",
+    "ini2po",
+    "json2po",
+    "php2po",
+    "po2csv",
+    "po2ini",
+    "po2json",
+    "po2php",
+    "po2prop",
+    "po2txt",
+    "pocompile",
+    "pocount",
+    "pofilter",
+    "pogrep",
+    "pomerge",
+    "pot2po",
+    "pretranslate",
+    "prop2po",
+    "txt2po",
+}
+
+
+def importtime(module):
+    """
+    Imports *module* in a new interpreter using ``python -X importtime``.
+
+    :return: Dictionary with the cumulative import time in microseconds of
+        every module that was imported.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _self, cumulative, name = line.removeprefix("import time:").split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize("script", sorted(SCRIPTS))
+def test_startup_imports(script) -> None:
+    module = SCRIPTS[script].split(":")[0]
+    times = importtime(module)
+    assert module in times
+    unexpected = LAZY_MODULES.intersection(times)
+    if script in NON_XML_SCRIPTS:
+        unexpected.update(XML_MODULES.intersection(times))
+    assert not unexpected, (
+        f"{script} imports {', '.join(sorted(unexpected))} at startup "
+        f"(took {times[module] / 1000:.1f} ms)"
+    )
@@ -138,10 +138,12 @@ class TestConvertCommand:
             "-h, --help",
             "--manpage",
             "--errorlevel=ERRORLEVEL",
+            "--jobs=JOBS",
             "-i INPUT, --input=INPUT",
             "-x EXCLUDE, --exclude=EXCLUDE",
             "-o OUTPUT, --output=OUTPUT",
             "-S, --timestamp",
+            "--manifest=MANIFEST",
         ]
         for expected in chain(base_options, self.expected_options):
             start = len(options)
@@ -204,6 +206,101 @@ class TestArchiveConvertOptionParser:
         assert (outputdir / "nested" / "file.po").read_bytes() == b"content"
 
 
+class TestManifest:
+    @staticmethod
+    def run(tmp_path, template=None, dependencies=(), **passthrough):
+        processed = []
+
+        def processor(inputfile, outputfile, templatefile, **kwargs):
+            processed.append(inputfile.name)
+            outputfile.write(inputfile.read())
+            if templatefile is not None:
+                outputfile.write(templatefile.read())
+            return True
+
+        parser = convert.ConvertOptionParser(
+            {"txt": ("po", processor), ("txt", "txt"): ("po", processor)},
+            usetemplates=True,
+        )
+        parser.passthrough.extend(passthrough)
+        parser.dependencies.extend(dependencies)
+        options = SimpleNamespace(
+            input=str(tmp_path / "in"),
+            output=str(tmp_path / "out"),
+            template=template,
+            progress="none",
+            errorlevel="message",
+            timestamp=False,
+            exclude=["CVS", ".svn", ".git"],
+            manifest=str(tmp_path / "manifest.json"),
+            **passthrough,
+        )
+        parser.recursiveprocess(options)
+        return sorted(os.path.basename(name) for name in processed)
+
+    @staticmethod
+    def make_tree(tmp_path):
+        (tmp_path / "in").mkdir()
+        (tmp_path / "out").mkdir()
+        for name in "abc":
+            (tmp_path / "in" / f"{name}.txt").write_bytes(name.encode())
+
+    def test_unchanged(self, tmp_path) -> None:
+        self.make_tree(tmp_path)
+        assert self.run(tmp_path) == ["a.txt", "b.txt", "c.txt"]
+        assert self.run(tmp_path) == []
+        # Modification times don't matter
+        os.utime(tmp_path / "in" / "a.txt", ns=(0, 0))
+        assert self.run(tmp_path) == []
+
+    def test_changed_input(self, tmp_path) -> None:
+        self.make_tree(tmp_path)
+        self.run(tmp_path)
+        (tmp_path / "in" / "b.txt").write_bytes(b"changed")
+        assert self.run(tmp_path) == ["b.txt"]
+        assert (tmp_path / "out" / "b.po").read_bytes() == b"changed"
+        (tmp_path / "in" / "d.txt").write_bytes(b"d")
+        assert self.run(tmp_path) == ["d.txt"]
+
+    def test_changed_output(self, tmp_path) -> None:
+        self.make_tree(tmp_path)
+        self.run(tmp_path)
+        (tmp_path / "out" / "a.po").write_bytes(b"edited")
+        (tmp_path / "out" / "c.po").unlink()
+        assert self.run(tmp_path) == ["a.txt", "c.txt"]
+        assert (tmp_path / "out" / "a.po").read_bytes() == b"a"
+
+    def test_changed_options(self, tmp_path) -> None:
+        self.make_tree(tmp_path)
+        assert len(self.run(tmp_path, duplicatestyle="merge")) == 3
+        assert self.run(tmp_path, duplicatestyle="merge") == []
+        assert len(self.run(tmp_path, duplicatestyle="msgctxt")) == 3
+        # The number of processes doesn't change the output
+        assert self.run(tmp_path, duplicatestyle="msgctxt", jobs=2) == []
+
+    def test_changed_dependency(self, tmp_path) -> None:
+        self.make_tree(tmp_path)
+        tm = tmp_path / "tm.po"
+        tm.write_bytes(b"memory")
+        assert len(self.run(tmp_path, dependencies=["tm"], tm=str(tm))) == 3
+        assert self.run(tmp_path, dependencies=["tm"], tm=str(tm)) == []
+        tm.write_bytes(b"changed")
+        assert len(self.run(tmp_path, dependencies=["tm"], tm=str(tm))) == 3
+        assert self.run(tmp_path, dependencies=["tm"], tm=str(tm)) == []
+
+    def test_changed_template(self, tmp_path) -> None:
+        self.make_tree(tmp_path)
+        (tmp_path / "tmpl").mkdir()
+        for name in "abc":
+            (tmp_path / "tmpl" / f"{name}.txt").write_bytes(b"template")
+        template = str(tmp_path / "tmpl")
+        assert len(self.run(tmp_path, template)) == 3
+        assert self.run(tmp_path, template) == []
+        (tmp_path / "tmpl" / "c.txt").write_bytes(b"changed")
+        assert self.run(tmp_path, template) == ["c.txt"]
+        assert (tmp_path / "out" / "c.po").read_bytes() == b"cchanged"
+
+
 class TestShouldOutputStore:
     @staticmethod
     def get_store(po_source):
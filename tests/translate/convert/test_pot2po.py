@@ -3,7 +3,7 @@ from io import BytesIO
 from pytest import mark
 
 from translate.convert import pot2po
-from translate.storage import po
+from translate.storage import base, po
 
 from . import test_convert
 
@@ -938,7 +938,40 @@ class TestPOT2POCommand(test_convert.TestConvertCommand, TestPOT2PO):
         "-t TEMPLATE, --template=TEMPLATE",
         "-P, --pot",
         "-m MAXLENGTH, --maxlinelength=MAXLENGTH",
+        "--tm-index=TM_INDEX",
         "--tm",
         "-s MIN_SIMILARITY, --similarity=MIN_SIMILARITY",
         "--nofuzzymatching",
     ]
+
+    def test_intern_strings(self) -> None:
+        """Tests that only the stores of the conversion intern their strings."""
+        self.create_testfile("input.pot", 'msgid "File"\nmsgstr ""\n')
+        self.create_testfile("template.po", 'msgid "File"\nmsgstr "Lêer"\n')
+        self.run_command("input.pot", "output.po", template="template.po")
+        assert 'msgstr "Lêer"' in self.read_testfile("output.po").decode("utf-8")
+        assert not base.TranslationStore.intern_strings
+
+    def test_jobs_tm_index(self, monkeypatch) -> None:
+        """Tests that a TM index is only updated by a single process."""
+
+        def parallelprocess(*args) -> None:
+            raise AssertionError("files with a TM index are processed in parallel")
+
+        monkeypatch.setattr(
+            pot2po.convert.ConvertOptionParser, "parallelprocess", parallelprocess
+        )
+        self.create_testfile("in/first.pot", 'msgid "Open file"\nmsgstr ""\n')
+        self.create_testfile("in/second.pot", 'msgid "Save file"\nmsgstr ""\n')
+        self.create_testfile(
+            "tm.po",
+            'msgid "Open file"\nmsgstr "Maak lêer oop"\n\n'
+            'msgid "Save file"\nmsgstr "Stoor lêer"\n',
+        )
+        self.run_command("in", "out", tm="tm.po", tm_index="index.db", jobs=2)
+        assert 'msgstr "Maak lêer oop"' in self.read_testfile("out/first.po").decode(
+            "utf-8"
+        )
+        assert 'msgstr "Stoor lêer"' in self.read_testfile("out/second.po").decode(
+            "utf-8"
+        )
@@ -198,3 +198,37 @@ def test_category() -> None:
     assert standard_checker.categories != {}
     assert len(standard_checker.categories.values()) == standard_categories_count
     assert "validxml" not in standard_checker.categories
+
+
+def test_filter_plan() -> None:
+    """Tests the filters to run are only worked out again when needed."""
+    unit = base.TranslationUnit("foo")
+    unit.target = "bar"
+    checker = checks.StandardChecker(checkerconfig=checks.CheckerConfig())
+    plan = checker.getfilterplan()
+    names = [step.name for step in plan.steps]
+    # Preconditions run first
+    assert names[0] == "untranslated"
+    assert set(names) == set(checker.defaultfilters)
+    checker.run_filters(unit)
+    assert checker.getfilterplan() is plan
+
+    # Tests ignored for the language are left out
+    checker.config.updatetargetlanguage("ja")
+    assert "startcaps" in checker.config.lang.ignoretests["all"]
+    assert checker.getfilterplan() is not plan
+    assert "startcaps" not in [step.name for step in checker.getfilterplan().steps]
+
+    checker.defaultfilters = checker.getfilters(excludefilters=["doublespacing"])
+    assert "doublespacing" not in [step.name for step in checker.getfilterplan().steps]
+
+
+def test_precondition_skips_filters() -> None:
+    """Tests that a failing precondition skips the filters depending on it."""
+    unit = base.TranslationUnit("Open %s file.")
+    unit.target = ""
+    checker = checks.StandardChecker(excludefilters=["untranslated"])
+    # The precondition is run, but not reported
+    assert checker.run_filters(unit) == {}
+    unit.target = "Maak %d lêer oop"
+    assert set(checker.run_filters(unit)) == {"printf", "endpunc"}
@@ -0,0 +1,86 @@
+from translate.filters import checkcache, checks
+from translate.storage import po
+
+POSOURCE = """
+#: file.c:1
+msgid "Open file."
+msgstr "Maak lêer oop"
+
+msgid "Open %s"
+msgstr "Maak %d oop"
+
+msgid "Close"
+msgstr "Maak toe"
+"""
+
+
+def make_checker(**kwargs):
+    return checks.TeeChecker(
+        checkerclasses=[checks.StandardChecker, checks.StandardUnitChecker],
+        **kwargs,
+    )
+
+
+def run_filters(cache, store):
+    return [cache.run_filters(unit) for unit in store.units]
+
+
+def messages(failures):
+    return [
+        {
+            name: (str(failure["message"]), type(failure["message"]))
+            for name, failure in unitfailures.items()
+        }
+        for unitfailures in failures
+    ]
+
+
+class TestCheckCache:
+    def test_results(self, tmp_path) -> None:
+        """Test that cached results are the same as checking the units."""
+        store = po.pofile.parsestring(POSOURCE.encode())
+        checker = make_checker()
+        expected = [checker.run_filters(unit, categorised=True) for unit in store.units]
+        cachefile = str(tmp_path / "checks.db")
+        with checkcache.CheckCache(cachefile, checker) as cache:
+            assert messages(run_filters(cache, store)) == messages(expected)
+            assert (cache.hits, cache.misses) == (0, 3)
+        with checkcache.CheckCache(cachefile, checker) as cache:
+            assert messages(run_filters(cache, store)) == messages(expected)
+            assert (cache.hits, cache.misses) == (3, 0)
+            assert cache.getstats() == "3 hits, 0 misses (100.0% hit ratio)"
+
+    def test_changes(self, tmp_path) -> None:
+        """Test that results are not reused when the unit or checker changes."""
+        store = po.pofile.parsestring(POSOURCE.encode())
+        cachefile = str(tmp_path / "checks.db")
+        with checkcache.CheckCache(cachefile, make_checker()) as cache:
+            run_filters(cache, store)
+        store.units[1].target = "Maak %s oop"
+        store.units[2].addlocation("file.c:2")
+        with checkcache.CheckCache(cachefile, make_checker()) as cache:
+            failures = run_filters(cache, store)
+            assert "printf" not in failures[1]
+            assert (cache.hits, cache.misses) == (1, 2)
+        with checkcache.CheckCache(
+            cachefile, make_checker(excludefilters=["endpunc"])
+        ) as cache:
+            failures = run_filters(cache, store)
+            assert "endpunc" not in failures[0]
+            assert (cache.hits, cache.misses) == (0, 3)
+
+    def test_maxsize(self, tmp_path) -> None:
+        """Test that the least recently used results are dropped."""
+        store = po.pofile.parsestring(POSOURCE.encode())
+        cachefile = str(tmp_path / "checks.db")
+        checker = make_checker()
+        with checkcache.CheckCache(cachefile, checker, maxsize=2) as cache:
+            run_filters(cache, store)
+        with checkcache.CheckCache(cachefile, checker, maxsize=2) as cache:
+            run_filters(cache, store)
+            assert (cache.hits, cache.misses) == (2, 1)
+            # The first unit was dropped, and has now been used last
+            assert cache.get(cache.getkey(store.units[0])) is not None
+        with checkcache.CheckCache(cachefile, checker, maxsize=2) as cache:
+            assert cache.get(cache.getkey(store.units[0])) is not None
+            assert cache.get(cache.getkey(store.units[1])) is None
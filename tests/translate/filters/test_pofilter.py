@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import gzip
 from io import BytesIO
 from typing import TYPE_CHECKING
 
-from translate.filters import checks, pofilter
+from translate.filters import checkcache, checks, pofilter
 from translate.storage import factory, xliff
 
 from ..storage.test_base import first_translatable, headerless_len
@@ -25,7 +26,9 @@ class BaseTestFilter:
         dummyfile.name = self.filename
         return factory.getobject(dummyfile)
 
-    def filter(self, translationstore, checkerconfig=None, cmdlineoptions=None):
+    def filter(
+        self, translationstore, checkerconfig=None, cmdlineoptions=None, units=None
+    ):
         """
         Helper that passes a translations store through a filter, and
         returns the resulting store.
@@ -40,7 +43,13 @@ class BaseTestFilter:
             parser = pofilter.FilterOptionParser({})
             checkerconfig = parser.build_checkerconfig(options)
         checkfilter = pofilter.pocheckfilter(options, checkerclasses, checkerconfig)
-        return checkfilter.filterfile(translationstore)
+        if options.checkcache:
+            with checkcache.CheckCache(
+                options.checkcache, checkfilter.checker
+            ) as cache:
+                checkfilter.checkcache = cache
+                return checkfilter.filterfile(translationstore, units)
+        return checkfilter.filterfile(translationstore, units)
 
     def test_simplepass(self) -> None:
         """Checks that an obviously correct string passes."""
@@ -230,6 +239,78 @@ msgstr "koei"
             print(first_translatable(filter_result))
         assert headerless_len(filter_result.units) == 0
 
+    def test_jobs(self, tmp_path, monkeypatch) -> None:
+        """Tests that checking units in parallel gives the same result."""
+        posource = "".join(
+            f'msgid "File {number}."\nmsgstr "lêer {number}"\n\n'
+            if number % 3
+            else f'msgid "Open %s {number}"\nmsgstr "Maak oop {number}"\n\n'
+            for number in range(40)
+        )
+        pofilename = tmp_path / "test.po"
+        pofilename.write_text(posource, encoding="utf-8")
+        monkeypatch.setattr(pofilter.pocheckfilter, "minshardsize", 5)
+        for options in ([], ["--autocorrect"]):
+            serial = self.filter(factory.getobject(str(pofilename)), None, options)
+            parallel = self.filter(
+                factory.getobject(str(pofilename)), None, [*options, "--jobs=2"]
+            )
+            assert headerless_len(serial.units)
+            assert [str(unit) for unit in parallel.units[1:]] == [
+                str(unit) for unit in serial.units[1:]
+            ]
+
+    def test_jobs_compressed(self, tmp_path, monkeypatch) -> None:
+        """Tests that units of compressed files are checked in parallel."""
+        posource = "".join(
+            f'msgid "File {number}."\nmsgstr "lêer {number}"\n\n'
+            for number in range(40)
+        )
+        pofilename = tmp_path / "test.po.gz"
+        with gzip.open(pofilename, "wt", encoding="utf-8") as pofile:
+            pofile.write(posource)
+        monkeypatch.setattr(pofilter.pocheckfilter, "minshardsize", 5)
+        serial = self.filter(factory.getobject(str(pofilename)))
+        parallel = self.filter(factory.getobject(str(pofilename)), None, ["--jobs=2"])
+        assert headerless_len(serial.units) == 40
+        assert [str(unit) for unit in parallel.units] == [
+            str(unit) for unit in serial.units
+        ]
+
+    def test_stream(self, tmp_path) -> None:
+        """Tests that checking units while parsing the file gives the same result."""
+        posource = "".join(
+            f'msgid "File {number}."\nmsgstr "lêer {number}"\n\n'
+            for number in range(20)
+        )
+        pofilename = tmp_path / "test.po"
+        pofilename.write_text(posource, encoding="utf-8")
+        for options in ([], ["--autocorrect"]):
+            expected = self.filter(factory.getobject(str(pofilename)), None, options)
+            store, units = factory.iterobject(str(pofilename))
+            result = self.filter(store, None, options, units)
+            assert headerless_len(result.units)
+            assert [str(unit) for unit in result.units[1:]] == [
+                str(unit) for unit in expected.units[1:]
+            ]
+
+    def test_check_cache(self, tmp_path, monkeypatch) -> None:
+        """Tests that reusing earlier check results gives the same result."""
+        posource = "".join(
+            f'msgid "File {number}."\nmsgstr "lêer {number}"\n\n'
+            for number in range(20)
+        )
+        pofilename = tmp_path / "test.po"
+        pofilename.write_text(posource, encoding="utf-8")
+        monkeypatch.setattr(pofilter.pocheckfilter, "minshardsize", 5)
+        cacheoption = f"--check-cache={tmp_path / 'checks.db'}"
+        expected = self.filter(factory.getobject(str(pofilename)))
+        for options in ([cacheoption], [cacheoption, "--jobs=2"]):
+            result = self.filter(factory.getobject(str(pofilename)), None, options)
+            assert [str(unit) for unit in result.units[1:]] == [
+                str(unit) for unit in expected.units[1:]
+            ]
+
 
 class TestXliffFilter(BaseTestFilter):
     """Test class for xliff-specific tests."""
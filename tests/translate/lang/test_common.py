@@ -30,6 +30,16 @@ def test_words() -> None:
     assert words == ["Don’t", "send", "e", "mail"]
 
 
+def test_wordcount() -> None:
+    """Tests that word counts match the words and are remembered."""
+    language = common.Common
+    assert language.wordcount("") == 0
+    assert language.wordcount("Don't send e-mail!") == 4
+    before = common._wordcount.cache_info().hits
+    assert language.wordcount("Don't send e-mail!") == 4
+    assert common._wordcount.cache_info().hits == before + 1
+
+
 def test_word_khmer() -> None:
     language = common.Common
     # Let's test Khmer with zero width space (\u200b)
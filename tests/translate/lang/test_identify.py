@@ -173,6 +173,25 @@ class TestLanguageIdentifier:
             unit.target = TEXT_LIST[i]
         assert self.langident.identify_target_lang(langlist) == "de"
 
+    def test_identify_langs(self) -> None:
+        assert self.langident.identify_langs([TEXT, "", TEXT_LIST[0]]) == [
+            "de",
+            None,
+            self.langident.identify_lang(TEXT_LIST[0]),
+        ]
+        assert self.langident.identify_langs([]) == []
+
+    def test_identify_stores(self) -> None:
+        langlist = [TranslationUnit(string) for string in TEXT_LIST]
+        for i, unit in enumerate(langlist):
+            unit.target = TEXT_LIST[i]
+        assert self.langident.identify_source_langs([langlist, [], None]) == [
+            "de",
+            None,
+            None,
+        ]
+        assert self.langident.identify_target_langs([langlist]) == ["de"]
+
     def test_bad_init_data(self) -> None:
         """Test __init__ with bad conf files and data dirs."""
         with raises(ValueError):
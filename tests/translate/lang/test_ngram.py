@@ -0,0 +1,56 @@
+import pytest
+
+from translate.lang import ngram
+from translate.misc.file_discovery import get_abs_data_filename
+
+MODEL_DIR = get_abs_data_filename("langmodels")
+
+TEXTS = [
+    (
+        "Die Menschen sind frei und gleich an Würde und Rechten geboren. Sie sind "
+        "mit Vernunft und Gewissen begabt und sollen einander im Geist der "
+        "Brüderlichkeit begegnen."
+    ),
+    (
+        "All human beings are born free and equal in dignity and rights. They are "
+        "endowed with reason and conscience and should act towards one another in "
+        "a spirit of brotherhood."
+    ),
+    (
+        "Tous les êtres humains naissent libres et égaux en dignité et en droits. "
+        "Ils sont doués de raison et de conscience et doivent agir les uns envers "
+        "les autres dans un esprit de fraternité."
+    ),
+    (
+        "Alle menslike wesens word vry, met gelyke waardigheid en regte, gebore. "
+        "Hulle het rede en gewete en behoort in die gees van broederskap teenoor "
+        "mekaar op te tree."
+    ),
+    "The quick brown fox",
+    "",
+]
+
+
+def test_compiled_models_are_current(tmp_path) -> None:
+    """Tests that the shipped compiled models match the .lm files."""
+    np = pytest.importorskip("numpy")
+    filename = tmp_path / ngram.MODEL_FILE
+    ngram.compile_models(MODEL_DIR, filename=filename)
+    compiled = np.load(filename)
+    shipped = np.load(f"{MODEL_DIR}/{ngram.MODEL_FILE}")
+    assert compiled.dtype == shipped.dtype
+    assert (compiled == shipped).all()
+
+
+def test_classify_compiled() -> None:
+    """Tests that the compiled models classify like the separate models."""
+    pytest.importorskip("numpy")
+    compiled = ngram.NGram(MODEL_DIR)
+    assert compiled.compiled is not None
+    separate = ngram.NGram(MODEL_DIR, compiled=False)
+    assert separate.compiled is None
+    expected = [separate.classify(text) for text in TEXTS]
+    assert expected[:4] == ["german", "english", "french", "afrikaans"]
+    assert [compiled.classify(text) for text in TEXTS] == expected
+    assert compiled.classify_many(TEXTS) == expected
+    assert separate.classify_many(TEXTS) == expected
@@ -15,6 +15,16 @@ def _noop_processor(inputfile, outputfile, templatefile):
     return True
 
 
+def _upper_processor(inputfile, outputfile, templatefile):
+    content = inputfile.read()
+    if content == b"fail":
+        raise RuntimeError("processing failed")
+    if content == b"warn":
+        logging.getLogger("processor").warning("suspicious content")
+    outputfile.write(content.upper())
+    return True
+
+
 def _make_exc_info(exc):
     """Create an exc_info tuple for testing warning methods."""
     result = None
@@ -1177,3 +1187,71 @@ class TestRecursiveProcess:
         with caplog.at_level(logging.WARNING):
             parser.recursiveprocess(options)
         assert "Error processing" in caplog.text
+
+    @staticmethod
+    def make_tree(tmp_path, contents):
+        indir = tmp_path / "in"
+        (indir / "sub").mkdir(parents=True)
+        for name, content in contents.items():
+            (indir / name).write_bytes(content)
+        return indir
+
+    @pytest.mark.parametrize("jobs", [1, 3])
+    def test_parallel_processing(self, tmp_path, caplog, jobs) -> None:
+        contents = {f"{name}.txt": name.encode() for name in "abcdefg"}
+        contents["sub/h.txt"] = b"h"
+        contents["fail.txt"] = b"fail"
+        contents["warn.txt"] = b"warn"
+        indir = self.make_tree(tmp_path, contents)
+        outdir = tmp_path / "out"
+        outdir.mkdir()
+        parser = optrecurse.RecursiveOptionParser({"txt": ("po", _upper_processor)})
+        options = SimpleNamespace(
+            input=str(indir),
+            output=str(outdir),
+            template=None,
+            progress="none",
+            errorlevel="message",
+            exclude=["CVS", ".svn", ".git"],
+            jobs=jobs,
+        )
+        with caplog.at_level(logging.WARNING):
+            parser.recursiveprocess(options)
+        for name, content in contents.items():
+            if content != b"fail":
+                outfile = outdir / name.replace(".txt", ".po")
+                assert outfile.read_bytes() == content.upper()
+        error = (
+            f"Error processing: input {indir / 'fail.txt'}, output "
+            f"{outdir / 'fail.po'}, template None: processing failed"
+        )
+        assert [record.getMessage() for record in caplog.records] == [
+            error,
+            "suspicious content",
+        ]
+
+    def test_parallel_processing_unpicklable(self, tmp_path, caplog) -> None:
+        processed = []
+
+        def processor(inputfile, outputfile, templatefile):
+            processed.append(True)
+            outputfile.write(inputfile.read())
+            return True
+
+        indir = self.make_tree(tmp_path, {"a.txt": b"a", "b.txt": b"b"})
+        outdir = tmp_path / "out"
+        outdir.mkdir()
+        parser = optrecurse.RecursiveOptionParser({"txt": ("po", processor)})
+        options = SimpleNamespace(
+            input=str(indir),
+            output=str(outdir),
+            template=None,
+            progress="none",
+            errorlevel="none",
+            exclude=["CVS", ".svn", ".git"],
+            jobs=2,
+        )
+        with caplog.at_level(logging.WARNING):
+            parser.recursiveprocess(options)
+        assert len(processed) == 2
+        assert "Unable to process files in parallel" in caplog.text
@@ -0,0 +1,52 @@
+import json
+
+from translate.misc.sqlitecache import SQLiteCache
+
+
+class JSONCache(SQLiteCache):
+    flushsize = 2
+
+    def encode(self, value):
+        return None if value is None else json.dumps(value)
+
+    def decode(self, text):
+        return json.loads(text)
+
+
+class TestSQLiteCache:
+    def test_values(self, tmp_path) -> None:
+        """Test that values are kept between runs, also when flushed early."""
+        cachefile = str(tmp_path / "cache.db")
+        with JSONCache(cachefile) as cache:
+            cache.set("a", [1])
+            cache.set("b", {"b": 2})
+            assert cache.newvalues == {}
+            cache.set("c", None)
+            cache.set(None, 3)
+            assert cache.get("a") == [1]
+            assert cache.get("c") is None
+        with JSONCache(cachefile) as cache:
+            assert [cache.get(key) for key in ("a", "b", "c")] == [[1], {"b": 2}, None]
+            assert cache.getstats() == "2 hits, 1 misses (66.7% hit ratio)"
+
+    def test_maxsize(self, tmp_path) -> None:
+        """Test that the least recently used values are dropped."""
+        cachefile = str(tmp_path / "cache.db")
+        with JSONCache(cachefile, maxsize=2) as cache:
+            for key in ("a", "b", "c"):
+                cache.set(key, key)
+            cache.get("a")
+        with JSONCache(cachefile) as cache:
+            assert [cache.get(key) for key in ("a", "b", "c")] == ["a", None, "c"]
+
+    def test_schemaversion(self, tmp_path) -> None:
+        """Test that values of another version are dropped."""
+        cachefile = str(tmp_path / "cache.db")
+        with JSONCache(cachefile) as cache:
+            cache.set("a", "a")
+
+        class NewJSONCache(JSONCache):
+            schemaversion = 2
+
+        with NewJSONCache(cachefile) as cache:
+            assert cache.get("a") is None
@@ -1,6 +1,14 @@
 from lxml import etree
 
-from translate.misc.xml_helpers import XMLTextParser, parse_xml, reindent
+from translate.misc.xml_helpers import (
+    XML_NS,
+    XMLTextParser,
+    getText,
+    parse_xml,
+    reindent,
+    string_xpath,
+    string_xpath_normalized,
+)
 
 
 class UppercaseXMLTextParser(XMLTextParser):
@@ -20,6 +28,27 @@ def test_xml_text_parser_preserves_markup() -> None:
     )
 
 
+def test_get_text_matches_xpath() -> None:
+    """Nodes without children give the same text as with XPath."""
+    for source in [
+        "<a/>",
+        "<a>  Open \n\t file  \r\n</a>",
+        "<a>\u00a0Open\u2003</a>",
+        "<a><![CDATA[ Open  file ]]></a>",
+        "<a>Open<!-- file --> file</a>",
+        "<a>Open <b>file</b></a>",
+        '<a xml:space="default"> Open  file </a>',
+        '<a xml:space="preserve"> Open  file </a>',
+    ]:
+        node = etree.fromstring(source)
+        for xml_space in ("preserve", "default"):
+            if node.get(f"{{{XML_NS}}}space", xml_space) == "default":
+                expected = string_xpath_normalized(node)
+            else:
+                expected = string_xpath(node)
+            assert getText(node, xml_space) == str(expected)
+
+
 class TestReindent:
     @staticmethod
     def _xmlfromstring(xmlstring):
@@ -0,0 +1,87 @@
+import os
+
+import pytest
+
+from translate.search import grepindex
+from translate.storage import factory
+
+PO1 = """
+#: file.c:1
+msgid "Open &File"
+msgstr "Maak lêer oop"
+
+msgid "Close file"
+msgstr "Maak lêer toe"
+"""
+
+PO2 = """
+msgid "Save"
+msgstr "Stoor"
+"""
+
+
+@pytest.mark.parametrize(
+    ("searchstring", "useregexp", "accelchar", "expected"),
+    [
+        ("Open file", False, None, [["open file"]]),
+        ("a&&bcd", False, None, [["abcd"]]),
+        ("ab#cdef", False, "&", [["cdef"]]),
+        ("ab", False, None, None),
+        ("software|hardware", True, None, [["software"], ["hardware"]]),
+        ("foo(bar)+baz", True, None, [["foo", "bar", "baz"]]),
+        (r"^\w+(\s+\w+){0,3}$", True, None, None),
+        ("(", True, None, None),
+    ],
+)
+def test_querypieces(searchstring, useregexp, accelchar, expected) -> None:
+    assert grepindex.querypieces(searchstring, useregexp, accelchar) == expected
+
+
+class TestGrepIndex:
+    @staticmethod
+    def write_files(tmp_path):
+        po1 = tmp_path / "one.po"
+        po1.write_text(PO1, encoding="utf-8")
+        po2 = tmp_path / "two.po"
+        po2.write_text(PO2, encoding="utf-8")
+        return [str(po1), str(po2)]
+
+    @staticmethod
+    def index_files(index, filenames):
+        for filename in filenames:
+            if not index.isfresh(filename):
+                _store, units = factory.iterobject(filename)
+                for _unit in index.indexunits(filename, units):
+                    pass
+
+    def test_search(self, tmp_path) -> None:
+        """Test that the units that can match are found."""
+        po1, po2 = self.write_files(tmp_path)
+        with grepindex.GrepIndex(str(tmp_path / "grep.db")) as index:
+            self.index_files(index, [po1, po2])
+            assert index.search([["file"]]) == {po1: {0, 1}}
+            assert index.search([["open file"]]) == {po1: {0}}
+            assert index.search([["maak"], ["stoor"]], ["target"]) == {
+                po1: {0, 1},
+                po2: {0},
+            }
+            assert index.search([["maak"]], ["source"]) == {}
+            assert index.search([["file.c"]], ["locations"]) == {po1: {0}}
+
+    def test_update(self, tmp_path) -> None:
+        """Test that only changed files are indexed again."""
+        po1, po2 = self.write_files(tmp_path)
+        dbfile = str(tmp_path / "grep.db")
+        with grepindex.GrepIndex(dbfile) as index:
+            assert not index.isfresh(po1)
+            self.index_files(index, [po1, po2])
+        with grepindex.GrepIndex(dbfile) as index:
+            assert index.isfresh(po1)
+            # Touching a file does not change its content
+            os.utime(po2, ns=(0, 0))
+            assert index.isfresh(po2)
+            with open(po2, "a", encoding="utf-8") as pofile:
+                pofile.write('\nmsgid "Save file"\nmsgstr "Stoor lêer"\n')
+            assert not index.isfresh(po2)
+            self.index_files(index, [po2])
+            assert index.search([["file"]]) == {po1: {0, 1}, po2: {1}}
@@ -1,3 +1,5 @@
+import pytest
+
 from translate.search import lshtein
 
 
@@ -32,3 +34,20 @@ class TestLevenshtein:
         # since the sentence is long it might be chopped and report higher.
         assert levenshtein.similarity(sentence, sentence[0:62], 0) > 25
         assert levenshtein.similarity(sentence, sentence[0:62], 0) < 50
+
+    def test_distances_in_chunks(self, monkeypatch) -> None:
+        """Tests that distances calculated a few queries at a time are the same."""
+        pytest.importorskip("rapidfuzz")
+        queries = ["word", "wood", "words", "sword", "x"]
+        choices = ["word", "ward", "swords", "wood"]
+        expected = [
+            [
+                (index, lshtein.distance(query, choice))
+                for index, choice in enumerate(choices)
+                if lshtein.distance(query, choice) <= 2
+            ]
+            for query in queries
+        ]
+        assert lshtein.native_distances(queries, choices, 2) == expected
+        monkeypatch.setattr(lshtein, "MAX_DISTANCES", 8)
+        assert lshtein.native_distances(queries, choices, 2) == expected
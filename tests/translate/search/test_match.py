@@ -80,6 +80,128 @@ class TestMatch:
         assert len(candidates) == 1
         assert candidates[0] == "Open file"
 
+    def test_equal_similarity(self) -> None:
+        """Test that equally similar candidates can be matched."""
+        csvfile = self.buildcsv(["abcd", "abce", "abcf", "abcg"])
+        matcher = match.matcher(csvfile, max_candidates=2, min_similarity=70)
+        candidates = self.candidatestrings(matcher.matches("abch"))
+        assert candidates == ["abcd", "abce"]
+
+    def test_ngram_index(self) -> None:
+        """Test that the n-gram index does not change the matches."""
+        sources = [
+            "Open file",
+            "Open files",
+            "Open the file",
+            "Opening a file",
+            "Close file",
+            "Save file as...",
+            "Save all files",
+            "The file could not be opened",
+            "The file could not be saved",
+            "The files could not be opened",
+            "File not found",
+            "aaaaaaaaaa",
+            "aaaaaaaaab",
+        ]
+        queries = [
+            "Open file...",
+            "Open fil",
+            "Save files as...",
+            "The file could not be closed",
+            "Files not found",
+            "aaaaaaaaaaa",
+            "x",
+        ]
+        for min_similarity in (50, 75, 90):
+            plain = match.matcher(self.buildcsv(sources), min_similarity=min_similarity)
+            indexed = match.matcher(
+                self.buildcsv(sources),
+                min_similarity=min_similarity,
+                ngram_index=True,
+            )
+            for query in queries:
+                assert [
+                    (unit.source, unit.getnotes()) for unit in plain.matches(query)
+                ] == [(unit.source, unit.getnotes()) for unit in indexed.matches(query)]
+
+    def test_ngram_index_extendtm(self) -> None:
+        """Test that extending the TM updates the n-gram index."""
+        message = "Open file..."
+        matcher = match.matcher(
+            self.buildcsv(["Close application", "Do something"]), ngram_index=True
+        )
+        assert matcher.matches(message) == []
+        csvfile = self.buildcsv(["Open file"])
+        matcher.extendtm(csvfile.units, store=csvfile)
+        candidates = self.candidatestrings(matcher.matches(message))
+        assert candidates == ["Open file"]
+
+    def test_matches_many(self) -> None:
+        """Test that batch matching gives the same matches as single ones."""
+        sources = [
+            "Open file",
+            "Open files",
+            "Open the file",
+            "Close file",
+            "Save file as...",
+            "The file could not be opened",
+            "The file could not be saved",
+            "File not found",
+        ]
+        queries = [
+            "Open file...",
+            "Open fil",
+            "Open file",
+            "Save files as...",
+            "The file could not be closed",
+            "Files not found",
+            "x",
+            "",
+        ]
+        for min_similarity in (50, 75, 90):
+            matcher = match.matcher(
+                self.buildcsv(sources), max_candidates=3, min_similarity=min_similarity
+            )
+            expected = [
+                [(unit.source, unit.getnotes()) for unit in matcher.matches(query)]
+                for query in queries
+            ]
+            assert [
+                [(unit.source, unit.getnotes()) for unit in units]
+                for units in matcher.matches_many(queries)
+            ] == expected
+
+    def test_exact_candidate(self) -> None:
+        """Test that identical sources are found without comparing them."""
+        sources = ["Open file", "Close file", "Open file", "Open files"]
+        targets = ["Maak leer oop", "Maak leer toe", "Open leer", "Maak lere oop"]
+        matcher = match.matcher(
+            self.buildcsv(sources, targets), max_candidates=1, min_similarity=50
+        )
+        assert matcher.exactcandidate("Open file").target == "Maak leer oop"
+        assert matcher.exactcandidate("Open the file") is None
+        queries = ["Open file", "Close file", "Open the file", "Open files", "x"]
+        expected = [
+            [(unit.source, unit.target, unit.getnotes()) for unit in units]
+            for units in matcher.matches_many(queries)
+        ]
+        assert expected[0] == [("Open file", "Maak leer oop", "100.0%")]
+        assert [
+            [(unit.source, unit.target, unit.getnotes()) for unit in matcher.matches(q)]
+            for q in queries
+        ] == expected
+        # Several candidates are compared as before
+        matcher = match.matcher(self.buildcsv(sources, targets), max_candidates=2)
+        assert matcher.exactcandidate("Open file") is None
+        assert len(matcher.matches("Open file")) == 2
+        # Extending the TM updates the exact matches
+        csvfile = self.buildcsv(["Save file"])
+        matcher = match.matcher(self.buildcsv(sources), max_candidates=1)
+        assert matcher.exactcandidate("Save file") is None
+        matcher.extendtm(csvfile.units, store=csvfile)
+        assert matcher.exactcandidate("Save file").source == "Save file"
+
     def test_terminology(self) -> None:
         csvfile = self.buildcsv(["file", "computer", "directory"])
         matcher = match.terminologymatcher(csvfile)
@@ -0,0 +1,106 @@
+import os
+
+from translate.search import match, tmindex
+from translate.storage import po
+
+TM1 = """
+msgid "Open file"
+msgstr "Maak lêer oop"
+
+msgid "Close file"
+msgstr "Maak lêer toe"
+
+#, fuzzy
+msgid "Save file"
+msgstr "Stoor lêer"
+
+msgid "One file"
+msgid_plural "%d files"
+msgstr[0] "Een lêer"
+msgstr[1] "%d lêers"
+
+msgid "x"
+msgstr "y"
+"""
+
+TM2 = """
+# Translator comment
+msgid "Open files"
+msgstr "Maak lêers oop"
+
+msgid "Open file"
+msgstr "Maak lêer oop"
+
+msgid "Close file"
+msgstr "Sluit lêer"
+"""
+
+
+def candidates(matcher):
+    return [
+        (
+            unit.source,
+            unit.target,
+            getattr(unit, "orig_source", None),
+            getattr(unit, "orig_target", None),
+            unit.getnotes(),
+            unit.fuzzy,
+        )
+        for unit in matcher.candidates.units
+    ]
+
+
+def results(matcher, text):
+    return [
+        (unit.source, unit.target, unit.getnotes()) for unit in matcher.matches(text)
+    ]
+
+
+class TestTMIndex:
+    @staticmethod
+    def write_tm(tmp_path):
+        tm1 = tmp_path / "tm1.po"
+        tm1.write_text(TM1, encoding="utf-8")
+        tm2 = tmp_path / "tm2.po"
+        tm2.write_text(TM2, encoding="utf-8")
+        return [str(tm1), str(tm2)]
+
+    def test_candidates(self, tmp_path) -> None:
+        """Test that the index gives the same candidates as parsing the files."""
+        tmfiles = self.write_tm(tmp_path)
+        stores = [po.pofile.parsefile(tmfile) for tmfile in tmfiles]
+        with tmindex.TMIndex(str(tmp_path / "tm.db")) as index:
+            assert index.update(tmfiles) == tmfiles
+            for usefuzzy in (False, True):
+                expected = match.matcher(stores, usefuzzy=usefuzzy)
+                indexed = tmindex.tmindexmatcher(index, usefuzzy=usefuzzy)
+                assert candidates(indexed) == candidates(expected)
+                for text in ("Open file...", "Close files", "Save file", "One file"):
+                    assert results(indexed, text) == results(expected, text)
+
+    def test_update(self, tmp_path) -> None:
+        """Test that only changed files are indexed again."""
+        tmfiles = self.write_tm(tmp_path)
+        dbfile = str(tmp_path / "tm.db")
+        with tmindex.TMIndex(dbfile) as index:
+            assert index.update(tmfiles) == tmfiles
+        with tmindex.TMIndex(dbfile) as index:
+            assert index.update(tmfiles) == []
+            # Touching a file does not change its content
+            os.utime(tmfiles[0], ns=(0, 0))
+            assert index.update(tmfiles) == []
+            with open(tmfiles[1], "ab") as tmfile:
+                tmfile.write(b'\nmsgid "Print file"\nmsgstr "Druk"\n')
+            assert index.update(tmfiles) == [tmfiles[1]]
+            sources = [unit.source for unit in index.candidates()]
+            assert "Print file" in sources
+
+    def test_removed_file(self, tmp_path) -> None:
+        """Test that files no longer used are dropped from the index."""
+        tmfiles = self.write_tm(tmp_path)
+        with tmindex.TMIndex(str(tmp_path / "tm.db")) as index:
+            index.update(tmfiles)
+            assert index.update(tmfiles[:1]) == []
+            sources = [unit.source for unit in index.candidates()]
+            assert "Open files" not in sources
+            assert "Open file" in sources
@@ -1,4 +1,4 @@
-from translate.storage.placeables import general
+from translate.storage.placeables import StringElem, general, parse
 
 
 def test_placeable_numbers() -> None:
@@ -385,4 +385,25 @@ def test_java_message_format_placeable_malformed_choice_is_linear() -> None:
     assert jmfp.parse("{0,choice," + ("x" * 1000)) is None
 
 
+def test_parse_order() -> None:
+    """Tests that parsers only parse what earlier parsers left."""
+    tree = parse("Use %1$s or %2", general.parsers)
+    assert [(type(elem), str(elem)) for elem in tree.flatten()] == [
+        (StringElem, "Use "),
+        (general.FormattingPlaceable, "%1$s"),
+        (StringElem, " or "),
+        (general.QtFormattingPlaceable, "%2"),
+    ]
+    # Translatable placeables are parsed by the later parsers
+    tree = parse(
+        'alt="%s NOW" %s',
+        [general.AltAttrPlaceable.parse, general.PythonFormattingPlaceable.parse],
+    )
+    alt = tree.sub[0]
+    assert isinstance(alt, general.AltAttrPlaceable)
+    assert [str(elem) for elem in alt.sub] == ['alt="', "%s", ' NOW"']
+    assert isinstance(alt.sub[1], general.PythonFormattingPlaceable)
+    assert isinstance(tree.flatten()[-1], general.PythonFormattingPlaceable)
+
+
 # TODO: UrlPlaceable, XMLTagPlaceable
@@ -390,6 +390,44 @@ class TestTranslationStore:
         assert store.findunit("Blessed String") == unit2
         assert store.findunit("Nest String") is None
 
+    def test_index_follows_changes(self) -> None:
+        """Tests that the indexes follow units being added."""
+        store = self.StoreClass()
+        unit1 = store.addsourceunit("Test String")
+        assert store.findunit("Test String") == unit1
+        unit2 = store.addsourceunit("Blessed String")
+        assert store.findunit("Blessed String") == unit2
+        assert store.findid(unit2.getid()) == unit2
+        assert store.findnormalizedunit(" blessed  string") == unit2
+        assert store.findunit("Test String") == unit1
+
+    def test_intern_strings(self) -> None:
+        """Tests that stores with interned strings share their index keys."""
+        stores = []
+        words = ["Test", "String"]
+        for copy in range(2):
+            store = self.StoreClass()
+            if copy:
+                # Units added later are interned
+                store.internstrings()
+            # Build the source, so that the stores don't share it already
+            store.addsourceunit(" ".join(words))
+            store.makeindex()
+            if not copy:
+                # Units and index keys that exist already are interned
+                store.internstrings()
+            stores.append(store)
+        assert not self.StoreClass.intern_strings
+        units = [store.findunit("Test String") for store in stores]
+        assert all(unit is not None for unit in units)
+        ids = [unit.getid() for unit in units]
+        keys = [
+            next(key for key in store.id_index if key == unitid)
+            for store, unitid in zip(stores, ids, strict=True)
+        ]
+        if type(keys[0]) is str:
+            assert keys[0] is keys[1]
+
     def test_translate(self) -> None:
         """Tests the translate method and non-ascii characters."""
         store = self.StoreClass()
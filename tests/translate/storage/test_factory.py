@@ -124,6 +124,37 @@ class BaseTestFactory:
         """Test that a directory is correctly detected."""
         with pytest.raises(ValueError):
             factory.getobject(self.testdir)
+        with pytest.raises(ValueError):
+            factory.iterobject(self.testdir)
+
+    def test_iterobject(self) -> None:
+        """Tests that we get the same units as with getobject."""
+        expected = factory.getobject(givefile(self.filename, self.file_content))  # ty:ignore[unresolved-attribute]
+        filename = os.path.join(self.testdir, f"{self.filename}.gz")  # ty:ignore[unresolved-attribute]
+        with GzipFile(filename, mode="wb") as gzfile:
+            gzfile.write(self.file_content)  # ty:ignore[unresolved-attribute]
+        for storefile in (givefile(self.filename, self.file_content), filename):  # ty:ignore[unresolved-attribute]
+            store, units = factory.iterobject(storefile)
+            assert isinstance(store, self.expected_instance)  # ty:ignore[unresolved-attribute]
+            assert [str(unit) for unit in units] == [
+                str(unit) for unit in expected.units
+            ]
+
+    def test_intern_strings(self) -> None:
+        """Tests that only the stores asked for intern their strings."""
+        store = factory.getobject(
+            givefile(self.filename, self.file_content),  # ty:ignore[unresolved-attribute]
+            intern_strings=True,
+        )
+        assert store.intern_strings
+        assert not type(store).intern_strings
+        store, _units = factory.iterobject(
+            givefile(self.filename, self.file_content),  # ty:ignore[unresolved-attribute]
+            intern_strings=True,
+        )
+        assert store.intern_strings
+        store = factory.getobject(givefile(self.filename, self.file_content))  # ty:ignore[unresolved-attribute]
+        assert not store.intern_strings
 
 
 class TestPOFactory(BaseTestFactory):
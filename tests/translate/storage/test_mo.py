@@ -3,6 +3,9 @@ import subprocess
 import sys
 from io import BytesIO
 
+import pytest
+
+from translate.misc.multistring import multistring
 from translate.storage import factory, mo
 from translate.tools import pocompile
 
@@ -467,6 +470,28 @@ mosources = [
 ]
 
 
+@pytest.mark.parametrize("numpy", [True, False])
+def test_hash_keys(monkeypatch, numpy) -> None:
+    if numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setitem(sys.modules, "numpy", None)
+    keys = [
+        b"",
+        b"simple",
+        b"verb\x04convert",
+        b"%(count)s screenshot\x00%(count)s screenshots",
+        "\u2020wee".encode(),
+        # The hash of these doesn't fit in 32 bits
+        b"\xff\xff\xff\xff\xff\xff\x0f\x10",
+        b"\xff\xff\xff\xff\xff\xff\x0f\x10 and more",
+    ]
+    for hash_size in (3, 7, 1009):
+        cursors, increments = mo.hash_keys(keys, hash_size)
+        assert cursors == [mo.hashpjw(key) % hash_size for key in keys]
+        assert increments == [1 + mo.hashpjw(key) % (hash_size - 2) for key in keys]
+
+
 class TestMOFile(test_base.TestTranslationStore):
     StoreClass = mo.mofile
 
@@ -579,7 +604,84 @@ class TestMOFile(test_base.TestTranslationStore):
             self.StoreClass.parsefile(MO_POCOMPILE)
             self.StoreClass.parsefile(MO_MSGFMT)
 
+    def test_serialize(self) -> None:
+        # The test data was written by pocompile, on a little endian system
+        if sys.byteorder == "little":
+            for source in mosources:
+                assert bytes(mo.mofile.parsestring(source)) == source
+
     def test_endian_version_parsing(self) -> None:
         store_big = self.StoreClass(MO_BIG_ENDIAN)
         store_little = self.StoreClass(MO_LITTLE_ENDIAN)
         assert store_big.units == store_little.units
+
+
+class TestLazyMOFile(TestMOFile):
+    StoreClass = mo.lazymofile
+
+    def test_lookup(self) -> None:
+        for source in mosources:
+            store = mo.mofile.parsestring(source)
+            lazystore = self.StoreClass(source)
+            for unit in store.units[1:]:
+                found = lazystore.findunit(unit.source)
+                expected = store.findunit(unit.source)
+                assert found.source == expected.source
+                assert found.target == expected.target
+                assert found.getcontext() == expected.getcontext()
+                assert lazystore.findid(unit.getid()).target == (
+                    store.findid(unit.getid()).target
+                )
+            assert lazystore.findunit("") is None
+            assert lazystore.findunit("missing") is None
+            assert lazystore._table is not None
+            assert lazystore.units == store.units
+            assert lazystore._table is None
+
+    def test_lookup_context(self) -> None:
+        store = mo.mofile()
+        for context, source, target in [
+            (None, "same", "plain"),
+            ("c", "same", "ctx"),
+            (None, "file", ["lêer", "lêers"]),
+        ]:
+            unit = store.addsourceunit(source)
+            if isinstance(target, list):
+                unit.source = multistring([source, "files"])
+                target = multistring(target)
+            unit.target = target
+            if context is not None:
+                unit.setcontext(context)
+        source = bytes(store)
+        store = mo.mofile.parsestring(source)
+        lazystore = self.StoreClass(source)
+        lookups = ["same", "c\x04same", "file", "files", "missing"]
+        expected = [
+            [
+                store.translate(text),
+                getattr(store.findid(text), "target", None),
+                getattr(store.findunit(text), "getcontext", lambda: None)(),
+            ]
+            for text in lookups
+        ]
+        assert expected[0] == ["ctx", "plain", "c"]
+        assert expected[1] == [None, None, None]
+        assert expected[2][0] == ["lêer", "lêers"]
+        for _accessed in range(2):
+            assert [
+                [
+                    lazystore.translate(text),
+                    getattr(lazystore.findid(text), "target", None),
+                    getattr(lazystore.findunit(text), "getcontext", lambda: None)(),
+                ]
+                for text in lookups
+            ] == expected
+            assert lazystore.units == store.units
+
+    def test_parsefile(self, tmp_path) -> None:
+        filename = tmp_path / "test.mo"
+        filename.write_bytes(mosources[2])
+        store = self.StoreClass.parsefile(str(filename))
+        assert store.translate("convert") == "omskakel"
+        assert store.header() is store.units[0]
+        assert len(store.units) == len(mo.mofile.parsestring(mosources[2]).units)
@@ -93,6 +93,25 @@ class TestHelpers:
 class TestPYPOUnit(test_po.TestPOUnit):
     UnitClass = pypo.pounit
 
+    def test_compact_fields(self) -> None:
+        """Tests that empty fields are only created when they are used."""
+        unit = self.UnitClass("One")
+        unit.target = "Een"
+        # All attributes are in slots
+        assert not vars(unit)
+        str(unit)
+        assert unit.getcontext() == ""
+        assert unit._msgctxt is pypo._EMPTY
+        assert unit._othercomments is pypo._EMPTY
+        unit.othercomments.append("# Note\n")
+        unit.msgctxt.append('"Context"')
+        assert unit.getnotes() == "Note"
+        assert unit.getcontext() == "Context"
+        copied = unit.copy()
+        unit.othercomments.clear()
+        assert copied.getnotes() == "Note"
+        assert str(copied) == '# Note\nmsgctxt "Context"\nmsgid "One"\nmsgstr "Een"\n'
+
     def test_merge_comments_does_not_scan_existing_comments(self) -> None:
         """Comment merging should index existing comments once."""
 
@@ -476,6 +495,87 @@ class TestPYPOFile(test_po.TestPOFile):
         assert last.source == "Plain source 9999"
         assert last.target == "Plain target 9999"
 
+    def test_index_follows_unit_changes(self) -> None:
+        """Tests that the indexes follow changes made through unit setters."""
+        pofile = self.poparse('#: a.c:1\nmsgid "One"\nmsgstr "Een"\n')
+        unit = pofile.findunit("One")
+        assert pofile.findnormalizedunit("ONE") is unit
+        unit.source = "Two"
+        assert pofile.findunit("One") is None
+        assert pofile.findunit("Two") is unit
+        assert pofile.findnormalizedunit("two ") is unit
+        unit.setcontext("ctx")
+        assert pofile.findid("Two") is None
+        assert pofile.findid("ctx\x04Two") is unit
+        unit.addlocation("b.c:2")
+        assert pofile.locationindex["b.c:2"] is unit
+        # Units without source are indexed once they get one
+        blank = pofile.UnitClass()
+        pofile.addunit(blank)
+        blank.source = "Three"
+        assert pofile.findunit("Three") is blank
+        pofile.removeunit(unit)
+        assert pofile.findunit("Two") is None
+        assert pofile.findnormalizedunit("two") is None
+        assert pofile.findid("ctx\x04Two") is None
+        assert pofile.findunit("Three") is blank
+
+    def test_iterparse(self) -> None:
+        """Tests that iterparse gives the same units as parse."""
+        posource = (
+            b'msgid ""\nmsgstr ""\n"Content-Type: text/plain; charset=UTF-8\\n"\n\n'
+            b'#: file.c:1\nmsgid "One"\nmsgstr "Een"\n\n'
+            b'#, fuzzy\nmsgid "File"\nmsgid_plural "Files"\n'
+            b'msgstr[0] "L\xc3\xaaer"\nmsgstr[1] "L\xc3\xaaers"\n\n'
+            b'#~ msgid "Old"\n#~ msgstr "Oud"\n'
+        )
+        for newline in (b"\n", b"\r\n", b"\r", b"\r\r\n"):
+            for bom in (b"", b"\xef\xbb\xbf"):
+                source = bom + posource.replace(b"\n", newline)
+                expected = self.poparse(source)
+                store = self.StoreClass()
+                units = list(store.iterparse(BytesIO(source)))
+                assert [str(unit) for unit in units] == [
+                    str(unit) for unit in expected.units
+                ]
+                assert [unit.isfuzzy() for unit in units] == [
+                    unit.isfuzzy() for unit in expected.units
+                ]
+                assert store.newline == expected.newline == newline.decode()
+                assert store.units == units[:1]
+                assert bytes(units[1]._store) == bytes(store)
+
+    def test_iterlines(self) -> None:
+        """Tests that lines are split like with splitlines, whatever is read."""
+        posource = b'#: a\r\nmsgid "a"\r\nmsgstr "b"\r\n\r\nmsgid "c"\r\nmsgstr ""\r\n'
+        for chunksize in (1, 2, 3, 100):
+            lines, newline = pypo.iterlines(BytesIO(posource), chunksize)
+            assert (list(lines), newline) == pypo.splitlines(posource)
+
+    def test_iterparse_reads_incrementally(self) -> None:
+        """Tests that iterparse does not read the whole file up front."""
+        entries = b"".join(
+            f'msgid "Source {index}"\nmsgstr "Target {index}"\n\n'.encode()
+            for index in range(self.LARGE_PO_ENTRY_COUNT)
+        )
+        posource = BytesIO(self.LARGE_PO_HEADER + entries)
+        units = self.StoreClass().iterparse(posource)
+        assert next(units).isheader()
+        assert next(units).source == "Source 0"
+        assert posource.tell() < len(posource.getvalue()) / 2
+        assert sum(1 for unit in units) == self.LARGE_PO_ENTRY_COUNT - 1
+
+    def test_iterparse_encoding(self) -> None:
+        """Tests that iterparse uses the charset of the header."""
+        posource = (
+            b'msgid ""\nmsgstr ""\n"Content-Type: text/plain; charset=ISO-8859-1\\n"\n\n'
+            b'msgid "File"\nmsgstr "L\xeaer"\n'
+        )
+        assert self.poparse(posource).units[1].target == "Lêer"
+        store = self.StoreClass()
+        assert [unit.target for unit in store.iterparse(posource)][1] == "Lêer"
+        assert store.encoding == "ISO-8859-1"
+
     def test_parse_huge_plural_file(self) -> None:
         entries = (
             (
@@ -204,6 +204,30 @@ class TestTMXfile(test_base.TestTranslationStore):
 
         assert store.translate("test1_ar") == "test1_en"
 
+    def test_language_change_updates_text(self) -> None:
+        store = tmx.tmxfile.parsestring(
+            self.multilingual_tmx(), sourcelanguage="en", targetlanguage="de"
+        )
+        unit = store.units[0]
+        assert (unit.source, unit.target) == ("test1_en", "test1_de")
+
+        store.setsourcelanguage("ar")
+        store.settargetlanguage("en")
+
+        assert (unit.source, unit.target) == ("test1_ar", "test1_en")
+
+    def test_dom_changes_update_text(self) -> None:
+        store = tmx.tmxfile.parsestring(
+            self.multilingual_tmx(), sourcelanguage="en", targetlanguage="de"
+        )
+        unit = store.units[0]
+        assert (unit.source, unit.target) == ("test1_en", "test1_de")
+
+        unit.source_dom[0].text = "changed"
+        unit.get_target_dom()[0].text = "T2"
+
+        assert (unit.source, unit.target) == ("changed", "T2")
+
     def test_addtranslation_non_english_source_is_selectable(self) -> None:
         tmxfile = tmx.tmxfile()
 
@@ -461,3 +485,32 @@ class TestTMXfile(test_base.TestTranslationStore):
         assert prop_index < first_tuv_index, (
             "prop element should appear before tuv elements"
         )
+
+    def test_iterparse(self) -> None:
+        store = self.StoreClass(sourcelanguage="de", targetlanguage="af")
+        store.addtranslation("Hallo", "de", "Hallo", "af", comment="greeting")
+        store.addtranslation("Öffnen", "de", "Oopmaak", "af", context="menu")
+        newstore = self.StoreClass()
+        units = list(newstore.iterparse(bytes(store)))
+        assert [(unit.source, unit.target) for unit in units] == [
+            ("Hallo", "Hallo"),
+            ("Öffnen", "Oopmaak"),
+        ]
+        assert units[0].getnotes() == "greeting"
+        assert units[1].getcontext() == "menu"
+        # Only the header is kept
+        assert newstore.sourcelanguage == "de"
+        assert not newstore.units
+        assert len(newstore.body) == 0
+
+    def test_writer(self) -> None:
+        store = self.StoreClass(sourcelanguage="de", targetlanguage="af")
+        output = BytesIO()
+        with tmx.tmxwriter(output, sourcelanguage="de", targetlanguage="af") as writer:
+            for tmxstore in (store, writer):
+                tmxstore.addtranslation("Hallo", "de", "Hallo", "af", comment="hi")
+                tmxstore.addtranslation("A & B", "de", "A & B", "af", context="x")
+            # Only the last unit is held until the next one is added
+            assert len(writer.units) == 1
+        assert not writer.units
+        assert output.getvalue() == bytes(store)
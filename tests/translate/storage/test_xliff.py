@@ -528,6 +528,51 @@ class TestXLIFFfile(test_base.TestTranslationStore):
         setXMLspace(root_node, "default")
         assert xlifffile.units[0].source == "File 1"
 
+    def test_xml_changes(self) -> None:
+        """Test that changes to the XML are seen after the text was read."""
+        xlfsource = self.skeleton % (
+            """<trans-unit id="1">
+                   <source> File  1 </source>
+                   <target> Lêer  1 </target>
+               </trans-unit>"""
+        )
+        unit = self.StoreClass.parsestring(xlfsource).units[0]
+        assert unit.source == "File 1"
+        assert unit.target == "Lêer 1"
+        setXMLspace(unit.xmlelement, "preserve")
+        assert unit.source == " File  1 "
+        assert unit.target == " Lêer  1 "
+        unit.target = "Lêer 2"
+        assert unit.target == "Lêer 2"
+        unit.set_rich_target([StringElem(["Lêer 3"])])
+        assert unit.target == "Lêer 3"
+        unit.source = "File 2"
+        assert unit.source == "File 2"
+        unit.target = None
+        assert unit.target is None
+        # Editing the nodes directly
+        unit.target = "Lêer 4"
+        unit.source_dom.text = "changed"
+        unit.get_target_dom().text = "T2"
+        assert unit.source == "changed"
+        assert unit.target == "T2"
+
+    def test_language_nodes(self) -> None:
+        """Test that the source and target nodes are those of getlanguageNodes()."""
+        for content in [
+            "<source>File</source><target>Lêer</target>",
+            "<source>File</source>",
+            "<target>Lêer</target>",
+            "",
+            "<target>Lêer</target><source>File</source>",
+            "<source>File</source><source>Files</source><target>Lêer</target>",
+        ]:
+            xlfsource = self.skeleton % f'<trans-unit id="1">{content}</trans-unit>'
+            unit = self.StoreClass.parsestring(xlfsource).units[0]
+            nodes = [*unit.getlanguageNodes(), None, None]
+            assert unit.source_dom is nodes[0]
+            assert unit.get_target_dom() is nodes[1]
+
     def test_parsing(self) -> None:
         xlfsource = (
             self.skeleton
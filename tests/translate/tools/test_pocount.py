@@ -1,11 +1,12 @@
 import subprocess
 import sys
 from io import BytesIO
+from pathlib import Path
 
 from pytest import CaptureFixture, mark, param
 
 from translate.storage import po
-from translate.tools import pocount
+from translate.tools import pocount, statscache
 
 # For now test files left in the old places, but it's better to move
 # them somewhere like tests/data.
@@ -61,6 +62,8 @@ class TestCount:
         self.count("<p>A word</p>\n<p>Another word</p>", 4)
         # Not really an XML tag
         self.count("<no label>", 2)
+        # A dot left between words after removing tags divides them
+        self.count("One<b>.</b>Two three", 3)
 
     def test_newlines(self) -> None:
         """Test to see that newlines divide words."""
@@ -357,3 +360,40 @@ class TestPOCountLineEndings:
         # File has 321 translated messages (verified with msgfmt)
         assert stats["total"] == 321
         assert stats["translated"] == 321
+
+
+class TestStatCollector:
+    def test_jobs(self) -> None:
+        """Test that counting in parallel gives the same results in order."""
+        files = [*test_files, _xliff_states_yes, _xliff_states_no]
+        expected = pocount.StatCollector(files).results
+        assert pocount.StatCollector(files, jobs=2).results == expected
+
+    def test_stats_cache(self, tmp_path) -> None:
+        """Test that unchanged files are not counted again."""
+        pofile = tmp_path / "one.po"
+        pofile.write_bytes(Path(_po_file).read_bytes())
+        files = [str(pofile), _xliff_states_yes]
+        expected = pocount.StatCollector(files).results
+        dbfile = str(tmp_path / "stats.db")
+        with statscache.StatsCache(dbfile) as cache:
+            assert pocount.StatCollector(files, cache=cache).results == expected
+            assert (cache.hits, cache.misses) == (0, 2)
+        with statscache.StatsCache(dbfile) as cache:
+            assert pocount.StatCollector(files, cache=cache).results == expected
+            assert (cache.hits, cache.misses) == (2, 0)
+            assert cache.getstats() == "2 hits, 0 misses (100.0% hit ratio)"
+        # A copy of a file has the same statistics
+        copy = tmp_path / "copy.po"
+        copy.write_bytes(pofile.read_bytes())
+        with statscache.StatsCache(dbfile) as cache:
+            results = pocount.StatCollector([str(copy)], cache=cache).results
+            assert results == [{**expected[0], "filename": str(copy)}]
+            assert cache.hits == 1
+        # Changing a file counts it again
+        with open(pofile, "ab") as handle:
+            handle.write(b'\nmsgid "New"\nmsgstr ""\n')
+        with statscache.StatsCache(dbfile) as cache:
+            results = pocount.StatCollector(files, cache=cache).results
+            assert (cache.hits, cache.misses) == (1, 1)
+            assert results[0]["total"] == expected[0]["total"] + 1
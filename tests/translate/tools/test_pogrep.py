@@ -1,5 +1,8 @@
+import logging
+import re
 from io import BytesIO
 
+from translate.search import grepindex
 from translate.storage import po, xliff
 from translate.tools import pogrep
 
@@ -32,6 +35,28 @@ def test_real_index_uses_binary_search(monkeypatch) -> None:
     assert normalize_calls < 20
 
 
+def test_trie_regex() -> None:
+    """The expression matches the same strings as an alternation of them."""
+    strings = ["foo", "foobar", "fob", "a.b", "b"]
+    pattern = re.compile(pogrep.trie_regex(strings))
+    for text in ["foo", "foobar", "fob", "a.b", "axb", "fo", "ab", "xbx"]:
+        assert (pattern.search(text) is not None) == any(
+            string in text for string in strings
+        )
+    assert pattern.search("foobar").group() == "foobar"
+
+
+def test_long_searchstrings() -> None:
+    """Long search strings and many prefixes of each other can be searched for."""
+    grepfilter = pogrep.GrepFilter(["a" * 1200, "b"], ["source"])
+    assert grepfilter.search("x" + "a" * 1200)
+    assert grepfilter.search("b")
+    assert not grepfilter.search("aaa")
+    grepfilter = pogrep.GrepFilter(["a" * n for n in range(1, 1500)], ["source"])
+    assert grepfilter.search("aaa")
+    assert not grepfilter.search("b")
+
+
 class TestPOGrep:
     @staticmethod
     def poparse(posource):
@@ -136,6 +161,16 @@ class TestPOGrep:
             poresult = self.pogrep(source, search, ["--regexp"]).decode("utf-8")
             assert poresult.index(expected) >= 0
 
+    def test_regex_global_flags(self) -> None:
+        """Check that a regular expression can start with global flags."""
+        posource = '#: test.c\nmsgid "Save"\nmsgstr "Stoor"\n'
+        poresult = self.pogrep(posource, "(?i)SAVE", ["--regexp"]).decode("utf-8")
+        assert poresult.index(posource) >= 0
+        grepfilter = pogrep.GrepFilter("(?i)SAVE", ["msgid"], useregexp=True)
+        matches, indexes = grepfilter.getmatches(self.poparse(posource).units)
+        assert [(match.start, match.end) for match in matches] == [(0, 4)]
+        assert indexes == [0]
+
     def test_keep_translations(self) -> None:
         """Check that we can grep unicode messages and use unicode regex search strings."""
         posource = '#: schemas.in\nmsgid "test"\nmsgstr "rest"\n'
@@ -150,6 +185,37 @@ class TestPOGrep:
         )
         assert headerless_len(po.pofile(poresult).units) == 0
 
+    def test_multiple_searchstrings(self, caplog) -> None:
+        """Grep for several strings at once, and count which were found."""
+        posource = (
+            'msgid "Open &File"\nmsgstr "Maak lêer oop"\n\n'
+            'msgid "Save"\nmsgstr "Stoor"\n\n'
+            'msgid "file manager"\nmsgstr "lêerbestuurder"\n'
+        )
+        grepfilter = pogrep.GrepFilter(
+            ["file", "stoor", "missing"], None, ignorecase=True, accelchar="&"
+        )
+        tofile = grepfilter.filterfile(self.poparse(posource))
+        assert headerless_len(tofile.units) == 3
+        assert grepfilter.matchcounts == {"file": 2, "stoor": 1}
+
+        grepfilter = pogrep.GrepFilter(["^S", "ger$", "^X"], ["msgid"], useregexp=True)
+        tofile = grepfilter.filterfile(self.poparse(posource))
+        assert [unit.source for unit in tofile.units if not unit.isheader()] == [
+            "Save",
+            "file manager",
+        ]
+        assert grepfilter.matchcounts == {"^S": 1, "ger$": 1}
+        with caplog.at_level(logging.INFO, logger=pogrep.logger.name):
+            pogrep.logmatchcounts(BytesIO(), grepfilter)
+        assert [record.getMessage() for record in caplog.records] == [
+            ": 1 units match ^S",
+            ": 1 units match ger$",
+        ]
+        matches, indexes = grepfilter.getmatches(self.poparse(posource).units)
+        assert [(match.start, match.end) for match in matches] == [(0, 1), (9, 12)]
+        assert indexes == [1, 2]
+
     def test_unicode_normalise(self) -> None:
         """Check that we normalise unicode strings before comparing."""
         source_template = '# comment\n#: test.c\nmsgid "test"\nmsgstr "t%sst"\n'
@@ -169,6 +235,37 @@ class TestPOGrep:
                     poresult = self.pogrep(source, search_letter)
                     assert poresult.index(source.encode("utf-8")) >= 0
 
+    def test_index(self, tmp_path) -> None:
+        """Grep through the full-text index gives the same results."""
+        posource = (
+            'msgid ""\nmsgstr ""\n"POT-Creation-Date: 2026-01-01 00:00+0000\\n"\n\n'
+            'msgid "Open &File"\nmsgstr "Maak lêer oop"\n\n'
+            'msgid "Save"\nmsgstr "Stoor"\n\n'
+            'msgid "file manager"\nmsgstr "lêerbestuurder"\n'
+        )
+        pofilename = tmp_path / "test.po"
+        pofilename.write_text(posource, encoding="utf-8")
+        searches = [
+            (["file"], {"ignorecase": True, "accelchar": "&"}),
+            (["file", "stoor"], {"ignorecase": True}),
+            (["^Sa", "ger$"], {"useregexp": True}),
+            (["Save"], {"invertmatch": True}),
+            (["nothing"], {}),
+        ]
+        with grepindex.GrepIndex(str(tmp_path / "grep.db")) as index:
+            # The first search indexes the file
+            for _repeat in range(2):
+                for searchstrings, kwargs in searches:
+                    grepfilter = pogrep.GrepFilter(searchstrings, None, **kwargs)
+                    expected = BytesIO()
+                    with open(pofilename, "rb") as inputfile:
+                        pogrep.rungrep(inputfile, expected, None, grepfilter)
+                    grepfilter.index = index
+                    output = BytesIO()
+                    with open(pofilename, "rb") as inputfile:
+                        pogrep.rungrep(inputfile, output, None, grepfilter)
+                    assert output.getvalue() == expected.getvalue()
+
 
 class TestXLiffGrep:
     xliff_skeleton = """<?xml version="1.0" ?>
@@ -36,6 +36,7 @@ class TestPOMerge:
         mergeblanks="yes",
         mergefuzzy="yes",
         mergecomments="yes",
+        mergenormalized="no",
     ):
         """Merges the sources of the given files and returns a new pofile object."""
         templatefile = BytesIO(templatesource.encode())
@@ -48,6 +49,7 @@ class TestPOMerge:
             mergeblanks=mergeblanks,
             mergefuzzy=mergefuzzy,
             mergecomments=mergecomments,
+            mergenormalized=mergenormalized,
         )
         outputpostring = outputfile.getvalue()
         return po.pofile(outputpostring)
@@ -549,6 +551,18 @@ msgstr "Dimpled Ring"
         print(f"Expected:\n{expectedpo}\n---\nMerged:\n{bytes(pofile)}\n---")
         assert bytes(pofile).decode("utf-8") == expectedpo
 
+    def test_merge_normalized(self) -> None:
+        """Checks that units differing in case and whitespace merge as fuzzy."""
+        templatepo = """#: simple.test\nmsgid "Simple  string"\nmsgstr ""\n"""
+        inputpo = """#: simple.test\nmsgid "Simple String"\nmsgstr "Dimpled Ring"\n"""
+        pofile = self.mergestore(templatepo, inputpo)
+        assert self.singleunit(pofile).target == ""
+        pofile = self.mergestore(templatepo, inputpo, mergenormalized="yes")
+        pounit = self.singleunit(pofile)
+        assert pounit.source == "Simple  string"
+        assert pounit.target == "Dimpled Ring"
+        assert pounit.isfuzzy()
+
     def test_merging_different_locations(self) -> None:
         """
         Test when merging units that are unchanged except for changed
@@ -1,4 +1,5 @@
 import logging
+import sys
 from pathlib import Path
 
 from translate.storage import factory
@@ -25,33 +26,91 @@ class TestPOTerminology:
         filtered_terms = extractor.filter_terms(terms)
         assert filtered_terms[0][0] > filtered_terms[-1][0]
 
-    def test_unitinfo_stores_minimal_data(self) -> None:
-        """Test that UnitInfo stores minimal data instead of full unit objects."""
+    def test_glossary_stores_statistics(self) -> None:
+        """Test that the glossary counts occurrences instead of storing them."""
         extractor = poterminology.TerminologyExtractor()
 
         with open(sample_po_file, "rb") as fh:
             inputfile = factory.getobject(fh)
-
-        # Process units
         extractor.processunits(inputfile.units, str(sample_po_file))
+        extractor.processunits(inputfile.units, "copy.po")
+
+        # "languages" is counted as "language"
+        assert "languages" not in extractor.glossary
+        stats = extractor.glossary["language"]
+        assert isinstance(stats, poterminology.TermStats)
+        assert stats.count == 48
+        assert stats.filecounts == {str(sample_po_file): 24, "copy.po": 24}
+        assert len(stats.sources) == 23
+        assert stats.besttarget == "taal"
+        assert stats.targets == {"taal": {str(sample_po_file): 2, "copy.po": 2}}
+
+    @staticmethod
+    def serialized_terms(extractor):
+        terms = extractor.extract_terms(locmin=1)
+        return {term: (score, str(unit)) for term, (score, unit) in terms.items()}
+
+    def test_combined_glossaries(self) -> None:
+        """Test that collecting terms per file or on disk gives the same terms."""
+        with open(sample_po_file, "rb") as fh:
+            units = factory.getobject(fh).units
+        files = [
+            ("first.po", units[:60]),
+            ("second.po", units[40:]),
+            ("third.po", units[::3]),
+        ]
+
+        extractor = poterminology.TerminologyExtractor()
+        for filename, fileunits in files:
+            extractor.processunits(fileunits, filename)
+        expected = self.serialized_terms(extractor)
+        assert len(expected) > 50
+
+        combined = poterminology.TerminologyExtractor()
+        for filename, fileunits in files:
+            fileextractor = poterminology.TerminologyExtractor()
+            fileextractor.processunits(fileunits, filename)
+            combined.addglossary(fileextractor.glossary, fileextractor.units)
+        assert combined.units == extractor.units
+        assert self.serialized_terms(combined) == expected
+
+        spilled = poterminology.TerminologyExtractor(maxterms=20)
+        for filename, fileunits in files:
+            spilled.processunits(fileunits, filename)
+        assert isinstance(spilled.glossary, poterminology.GlossaryDatabase)
+        assert len(spilled.glossary) == len(extractor.glossary)
+        assert self.serialized_terms(spilled) == expected
 
-        # Check that glossary contains UnitInfo objects, not full unit objects
-        for translations in extractor.glossary.values():
-            for _source, _target, unit_info, _filename in translations:
-                # Verify it's a UnitInfo namedtuple
-                assert isinstance(unit_info, poterminology.UnitInfo)
-                # Verify it has the expected attributes
-                assert hasattr(unit_info, "source")
-                assert hasattr(unit_info, "target")
-                assert hasattr(unit_info, "locations")
-                assert hasattr(unit_info, "sourcenotes")
-                assert hasattr(unit_info, "transnotes")
-                # Verify locations and notes are frozensets (immutable, memory-efficient)
-                assert isinstance(unit_info.locations, frozenset)
-                assert isinstance(unit_info.sourcenotes, frozenset)
-                assert isinstance(unit_info.transnotes, frozenset)
-                break
-            break
+    def test_jobs_plural(self, tmp_path, monkeypatch) -> None:
+        """Test that plurals from other files are counted as in a serial run."""
+        inputdir = tmp_path / "in"
+        inputdir.mkdir()
+        for filename, source, target in [
+            ("a.po", "File", "Lêer"),
+            ("b.po", "Files", "Lêers"),
+            ("c.po", "File", "Lêer"),
+        ]:
+            (inputdir / filename).write_text(
+                f'msgid "{source}"\nmsgstr "{target}"\n', encoding="utf-8"
+            )
+        results = []
+        for options in ([], ["--jobs=2"]):
+            output = tmp_path / f"terms{len(results)}.po"
+            monkeypatch.setattr(
+                sys,
+                "argv",
+                ["poterminology", str(inputdir), "-o", str(output), *options],
+            )
+            poterminology.main()
+            results.append(
+                [
+                    (str(unit.source), str(unit.target), unit.isfuzzy())
+                    for unit in factory.getobject(str(output)).units
+                    if not unit.isheader()
+                ]
+            )
+        assert results[0] == [("file", "lêer", False)]
+        assert results[1] == results[0]
 
     def test_bad_stopword_entry_keeps_previous_entries_and_stops(
         self, tmp_path, caplog
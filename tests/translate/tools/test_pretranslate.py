@@ -2,6 +2,7 @@ from io import BytesIO
 
 from pytest import mark
 
+from translate.search import match
 from translate.storage import po, xliff
 from translate.tools import pretranslate
 
@@ -304,6 +305,80 @@ msgstr "%s-rekenaars"
         assert newpounit.hastypecomment("c-format")
         assert bytes(newpo).decode() == poexpected
 
+    def test_tm_index(self, tmp_path, monkeypatch) -> None:
+        """Tests fuzzy matching from a translation memory index without template."""
+        tmfile = tmp_path / "tm.po"
+        tmfile.write_bytes(b'msgid "Open the file"\nmsgstr "Maak die leer oop"\n')
+        input_source = b'msgid "Open the files"\nmsgstr ""\n'
+        for _run in range(2):
+            monkeypatch.setattr(pretranslate, "tmmatcher", None)
+            output_file = BytesIO()
+            pretranslate.pretranslate_file(
+                BytesIO(input_source),
+                output_file,
+                None,
+                tm=str(tmfile),
+                tm_index=str(tmp_path / "tm.db"),
+            )
+            unit = self.singleunit(po.pofile(output_file.getvalue()))
+            assert unit.target == "Maak die leer oop"
+            assert unit.isfuzzy()
+
+    def test_match_fuzzy_many(self, monkeypatch) -> None:
+        """Tests that every source string is only matched once by a matcher."""
+        tm = po.pofile(
+            b'msgid "Open the file"\nmsgstr "Maak die leer oop"\n\n'
+            b'msgid "Close the file"\nmsgstr "Maak die leer toe"\n'
+        )
+        matcher = match.matcher(tm, max_candidates=1)
+        matched = []
+        matches_many = matcher.matches_many
+
+        def counting_matches_many(texts):
+            matched.extend(texts)
+            return matches_many(texts)
+
+        monkeypatch.setattr(matcher, "matches_many", counting_matches_many)
+        fuzzy_matches = pretranslate.match_fuzzy_many(
+            ["Open the files", "Save", "Open the files"], [matcher]
+        )
+        assert fuzzy_matches["Open the files"].target == "Maak die leer oop"
+        assert "Save" not in fuzzy_matches
+        assert matched == ["Open the files", "Save"]
+        fuzzy_matches = pretranslate.match_fuzzy_many(
+            ["Save", "Close the files", "Open the files"], [matcher]
+        )
+        assert sorted(fuzzy_matches) == ["Close the files", "Open the files"]
+        assert matched == ["Open the files", "Save", "Close the files"]
+        # A different TM of the same size is matched again
+        matcher.inittm(
+            po.pofile(
+                b'msgid "Open the file"\nmsgstr "ANDERS"\n\n'
+                b'msgid "Close the file"\nmsgstr "Maak die leer toe"\n'
+            )
+        )
+        fuzzy_matches = pretranslate.match_fuzzy_many(["Open the files"], [matcher])
+        assert fuzzy_matches["Open the files"].target == "ANDERS"
+
+    def test_matches_many_parallel(self, monkeypatch) -> None:
+        """Tests that matching in several processes gives the same matches."""
+        tm = po.pofile(
+            b'msgid "Open the file"\nmsgstr "Maak die leer oop"\n\n'
+            b'msgid "Close the file"\nmsgstr "Maak die leer toe"\n\n'
+            b'msgid "Save all files"\nmsgstr "Stoor alle lere"\n'
+        )
+        matcher = match.matcher(tm, max_candidates=1)
+        texts = ["Open the files", "Close the file", "Save all", "Save files", "x"]
+        expected = [
+            [(unit.source, unit.target) for unit in units]
+            for units in matcher.matches_many(texts)
+        ]
+        monkeypatch.setattr(pretranslate, "PARALLEL_MIN_SOURCES", 0)
+        assert [
+            [(unit.source, unit.target) for unit in units]
+            for units in pretranslate.matches_many(matcher, texts, jobs=2)
+        ] == expected
+
     def test_xliff_states(self) -> None:
         """Test correct maintenance of XLIFF states."""
         xlf_template = self.xliff_skeleton % (
@@ -336,6 +411,7 @@ class TestPretranslateCommand(test_convert.TestConvertCommand, TestPretranslate)
     convertmodule = pretranslate
     expected_options = [
         "-t TEMPLATE, --template=TEMPLATE",
+        "--tm-index=TM_INDEX",
         "--tm",
         "-s MIN_SIMILARITY, --similarity=MIN_SIMILARITY",
         "--nofuzzymatching",
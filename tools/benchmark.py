@@ -18,13 +18,18 @@
 
 import argparse
 import cProfile
+import gc
 import os
 import pstats
 import random
 import sys
+import time
+import tracemalloc
 from importlib import import_module
 
-from translate.storage import factory, placeables
+from translate.filters import checks
+from translate.search import match
+from translate.storage import base, factory, mo, placeables, po, xliff
 
 
 class TranslateBenchmarker:
@@ -103,15 +108,142 @@ class TranslateBenchmarker:
                 self.parsedfiles.append(parsedfile)
         print(f"counted {count} units")
 
+    def measure_memory(self, file_dir=None) -> None:
+        """Reports the memory used by the parsed files."""
+        self.parsedfiles = []
+        gc.collect()
+        tracemalloc.start()
+        self.parse_files(file_dir)
+        gc.collect()
+        used, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        count = sum(len(parsedfile.units) for parsedfile in self.parsedfiles)
+        print(
+            f"{used / 2**20:.1f} MiB used ({used / max(count, 1):.0f} bytes per unit), "
+            f"{peak / 2**20:.1f} MiB peak"
+        )
+
+    def measure_merge_memory(self, file_dir=None, copies=3) -> None:
+        """
+        Reports the memory used by several indexed copies of the parsed files,
+        like a template, the input and a translation memory in a merge, with
+        and without interning strings.
+        """
+        used = {}
+        for intern_strings in (False, True):
+            stores = []
+            self.parsedfiles = []
+            gc.collect()
+            tracemalloc.start()
+            for _copy in range(copies):
+                self.parse_files(file_dir)
+                for parsedfile in self.parsedfiles:
+                    if intern_strings:
+                        parsedfile.internstrings()
+                    parsedfile.makeindex()
+                stores.extend(self.parsedfiles)
+            gc.collect()
+            used[intern_strings] = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            del stores
+        print(
+            f"{copies} copies: {used[False] / 2**20:.1f} MiB used, "
+            f"{used[True] / 2**20:.1f} MiB with interned strings "
+            f"({1 - used[True] / used[False]:.0%} less)"
+        )
+
     def parse_placeables(self) -> None:
-        """Parses placeables."""
-        count = 0
-        for parsedfile in self.parsedfiles:
-            for unit in parsedfile.units:
-                placeables.parse(unit.source, placeables.general.parsers)
-                placeables.parse(unit.target, placeables.general.parsers)
-            count += len(parsedfile.units)
-        print(f"counted {count} units")
+        """Reports units whose placeables are parsed per second."""
+        units = [unit for parsedfile in self.parsedfiles for unit in parsedfile.units]
+        start = time.perf_counter()
+        for unit in units:
+            placeables.parse(unit.source, placeables.general.parsers)
+            placeables.parse(unit.target, placeables.general.parsers)
+        elapsed = time.perf_counter() - start
+        print(f"parsed {len(units)} units: {len(units) / elapsed:.1f} units/s")
+
+    def match_units(self, lookups=200) -> None:
+        """Reports TM lookups per second against TM size."""
+        units = [unit for parsedfile in self.parsedfiles for unit in parsedfile.units]
+        queries = [
+            unit.source for unit in random.sample(units, min(lookups, len(units)))
+        ]
+        sizes = [size for size in (10**exp for exp in range(3, 8)) if size < len(units)]
+        for size in [*sizes, len(units)]:
+            tm = base.TranslationStore()
+            tm.units = units[:size]
+            for ngram_index in (False, True):
+                matcher = match.matcher(tm, ngram_index=ngram_index)
+                start = time.perf_counter()
+                for query in queries:
+                    matcher.matches(query)
+                elapsed = time.perf_counter() - start
+                print(
+                    f"TM size {size}, n-gram index {ngram_index}: "
+                    f"{len(queries) / elapsed:.1f} lookups/s"
+                )
+
+    def lookup_mo(self, file_dir=None, lookups=1000) -> None:
+        """Reports the open time and lookup latency of the .mo files, eager and lazy."""
+        if file_dir is None:
+            file_dir = self.file_dir
+        filenames = [
+            os.path.join(dirpath, name)
+            for dirpath, _subdirs, names in os.walk(file_dir)
+            for name in names
+            if name.endswith(".mo")
+        ]
+        sources = []
+        for filename in filenames:
+            store = mo.mofile.parsefile(filename)
+            sources.extend((filename, unit.source) for unit in store.units)
+        queries = random.sample(sources, min(lookups, len(sources)))
+        for storeclass in (mo.mofile, mo.lazymofile):
+            start = time.perf_counter()
+            stores = {
+                filename: storeclass.parsefile(filename) for filename in filenames
+            }
+            opened = time.perf_counter() - start
+            start = time.perf_counter()
+            for filename, source in queries:
+                stores[filename].translate(source)
+            elapsed = time.perf_counter() - start
+            print(
+                f"{storeclass.__name__}: opened {len(filenames)} files in "
+                f"{opened * 1000:.1f} ms, {elapsed / len(queries) * 10**6:.1f} µs "
+                "per lookup"
+            )
+
+    def check_units(self, units=None) -> None:
+        """Reports units checked by pofilter per second."""
+        checker = checks.TeeChecker(
+            checkerclasses=[checks.StandardChecker, checks.StandardUnitChecker]
+        )
+        if units is None:
+            units = [
+                unit for parsedfile in self.parsedfiles for unit in parsedfile.units
+            ]
+        start = time.perf_counter()
+        for unit in units:
+            checker.run_filters(unit, categorised=True)
+        elapsed = time.perf_counter() - start
+        print(f"checked {len(units)} units: {len(units) / elapsed:.1f} units/s")
+
+    def compare_filters(self) -> None:
+        """Reports units checked by pofilter per second in equivalent PO and XLIFF."""
+        units = [
+            unit
+            for parsedfile in self.parsedfiles
+            for unit in parsedfile.units
+            if not unit.isheader()
+        ]
+        for storeclass in (po.pofile, xliff.xlifffile):
+            store = storeclass()
+            for unit in units:
+                store.addsourceunit(unit.source).target = unit.target
+            store = storeclass.parsestring(bytes(store))
+            print(f"{storeclass.__name__}: ", end="")
+            self.check_units([unit for unit in store.units if not unit.isheader()])
 
 
 if __name__ == "__main__":
@@ -126,8 +258,6 @@ if __name__ == "__main__":
     parser.add_argument(
         "--store-type",
         dest="storetype",
-        action="store_const",
-        const="po",
         default="po",
         help="type of the store to benchmark (default: %(default)s)",
     )
@@ -137,12 +267,48 @@ if __name__ == "__main__":
         action="store_true",
         help="benchmark parsing files",
     )
+    parser.add_argument(
+        "--check-matching",
+        dest="check_matching",
+        action="store_true",
+        help="benchmark translation memory lookups",
+    )
+    parser.add_argument(
+        "--check-memory",
+        dest="check_memory",
+        action="store_true",
+        help="benchmark memory used by parsed files",
+    )
+    parser.add_argument(
+        "--check-merge-memory",
+        dest="check_merge_memory",
+        action="store_true",
+        help="benchmark memory used by several copies of parsed files",
+    )
     parser.add_argument(
         "--check-placeables",
         dest="check_placeables",
         action="store_true",
         help="benchmark placeables",
     )
+    parser.add_argument(
+        "--check-filters",
+        dest="check_filters",
+        action="store_true",
+        help="benchmark pofilter checks",
+    )
+    parser.add_argument(
+        "--compare-filters",
+        dest="compare_filters",
+        action="store_true",
+        help="benchmark pofilter checks on the same units in PO and XLIFF",
+    )
+    parser.add_argument(
+        "--check-mo",
+        dest="check_mo",
+        action="store_true",
+        help="benchmark lookups in .mo files (with --store-type mo)",
+    )
     args = parser.parse_args()
 
     storetype = args.storetype
@@ -187,9 +353,40 @@ if __name__ == "__main__":
         if args.check_parsing:
             methods.append(("parse_files", repr(args.podir)))
 
+        if args.check_memory:
+            methods.append(("measure_memory", repr(args.podir)))
+
+        if args.check_merge_memory:
+            methods.append(("measure_merge_memory", repr(args.podir)))
+
         if args.check_placeables:
+            if not args.check_parsing:
+                methods.append(("parse_files", repr(args.podir)))
             methods.append(("parse_placeables", ""))
 
+        if args.check_matching:
+            if not (args.check_parsing or args.check_placeables):
+                methods.append(("parse_files", repr(args.podir)))
+            methods.append(("match_units", ""))
+
+        if args.check_filters:
+            if not (args.check_parsing or args.check_placeables or args.check_matching):
+                methods.append(("parse_files", repr(args.podir)))
+            methods.append(("check_units", ""))
+
+        if args.compare_filters:
+            if not (
+                args.check_parsing
+                or args.check_placeables
+                or args.check_matching
+                or args.check_filters
+            ):
+                methods.append(("parse_files", repr(args.podir)))
+            methods.append(("compare_filters", ""))
+
+        if args.check_mo:
+            methods.append(("lookup_mo", repr(args.podir)))
+
         for methodname, methodparam in methods:
             print("_______________________________________________________")
             statsfile = f"{methodname}_{storetype}{'_{}_{}_{}_{}_{}.stats'.format(*sample_file_sizes)}"
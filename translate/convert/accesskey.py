@@ -18,8 +18,6 @@
 
 """functions used to manipulate access keys in strings."""
 
-from translate.storage.placeables.general import XMLEntityPlaceable
-
 DEFAULT_ACCESSKEY_MARKER = "&"
 
 
@@ -129,6 +127,9 @@ def extract(
     assert len(accesskey_marker) == 1
     if not string:
         return "", ""
+    # The placeables are only loaded when needed
+    from translate.storage.placeables.general import XMLEntityPlaceable  # ruff:ignore[import-outside-top-level]
+
     accesskey = ""
     label = string
     marker_pos = 0
@@ -21,11 +21,13 @@ Handles converting of files between formats (used by
 :mod:`translate.convert` tools).
 """
 
+import hashlib
+import json
 import os.path
 from io import BytesIO
 
+from translate import __version__
 from translate.misc import optrecurse
-from translate.tools import pocount
 
 # Don't import optparse ourselves, get the version from optrecurse.
 optparse = optrecurse.optparse
@@ -50,7 +52,12 @@ class ConvertOptionParser(optrecurse.RecursiveOptionParser):
             description=description,
         )
         self.usepots = usepots
+        self.manifest = None
+        #: Passthrough options naming files that the output depends on too,
+        #: like a translation memory
+        self.dependencies = []
         self.settimestampoption()
+        self.setmanifestoption()
         self.setpotoption()
 
     def add_fuzzy_option(self, default=False) -> None:
@@ -255,6 +262,19 @@ class ConvertOptionParser(optrecurse.RecursiveOptionParser):
         )
         self.define_option(timestampopt)
 
+    def setmanifestoption(self) -> None:
+        """Sets ``--manifest`` option."""
+        manifestopt = optparse.Option(
+            None,
+            "--manifest",
+            dest="manifest",
+            default=None,
+            metavar="MANIFEST",
+            help="skip conversion if the input, template and options did not "
+            "change since the output was recorded in MANIFEST",
+        )
+        self.define_option(manifestopt)
+
     def verifyoptions(self, options) -> None:
         """
         Verifies that the options are valid (required options are present,
@@ -273,6 +293,87 @@ class ConvertOptionParser(optrecurse.RecursiveOptionParser):
             self.error(str(e))
         self.recursiveprocess(options)
 
+    def recursiveprocess(self, options) -> None:
+        """Recurse through directories and convert files."""
+        manifestfile = getattr(options, "manifest", None)
+        if not manifestfile:
+            super().recursiveprocess(options)
+            return
+        self.manifest = ConversionManifest(manifestfile)
+        try:
+            super().recursiveprocess(options)
+        finally:
+            self.manifest.save()
+            self.manifest = None
+
+    def getinputdigest(self, options, fileprocessor, fullinputpath, fulltemplatepath):
+        """
+        Returns a hash of everything the output of a conversion depends on:
+        the tool, its options and the content of the input, template and
+        other files named by the :attr:`dependencies` options.
+        """
+        digest = hashlib.sha256()
+        passthroughoptions = self.getpassthroughoptions(options)
+        # The number of processes doesn't change the output
+        passthroughoptions.pop("jobs", None)
+        tool = [
+            __version__.sver,
+            self.get_prog_name(),
+            getattr(fileprocessor, "__module__", None),
+            getattr(fileprocessor, "__qualname__", None),
+            passthroughoptions,
+        ]
+        digest.update(json.dumps(tool, sort_keys=True, default=repr).encode())
+        for optionname in self.dependencies:
+            filenames = getattr(options, optionname, None) or []
+            if isinstance(filenames, str):
+                filenames = [filenames]
+            for filename in filenames:
+                digest.update(f"\0{optionname}\0".encode())
+                if os.path.isfile(filename):
+                    digest.update(_filedigest(filename).encode())
+        with self.openinputfile(options, fullinputpath) as inputfile:
+            _updatedigest(digest, inputfile)
+        if fulltemplatepath is not None and os.path.isfile(fulltemplatepath):
+            digest.update(b"\0template\0")
+            with open(fulltemplatepath, "rb") as templatefile:
+                _updatedigest(digest, templatefile)
+        return digest.hexdigest()
+
+    def isuptodate(
+        self, options, fileprocessor, fullinputpath, fulltemplatepath, fulloutputpath
+    ) -> bool:
+        """Checks the output against the manifest (``--manifest``)."""
+        if self.manifest is None or fullinputpath is None or fulloutputpath is None:
+            return False
+        try:
+            inputdigest = self.getinputdigest(
+                options, fileprocessor, fullinputpath, fulltemplatepath
+            )
+        except Exception:
+            # Processing the file reports the problem
+            return False
+        return self.manifest.isuptodate(fulloutputpath, inputdigest)
+
+    def markprocessed(
+        self,
+        options,
+        fileprocessor,
+        fullinputpath,
+        fulltemplatepath,
+        fulloutputpath,
+        success,
+    ) -> None:
+        """Records the converted output in the manifest (``--manifest``)."""
+        if self.manifest is not None and fulloutputpath is not None:
+            self.manifest.update(fulloutputpath, success)
+
+    def canprocessinparallel(self, options) -> bool:
+        # The translation memory index can only be updated from a single process
+        return not getattr(options, "tm_index", None) and super().canprocessinparallel(
+            options
+        )
+
     def processfile(
         self, fileprocessor, options, fullinputpath, fulloutputpath, fulltemplatepath
     ):
@@ -586,6 +687,28 @@ class ArchiveConvertOptionParser(ConvertOptionParser):
             self.outputarchive = self.openarchive(options.output, "output", mode="w")
         return super().recursiveprocess(options)
 
+    def isuptodate(
+        self, options, fileprocessor, fullinputpath, fulltemplatepath, fulloutputpath
+    ) -> bool:
+        """Files with a template or output in an archive are always converted."""
+        if self.isarchive(options.output, "output") or (
+            self.usetemplates and self.isarchive(options.template, "template")
+        ):
+            return False
+        return super().isuptodate(
+            options, fileprocessor, fullinputpath, fulltemplatepath, fulloutputpath
+        )
+
+    def canprocessinparallel(self, options) -> bool:
+        """Archives are shared by all files, so they are processed one by one."""
+        if (
+            getattr(options, "inputarchive", None) is not None
+            or getattr(self, "templatearchive", None) is not None
+            or getattr(self, "outputarchive", None) is not None
+        ):
+            return False
+        return super().canprocessinparallel(options)
+
     def processfile(
         self, fileprocessor, options, fullinputpath, fulloutputpath, fulltemplatepath
     ):
@@ -612,6 +735,84 @@ class ArchiveConvertOptionParser(ConvertOptionParser):
         )
 
 
+def _updatedigest(digest, inputfile) -> None:
+    """Adds the content of a file to a hash."""
+    while chunk := inputfile.read(1 << 16):
+        digest.update(chunk)
+
+
+def _filedigest(filename):
+    with open(filename, "rb") as inputfile:
+        return hashlib.file_digest(inputfile, "sha256").hexdigest()
+
+
+class ConversionManifest:
+    """
+    Records for every output file a hash of what it was converted from.
+
+    The manifest is used by the ``--manifest`` option to skip conversions
+    whose input, template and options did not change. The hash of the output
+    is recorded as well, so outputs changed or removed after the conversion
+    are converted again. Unlike ``--timestamp`` this doesn't depend on file
+    modification times, which are not kept by version control checkouts.
+    """
+
+    VERSION = 1
+
+    def __init__(self, filename) -> None:
+        self.filename = filename
+        self.basedir = os.path.dirname(os.path.abspath(filename))
+        self.entries = {}
+        # Input hashes of the outputs being converted
+        self.pending = {}
+        if os.path.exists(filename):
+            with open(filename, encoding="utf-8") as manifestfile:
+                data = json.load(manifestfile)
+            if data.get("version") == self.VERSION:
+                self.entries = data["outputs"]
+
+    def getkey(self, outputpath):
+        """Output paths are recorded relative to the manifest."""
+        return os.path.relpath(os.path.abspath(outputpath), self.basedir)
+
+    def isuptodate(self, outputpath, inputdigest) -> bool:
+        """
+        Checks whether the output was converted from the same input and is
+        unchanged.
+        """
+        self.pending[outputpath] = inputdigest
+        entry = self.entries.get(self.getkey(outputpath))
+        if entry is None or entry["input"] != inputdigest:
+            return False
+        return os.path.isfile(outputpath) and entry["output"] == _filedigest(outputpath)
+
+    def update(self, outputpath, success) -> None:
+        """Records the result of converting to the output."""
+        inputdigest = self.pending.pop(outputpath, None)
+        if inputdigest is None:
+            return
+        key = self.getkey(outputpath)
+        if success and os.path.isfile(outputpath):
+            self.entries[key] = {
+                "input": inputdigest,
+                "output": _filedigest(outputpath),
+            }
+        else:
+            self.entries.pop(key, None)
+
+    def save(self) -> None:
+        """Writes the manifest, replacing the previous one at once."""
+        tempname = f"{self.filename}.tmp"
+        with open(tempname, "w", encoding="utf-8") as manifestfile:
+            json.dump(
+                {"version": self.VERSION, "outputs": self.entries},
+                manifestfile,
+                indent=1,
+                sort_keys=True,
+            )
+        os.replace(tempname, self.filename)
+
+
 def _output_is_newer(input_path, output_path):
     """
     Check if input_path was not modified since output_path was generated,
@@ -637,6 +838,8 @@ def should_output_store(store, threshold):
     if not threshold:
         return True
 
+    from translate.tools import pocount  # ruff:ignore[import-outside-top-level]
+
     units = [unit for unit in store.units if unit.istranslatable()]
     translated = [unit for unit in units if unit.istranslated()]
     wordcounts = {unit.getid(): pocount.wordsinunit(unit) for unit in units}
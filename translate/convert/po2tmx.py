@@ -93,7 +93,7 @@ def convertpo(
 
 
 class tmxmultifile:
-    def __init__(self, filename, mode=None) -> None:
+    def __init__(self, filename, mode=None, tmxfile=None) -> None:
         """Initialises tmxmultifile from a seekable inputfile or writable outputfile."""
         self.filename = filename
         if mode is None:
@@ -102,7 +102,7 @@ class tmxmultifile:
         #        self.multifilestyle = multifilestyle
         self.multifilename = os.path.splitext(filename)[0]
         #        self.multifile = open(filename, mode)
-        self.tmxfile = tmx.tmxfile()
+        self.tmxfile = tmx.tmxfile() if tmxfile is None else tmxfile
 
     def openoutputfile(self, subfile):
         """Returns a pseudo-file object for the given subfile."""
@@ -120,10 +120,19 @@ class TmxOptionParser(convert.ArchiveConvertOptionParser):
     def recursiveprocess(self, options) -> None:
         if not options.targetlanguage:
             raise ValueError("You must specify the target language")
-        super().recursiveprocess(options)
-        with open(options.output, "wb") as self.output:
-            self.outputarchive.tmxfile.setsourcelanguage(options.sourcelanguage)
-            self.outputarchive.tmxfile.serialize(self.output)
+        # The units are written out as they are converted
+        with (
+            open(options.output, "wb") as self.output,
+            tmx.tmxwriter(
+                self.output, sourcelanguage=options.sourcelanguage
+            ) as self.tmxwriter,
+        ):
+            super().recursiveprocess(options)
+
+    def openarchive(self, archivefilename, filepurpose, **kwargs):
+        if filepurpose == "output":
+            kwargs["tmxfile"] = self.tmxwriter
+        return super().openarchive(archivefilename, filepurpose, **kwargs)
 
 
 def main(argv=None) -> None:
@@ -41,21 +41,27 @@ def convertpot(
     maxlength=None,
     classes=None,
     classes_str=None,
+    tm_index=None,
     **kwargs,
 ) -> int:
     """Main conversion function."""
+    # The template, input and translation memory share most source strings
     input_store = factory.getobject(
-        input_file, classes=classes, classes_str=classes_str
+        input_file, classes=classes, classes_str=classes_str, intern_strings=True
     )
     try:
-        temp_store = factory.getobject(input_file, classes_str=classes_str)
+        temp_store = factory.getobject(
+            input_file, classes_str=classes_str, intern_strings=True
+        )
     except Exception:
         # StringIO and other file like objects will be closed after parsing
         temp_store = None
 
     template_store = None
     if template_file is not None:
-        template_store = factory.getobject(template_file, classes_str=classes_str)
+        template_store = factory.getobject(
+            template_file, classes_str=classes_str, intern_strings=True
+        )
 
     output_store = convert_stores(
         input_store,
@@ -64,6 +70,7 @@ def convertpot(
         tm,
         min_similarity,
         fuzzymatching,
+        tm_index=tm_index,
         **kwargs,
     )
     convert.set_po_max_line_length(output_store, maxlength)
@@ -79,6 +86,8 @@ def convert_stores(
     tm=None,
     min_similarity=75,
     fuzzymatching=True,
+    tm_index=None,
+    jobs=1,
     **kwargs,
 ):
     """
@@ -86,6 +95,9 @@ def convert_stores(
     a properly initialized pretranslated output store, with structure
     based on input_store, metadata based on template_store, migrates
     old translations from template_store and pretranslating from TM.
+
+    Fuzzy matching happens in *jobs* processes, see
+    :func:`~translate.tools.pretranslate.matches_many`.
     """
     if temp_store is None:
         temp_store = input_store
@@ -107,7 +119,11 @@ def convert_stores(
             matchers.append(matcher)
         if tm:
             matcher = pretranslate.memory(
-                tm, max_candidates=1, min_similarity=min_similarity, max_length=1000
+                tm,
+                max_candidates=1,
+                min_similarity=min_similarity,
+                max_length=1000,
+                tm_index=tm_index,
             )
             matcher.addpercentage = False
             matchers.append(matcher)
@@ -115,6 +131,17 @@ def convert_stores(
     # initialize store
     _store_pre_merge(input_store, temp_store, template_store)
 
+    # Fuzzy match all units at once
+    fuzzy_matches = None
+    if matchers:
+        fuzzy_matches = pretranslate.match_fuzzy_many(
+            pretranslate.fuzzy_sources(
+                temp_store.units, template_store, input_store.merge_on
+            ),
+            matchers,
+            jobs,
+        )
+
     # Do matching
     for input_unit in temp_store.units:
         if input_unit.istranslatable():
@@ -124,6 +151,7 @@ def convert_stores(
                 matchers,
                 mark_reused=True,
                 merge_on=input_store.merge_on,
+                fuzzy_matches=fuzzy_matches,
             )
             _unit_post_merge(input_unit, input_store, temp_store, template_store)
 
@@ -351,6 +379,16 @@ def main(argv=None) -> None:
         help="The file to use as translation memory when fuzzy matching",
     )
     parser.passthrough.append("tm")
+    parser.dependencies.append("tm")
+
+    parser.add_option(
+        "",
+        "--tm-index",
+        dest="tm_index",
+        default=None,
+        help="Keep the translation memory in a persistent index in this file",
+    )
+    parser.passthrough.append("tm_index")
 
     defaultsimilarity = 75
     parser.add_option(
@@ -371,6 +409,8 @@ def main(argv=None) -> None:
         help="Disable fuzzy matching",
     )
     parser.passthrough.append("fuzzymatching")
+    # Files processed one by one are fuzzy matched in parallel instead
+    parser.passthrough.append("jobs")
 
     parser.add_po_max_line_length_option()
 
@@ -0,0 +1,167 @@
+#
+# Copyright 2026 Translate Toolkit contributors
+#
+# This file is part of the Translate Toolkit.
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+"""
+Persistent cache of check results.
+
+The cache keeps the failures found by a checker for every unit in an SQLite
+database, so that units which did not change since an earlier run don't have
+to be checked again. Results are keyed by the checkers, their configuration
+and enabled filters, and the parts of the unit the checks look at. The least
+recently used results are dropped when the cache grows beyond its size.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+
+from translate import __version__
+from translate.filters.checks import FilterFailure, SeriousFilterFailure
+from translate.misc.multistring import multistring
+from translate.misc.sqlitecache import SQLiteCache
+
+# The failures that can be stored, by name
+FAILURES = {
+    "FilterFailure": FilterFailure,
+    "SeriousFilterFailure": SeriousFilterFailure,
+}
+
+
+def _strings(text):
+    """Returns all the strings of a possibly plural string."""
+    if isinstance(text, multistring):
+        return [str(string) for string in text.strings]
+    return [text]
+
+
+def _encodefailures(failures):
+    """
+    Converts the categorised failures of a checker to JSON.
+
+    :return: The JSON text, or None if the failures can't be stored.
+    """
+    encoded = {}
+    for name, failure in failures.items():
+        message = failure["message"]
+        if isinstance(message, FilterFailure):
+            kind = type(message).__name__
+            if FAILURES.get(kind) is not type(message):
+                return None
+            message = message.messages
+        elif isinstance(message, str):
+            kind = None
+        else:
+            return None
+        encoded[name] = [failure["category"], kind, message]
+    return json.dumps(encoded)
+
+
+def _decodefailures(text):
+    return {
+        name: {
+            "message": message if kind is None else FAILURES[kind](message),
+            "category": category,
+        }
+        for name, (category, kind, message) in json.loads(text).items()
+    }
+
+
+class CheckCache(SQLiteCache):
+    """
+    Check results of a checker stored in an SQLite database.
+
+    The results of checks depending on a suggestion store set on the checkers
+    are not stored, as the cache can't tell when its content changes.
+    """
+
+    def __init__(self, filename, checker, maxsize=None) -> None:
+        """
+        Opens the cache in *filename* for the results of *checker*.
+
+        :param checker: The checker the results are for, a
+            :class:`~translate.filters.checks.TeeChecker` is allowed too.
+        :param maxsize: The number of results to keep at most.
+        """
+        self.checker = checker
+        self.checkerdigest = self.getcheckerdigest(checker)
+        super().__init__(filename, maxsize)
+
+    @staticmethod
+    def getcheckerdigest(checker) -> str:
+        """
+        Returns a digest of everything besides the unit the results of
+        *checker* depend on.
+        """
+        checkers = getattr(checker, "checkers", [checker])
+        description = [
+            __version__,
+            [
+                [
+                    f"{type(subchecker).__module__}.{type(subchecker).__qualname__}",
+                    sorted(subchecker.defaultfilters),
+                    {
+                        name: value
+                        for name, value in vars(subchecker.config).items()
+                        if name not in {"lang", "sourcelang"}
+                    },
+                ]
+                for subchecker in checkers
+            ],
+        ]
+        return hashlib.sha256(
+            json.dumps(description, sort_keys=True, default=repr).encode()
+        ).hexdigest()
+
+    def getkey(self, unit) -> str | None:
+        """
+        Returns the key of the results for *unit*.
+
+        :return: The key, or None if the results for the unit can't be cached.
+        """
+        checkers = getattr(self.checker, "checkers", [self.checker])
+        if any(getattr(checker, "suggestion_store", None) for checker in checkers):
+            return None
+        getalttrans = getattr(unit, "getalttrans", None)
+        description = [
+            _strings(unit.source),
+            _strings(unit.target),
+            unit.hasplural(),
+            unit.getlocations(),
+            unit.isfuzzy(),
+            unit.isreview(),
+            len(getalttrans()) if getalttrans else 0,
+        ]
+        digest = hashlib.sha256(self.checkerdigest.encode())
+        digest.update(json.dumps(description).encode())
+        return digest.hexdigest()
+
+    def encode(self, value) -> str | None:
+        return _encodefailures(value)
+
+    def decode(self, text):
+        return _decodefailures(text)
+
+    def run_filters(self, unit):
+        """Returns the categorised failures of *unit*, checking it if needed."""
+        key = self.getkey(unit)
+        failures = self.get(key)
+        if failures is None:
+            failures = self.checker.run_filters(unit, categorised=True)
+            self.set(key, failures)
+        return failures
@@ -21,6 +21,8 @@
 
 from __future__ import annotations
 
+from typing import Any, NamedTuple
+
 from translate.filters import helpers, prefilters
 from translate.filters.checks.config import CheckerConfig
 from translate.filters.checks.exceptions import FilterFailure
@@ -29,19 +31,46 @@ from translate.lang import data
 
 
 def cache_results(f):
+    name = f.__name__
+
     def cached_f(self, param1):
-        key = (f.__name__, param1)
+        key = (name, param1)
         res_cache = self.results_cache
 
-        if key in res_cache:
+        try:
             return res_cache[key]
-        value = f(self, param1)
-        res_cache[key] = value
-        return value
+        except KeyError:
+            value = res_cache[key] = f(self, param1)
+            return value
 
     return cached_f
 
 
+class FilterStep(NamedTuple):
+    """A filter to run on every unit, see :class:`FilterPlan`."""
+
+    name: str
+    function: Any
+    #: Whether failures of the filter are reported (preconditions are run
+    #: even if they are not enabled)
+    reported: bool
+    #: The filters to skip if this precondition fails
+    precondition_for: frozenset[str]
+
+
+class FilterPlan(NamedTuple):
+    """
+    The filters a checker runs on every unit, in order.
+
+    This is compiled once from the enabled filters, the preconditions and the
+    tests ignored for the target language by :meth:`UnitChecker.getfilterplan`.
+    """
+
+    filters: dict
+    lang: Any
+    steps: tuple[FilterStep, ...]
+
+
 class UnitChecker:
     """
     Parent Checker class which does the checking based on functions
@@ -115,6 +144,7 @@ class UnitChecker:
     def setconfig(self, config) -> None:
         """Sets the accelerator list."""
         self.config = config
+        self.filterplans = {}
         self.accfilters = [
             prefilters.filteraccelerators(accelmarker)
             for accelmarker in self.config.accelmarkers
@@ -170,6 +200,16 @@ class UnitChecker:
         """Filter out XML from the string so only text remains."""
         return tag_re.sub("", str1)
 
+    @cache_results
+    def punctranslate(self, str1):
+        """Converts the punctuation in ``str1`` for the target language."""
+        return self.config.lang.punctranslate(str1)
+
+    @cache_results
+    def gettags(self, str1):
+        """Returns the XML tags in ``str1``."""
+        return tag_re.findall(str1)
+
     @staticmethod
     def run_test(test, unit):
         """
@@ -193,24 +233,27 @@ class UnitChecker:
             )
         )
 
-    def run_filters(self, unit, categorised: bool = False) -> dict[str, dict]:
+    def getfilterplan(self) -> FilterPlan:
         """
-        Run all the tests in this suite.
+        Returns the plan of filters to run on every unit.
 
-        :return: Content of the dictionary is as follows::
-
-           {'testname': { 'message': message_or_exception, 'category': failure_category } }
+        The plan is only compiled again when the enabled filters or the
+        target language change.
         """
-        self.results_cache = {}
-        failures = {}
-        ignores = self.get_ignored_filters()
-        functionnames = self.defaultfilters.keys()
-        priorityfunctionnames = self.preconditions.keys()
-        otherfunctionnames = filter(
-            lambda functionname: functionname not in self.preconditions, functionnames
+        filters = self.defaultfilters
+        plan = self.filterplans.get(id(filters))
+        if plan is not None and plan.lang is self.config.lang:
+            return plan
+
+        ignores = set(self.get_ignored_filters())
+        functionnames = list(self.preconditions)
+        functionnames.extend(
+            functionname
+            for functionname in filters
+            if functionname not in self.preconditions
         )
-
-        for functionname in list(priorityfunctionnames) + list(otherfunctionnames):
+        steps = []
+        for functionname in functionnames:
             if functionname in ignores:
                 continue
 
@@ -221,6 +264,43 @@ class UnitChecker:
             if filterfunction is None:
                 continue
 
+            steps.append(
+                FilterStep(
+                    functionname,
+                    filterfunction,
+                    functionname in filters,
+                    frozenset(self.preconditions.get(functionname, ())),
+                )
+            )
+
+        # The plans keep the filters alive, so their id can't be reused
+        if len(self.filterplans) >= 8:
+            self.filterplans.clear()
+        plan = FilterPlan(filters, self.config.lang, tuple(steps))
+        self.filterplans[id(filters)] = plan
+        return plan
+
+    def run_filters(self, unit, categorised: bool = False) -> dict[str, dict]:
+        """
+        Run all the tests in this suite.
+
+        :return: Content of the dictionary is as follows::
+
+           {'testname': { 'message': message_or_exception, 'category': failure_category } }
+        """
+        self.results_cache = {}
+        failures = {}
+        skipped = frozenset()
+
+        for (
+            functionname,
+            filterfunction,
+            reported,
+            precondition_for,
+        ) in self.getfilterplan().steps:
+            if functionname in skipped:
+                continue
+
             filtermessage = ""
 
             try:
@@ -246,15 +326,14 @@ class UnitChecker:
                     filtermessage = pydoc.getdoc(filterfunction)
                 # We test some preconditions that aren't actually a cause for
                 # failure
-                if functionname in self.defaultfilters:
+                if reported:
                     failures[functionname] = {
                         "message": filtermessage,
                         "category": self.categories[functionname],
                     }
 
-                if functionname in self.preconditions:
-                    for ignoredfunctionname in self.preconditions[functionname]:
-                        ignores.append(ignoredfunctionname)
+                if precondition_for:
+                    skipped |= precondition_for
 
         self.results_cache = {}
 
@@ -238,6 +238,7 @@ class L20nChecker(MozillaChecker):
             kwargs["checkerconfig"] = checkerconfig
 
         super().__init__(**kwargs)
+        self.complex_unit_filters = None
 
     def run_filters(self, unit, categorised=False):
         is_unit_complex = (
@@ -248,11 +249,21 @@ class L20nChecker(MozillaChecker):
         saved_default_filters = {}
         if is_unit_complex:
             saved_default_filters = self.defaultfilters
-            self.defaultfilters = {
-                key: value
-                for (key, value) in self.defaultfilters.items()
-                if key not in self.excluded_filters_for_complex_units
-            }
+            # Keep the same filters for all complex units, so the filter plan
+            # is only compiled once
+            if (
+                self.complex_unit_filters is None
+                or self.complex_unit_filters[0] is not saved_default_filters
+            ):
+                self.complex_unit_filters = (
+                    saved_default_filters,
+                    {
+                        key: value
+                        for (key, value) in saved_default_filters.items()
+                        if key not in self.excluded_filters_for_complex_units
+                    },
+                )
+            self.defaultfilters = self.complex_unit_filters[1]
 
         result = super().run_filters(unit, categorised=categorised)
 
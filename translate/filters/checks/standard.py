@@ -24,7 +24,7 @@ import re
 from translate.filters import decoration, helpers, prefilters, spelling
 from translate.filters.checks.checker import TranslationChecker
 from translate.filters.checks.exceptions import FilterFailure, SeriousFilterFailure
-from translate.filters.checks.tags import intuplelist, tag_re, tagproperties
+from translate.filters.checks.tags import intuplelist, tagproperties
 from translate.filters.decorators import cosmetic, critical, extraction, functional
 
 # These are some regular expressions that are compiled for use in some tests
@@ -227,7 +227,7 @@ class StandardChecker(TranslationChecker):
         str1 = self.filterwordswithpunctuation(
             self.filteraccelerators(self.filtervariables(str1))
         )
-        str1 = self.config.lang.punctranslate(str1)
+        str1 = self.punctranslate(str1)
 
         str2 = self.filterwordswithpunctuation(
             self.filteraccelerators(self.filtervariables(str2))
@@ -249,7 +249,7 @@ class StandardChecker(TranslationChecker):
         """
         str1 = self.filteraccelerators(self.filtervariables(str1))
         str1 = self.filterxml(str1)
-        str1 = self.config.lang.punctranslate(str1)
+        str1 = self.punctranslate(str1)
 
         str2 = self.filteraccelerators(self.filtervariables(str2))
         str2 = self.filterxml(str2)
@@ -291,7 +291,7 @@ class StandardChecker(TranslationChecker):
         # Convert all nbsp to space, and just check spaces. Useful intermediate
         # step to stricter nbsp checking?
         str1 = self.filteraccelerators(self.filtervariables(str1))
-        str1 = self.config.lang.punctranslate(str1)
+        str1 = self.punctranslate(str1)
         str1 = str1.replace("\u00a0", " ")
 
         if str1.find(" ") == -1:
@@ -793,7 +793,7 @@ class StandardChecker(TranslationChecker):
         If your language uses full-width punctuation (like Chinese), the visual
         spacing in the character might be enough without an added extra space.
         """
-        str1 = self.config.lang.punctranslate(str1)
+        str1 = self.punctranslate(str1)
 
         if helpers.funcmatch(str1, str2, decoration.spaceend):
             return True
@@ -811,7 +811,7 @@ class StandardChecker(TranslationChecker):
                 self.filteraccelerators(self.filtervariables(str1))
             )
         )
-        str1 = self.config.lang.punctranslate(str1)
+        str1 = self.punctranslate(str1)
         str2 = self.filterxml(
             self.filterwordswithpunctuation(
                 self.filteraccelerators(self.filtervariables(str2))
@@ -851,7 +851,7 @@ class StandardChecker(TranslationChecker):
         Support for your language can be added easily if it is not there yet.
         """
         str1 = self.filtervariables(str1)
-        str1 = self.config.lang.punctranslate(str1)
+        str1 = self.punctranslate(str1)
         str2 = self.filtervariables(str2)
         str1 = str1.rstrip()
         str2 = str2.rstrip()
@@ -1262,13 +1262,13 @@ class StandardChecker(TranslationChecker):
         e.g. ``<img src="bob.png" alt="Image description">`` or similar
         translatable attributes in OpenOffice.org help files.
         """
-        tags1 = tag_re.findall(str1)
+        tags1 = self.gettags(str1)
 
         if len(tags1) > 0:
             if (len(tags1[0]) == len(str1)) and "=" not in tags1[0]:
                 return True
 
-            tags2 = tag_re.findall(str2)
+            tags2 = self.gettags(str2)
             properties1 = tagproperties(tags1, self.config.ignoretags)
             properties2 = tagproperties(tags2, self.config.ignoretags)
 
@@ -1288,7 +1288,7 @@ class StandardChecker(TranslationChecker):
         else:
             # No tags in str1, let's just check that none were added in str2.
             # This might be useful for fuzzy strings wrongly unfuzzied.
-            tags2 = tag_re.findall(str2)
+            tags2 = self.gettags(str2)
 
             if len(tags2) > 0:
                 raise FilterFailure("Added XML tags")
@@ -30,14 +30,52 @@ for full descriptions of all tests.
 """
 
 import os
+import sys
+from itertools import starmap
 
 from translate.filters import autocorrect, checks
 from translate.misc import optrecurse
 from translate.storage import factory
 from translate.storage.poheader import poheader
 
+# The check filter and the parsed store of a worker process
+_workerstate = None
+
+
+def _initworker(checkfilter) -> None:
+    """Prepares a worker process of :meth:`pocheckfilter.filterunits`."""
+    global _workerstate  # ruff:ignore[global-statement]
+    _workerstate = [checkfilter, None]
+
+
+def _filterunitsjob(filename, unitcount, indexes):
+    """
+    Runs the filters on the units with the given *indexes* of a file in a
+    worker process.
+
+    :return: The categorised failures of the units, or None if the file
+        could not be parsed into the *unitcount* units checked by the main
+        process.
+    """
+    assert _workerstate is not None
+    checkfilter, store = _workerstate
+    if store is None:
+        try:
+            store = _workerstate[1] = factory.getobject(filename)
+        except Exception:
+            return None
+    if len(store.units) != unitcount:
+        return None
+    return [
+        checkfilter.checker.run_filters(store.units[index], categorised=True)
+        for index in indexes
+    ]
+
 
 class pocheckfilter:
+    #: The smallest number of units to check in a worker process
+    minshardsize = 250
+
     def __init__(self, options, checkerclasses=None, checkerconfig=None) -> None:
         # excludefilters={}, limitfilters=None, includefuzzy=True, includereview=True, autocorrect=False):
         """Builds a checkfilter using the given checker (a list is allowed too)."""
@@ -52,6 +90,15 @@ class pocheckfilter:
             languagecode=checkerconfig.targetlanguage,  # ty:ignore[unresolved-attribute]
         )
         self.options = options
+        #: An optional :class:`~translate.filters.checkcache.CheckCache` to
+        #: reuse the results of earlier checks from
+        self.checkcache = None
+
+    def __getstate__(self):
+        # The cache is only used in the main process
+        state = self.__dict__.copy()
+        state["checkcache"] = None
+        return state
 
     def getfilterdocs(self):
         """Lists the docs for filters available on checker."""
@@ -63,18 +110,31 @@ class pocheckfilter:
 
         return "\n".join(filterdocs)
 
-    def filterunit(self, unit):
-        """Runs filters on an element."""
+    def shouldfilter(self, unit) -> bool:
+        """Checks whether the filters should be run on a unit."""
         if unit.isheader():
-            return []
+            return False
 
         if not self.options.includefuzzy and unit.isfuzzy():
-            return []
+            return False
 
-        if not self.options.includereview and unit.isreview():
+        return self.options.includereview or not unit.isreview()
+
+    def filterunit(self, unit, failures=None):
+        """
+        Runs filters on an element.
+
+        :param failures: The categorised failures of the unit, if the filters
+            were already run on it.
+        """
+        if not self.shouldfilter(unit):
             return []
 
-        failures = self.checker.run_filters(unit, categorised=True)
+        if failures is None:
+            if self.checkcache is None:
+                failures = self.checker.run_filters(unit, categorised=True)
+            else:
+                failures = self.checkcache.run_filters(unit)
 
         if failures and self.options.autocorrect:
             # we can't get away with bad unquoting / requoting if we're going to change the result...
@@ -88,11 +148,121 @@ class pocheckfilter:
 
         return failures
 
-    def filterfile(self, transfile):
+    def canfilterinparallel(self, transfile) -> bool:
+        """Checks whether the units of a file can be checked in worker processes."""
+        import multiprocessing  # ruff:ignore[import-outside-top-level]
+        import pickle  # ruff:ignore[import-outside-top-level,suspicious-pickle-import]
+
+        # Files are already being checked in parallel
+        if multiprocessing.parent_process() is not None:
+            return False
+        filename = getattr(transfile, "filename", None)
+        if not isinstance(filename, str) or not os.path.isfile(filename):
+            return False
+        # Workers parse the file again, the way it was opened
+        try:
+            if factory.getclass(filename) is not type(transfile):
+                return False
+        except ValueError:
+            return False
+        try:
+            pickle.dumps(self)
+        except Exception:
+            return False
+        return True
+
+    def canstream(self) -> bool:
+        """
+        Checks whether files can be checked while they are being parsed.
+
+        This is not the case when the units of large files are split between
+        worker processes, which needs all of them at once.
+        """
+        if optrecurse.RecursiveOptionParser.getjobs(self.options) == 1:
+            return True
+        import multiprocessing  # ruff:ignore[import-outside-top-level]
+
+        # Files are already being checked in parallel
+        return multiprocessing.parent_process() is not None
+
+    def filterunits(self, transfile):
+        """
+        Runs filters on all the units of a translation store object.
+
+        With several ``--jobs``, the units of a large file are split in
+        shards that are checked in worker processes, each with a copy of the
+        checker. The results are returned in the order of the units, so the
+        output is the same as when checking the units one by one.
+
+        :return: A list with the result of :meth:`filterunit` for every unit.
+        """
+        units = transfile.units
+        failures = [None] * len(units)
+        keys = {}
+        pending = []
+        for index, unit in enumerate(units):
+            if not self.shouldfilter(unit):
+                continue
+            if self.checkcache is not None:
+                keys[index] = self.checkcache.getkey(unit)
+                failures[index] = self.checkcache.get(keys[index])
+                if failures[index] is not None:
+                    continue
+            pending.append(index)
+
+        jobs = optrecurse.RecursiveOptionParser.getjobs(self.options)
+        if (
+            jobs == 1
+            or len(pending) < 2 * self.minshardsize
+            or not self.canfilterinparallel(transfile)
+        ):
+            for index in pending:
+                failures[index] = self.checker.run_filters(
+                    units[index], categorised=True
+                )
+        else:
+            from concurrent.futures import ProcessPoolExecutor  # ruff:ignore[import-outside-top-level]
+
+            shardsize = max(self.minshardsize, -(-len(pending) // (jobs * 4)))
+            shards = [
+                pending[start : start + shardsize]
+                for start in range(0, len(pending), shardsize)
+            ]
+            with ProcessPoolExecutor(
+                max_workers=min(jobs, len(shards)),
+                initializer=_initworker,
+                initargs=(self,),
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _filterunitsjob, transfile.filename, len(units), indexes
+                    )
+                    for indexes in shards
+                ]
+                for indexes, future in zip(shards, futures, strict=True):
+                    shardfailures = future.result()
+                    if shardfailures is None:
+                        shardfailures = [
+                            self.checker.run_filters(units[index], categorised=True)
+                            for index in indexes
+                        ]
+                    for index, unitfailures in zip(indexes, shardfailures, strict=True):
+                        failures[index] = unitfailures
+
+        if self.checkcache is not None:
+            for index in pending:
+                self.checkcache.set(keys[index], failures[index])
+
+        return list(starmap(self.filterunit, zip(units, failures, strict=True)))
+
+    def filterfile(self, transfile, units=None):
         """
         Runs filters on a translation store object.
 
         :param transfile: A translation store object.
+        :param units: The units of *transfile* to filter, if they are not all
+            in it, as when it is parsed incrementally. They are checked one by
+            one as they come.
         :return: A new translation store object with the results of
                  the filter included.
         """
@@ -100,9 +270,11 @@ class pocheckfilter:
         newtransfile.setsourcelanguage(transfile.getsourcelanguage())
         newtransfile.settargetlanguage(transfile.gettargetlanguage())
 
-        for unit in transfile.units:
-            filter_result = self.filterunit(unit)
-
+        if units is None:
+            results = zip(transfile.units, self.filterunits(transfile), strict=True)
+        else:
+            results = ((unit, self.filterunit(unit)) for unit in units)
+        for unit, filter_result in results:
             if filter_result:
                 if filter_result != autocorrect:
                     for filter_name in filter_result:
@@ -169,9 +341,28 @@ class FilterOptionParser(optrecurse.RecursiveOptionParser):
 
         if options.listfilters:
             print(options.checkfilter.getfilterdocs())  # ruff:ignore[print]
+        elif options.checkcache:
+            from translate.filters import checkcache  # ruff:ignore[import-outside-top-level]
+
+            with checkcache.CheckCache(
+                os.path.expanduser(options.checkcache), options.checkfilter.checker
+            ) as cache:
+                options.checkfilter.checkcache = cache
+                self.recursiveprocess(options)
+            if options.progress != "none":
+                print(f"check cache: {cache.getstats()}", file=sys.stderr)  # ruff:ignore[print]
         else:
             self.recursiveprocess(options)
 
+    def canprocessinparallel(self, options) -> bool:
+        """
+        Checks whether the files can be processed in parallel.
+
+        With a check cache the files are processed one by one, the units
+        that need to be checked are still checked in parallel.
+        """
+        return not options.checkcache and super().canprocessinparallel(options)
+
     def build_checkerconfig(self, options):
         """
         Prepare the checker config from the given options.  This is mainly
@@ -223,8 +414,11 @@ class FilterOptionParser(optrecurse.RecursiveOptionParser):
 
 def runfilter(inputfile, outputfile, templatefile, checkfilter=None) -> int:
     """Reads in inputfile, filters using checkfilter, writes to outputfile."""
-    fromfile = factory.getobject(inputfile)
-    tofile = checkfilter.filterfile(fromfile)  # ty:ignore[unresolved-attribute]
+    if checkfilter.canstream():  # ty:ignore[unresolved-attribute]
+        fromfile, units = factory.iterobject(inputfile)
+    else:
+        fromfile, units = factory.getobject(inputfile), None
+    tofile = checkfilter.filterfile(fromfile, units)  # ty:ignore[unresolved-attribute]
 
     if tofile.isempty():
         return 0
@@ -413,6 +607,16 @@ def cmdlineparser():
         help="read list of all valid characters from FILE (must be in UTF-8)",
     )
 
+    parser.add_option(
+        "",
+        "--check-cache",
+        dest="checkcache",
+        default=None,
+        type="string",
+        metavar="FILE",
+        help="reuse the results of checks of unchanged units kept in FILE",
+    )
+
     parser.passthrough.append("checkfilter")
     parser.description = f"{__doc__.strip()}\n"
 
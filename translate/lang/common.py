@@ -61,6 +61,7 @@ TODOs and Ideas for possible features:
 
 import logging
 import re
+from functools import lru_cache
 
 from unicode_segmentation_rs import unicode_words
 
@@ -68,6 +69,14 @@ from translate.lang import data
 
 logger = logging.getLogger(__name__)
 
+#: The number of word counts remembered by :meth:`Common.wordcount`
+WORDCOUNT_CACHE_SIZE = 1 << 16
+
+
+@lru_cache(maxsize=WORDCOUNT_CACHE_SIZE)
+def _wordcount(language, text: str) -> int:
+    return len(language.words(text))
+
 
 class Common:
     """This class is the common parent class for all language classes."""
@@ -355,6 +364,16 @@ class Common:
         """Returns a list of words in text."""
         return unicode_words(text)
 
+    @classmethod
+    def wordcount(cls, text: str) -> int:
+        """
+        Returns the number of words in text.
+
+        The counts of recently counted strings are remembered, as the same
+        strings tend to be counted many times.
+        """
+        return _wordcount(cls, str(text))
+
     @classmethod
     def sentence_iter(cls, text, strip=True):
         """Returns an iterator over the sentences in text."""
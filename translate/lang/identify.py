@@ -79,14 +79,38 @@ class LanguageIdentifier:
 
                 self._lang_codes[lname] = lcode
 
+    def _get_lang_code(self, result):
+        return self._lang_codes.get(result, result)
+
     def identify_lang(self, text):
         """Identify the language of the text in the given string."""
         if not text:
             return None
-        result = self.ngram.classify(text)
-        if result in self._lang_codes:
-            result = self._lang_codes[result]
-        return result
+        return self._get_lang_code(self.ngram.classify(text))
+
+    def identify_langs(self, texts) -> list[str | None]:
+        """
+        Identify the languages of all the given strings at once.
+
+        With NumPy available, the strings are compared to the language models
+        together, which is much faster than identifying them one by one.
+
+        :returns: The identified language's code for every string, or
+            ``None`` for empty strings.
+        """
+        texts = list(texts)
+        results = iter(self.ngram.classify_many([text for text in texts if text]))
+        return [self._get_lang_code(next(results)) if text else None for text in texts]
+
+    @staticmethod
+    def _get_store_text(instore, attribute, limit) -> str:
+        if not isinstance(instore, (TranslationStore, list, tuple)):
+            return ""
+        return " ".join(
+            getattr(unit, attribute)
+            for unit in instore[:limit]  # ty:ignore[not-subscriptable]
+            if unit.istranslatable() and getattr(unit, attribute)
+        )
 
     def identify_source_lang(
         self, instore: TranslationStore | list[TranslationUnit] | tuple[TranslationUnit]
@@ -98,17 +122,7 @@ class LanguageIdentifier:
         :returns: The identified language's code or ``None`` if the language
             could not be identified.
         """
-        if not isinstance(instore, (TranslationStore, list, tuple)):
-            return None
-
-        text = " ".join(
-            unit.source
-            for unit in instore[:50]  # ty:ignore[not-subscriptable]
-            if unit.istranslatable() and unit.source
-        )
-        if not text:
-            return None
-        return self.identify_lang(text)
+        return self.identify_lang(self._get_store_text(instore, "source", 50))
 
     def identify_target_lang(
         self,
@@ -121,17 +135,31 @@ class LanguageIdentifier:
         :returns: The identified language's code or ``None`` if the language
             could not be identified.
         """
-        if not isinstance(instore, (TranslationStore, list, tuple)):
-            return None
+        return self.identify_lang(self._get_store_text(instore, "target", 200))
 
-        text = " ".join(
-            unit.target
-            for unit in instore[:200]  # ty:ignore[not-subscriptable]
-            if unit.istranslatable() and unit.target
+    def identify_source_langs(self, instores) -> list[str | None]:
+        """
+        Identify the source languages of all the given translation stores or
+        lists of units at once.
+
+        :returns: The identified language's code for every store, see
+            :meth:`identify_source_lang`.
+        """
+        return self.identify_langs(
+            self._get_store_text(instore, "source", 50) for instore in instores
+        )
+
+    def identify_target_langs(self, instores) -> list[str | None]:
+        """
+        Identify the target languages of all the given translation stores or
+        lists of units at once.
+
+        :returns: The identified language's code for every store, see
+            :meth:`identify_target_lang`.
+        """
+        return self.identify_langs(
+            self._get_store_text(instore, "target", 200) for instore in instores
         )
-        if not text:
-            return None
-        return self.identify_lang(text)
 
 
 if __name__ == "__main__":
@@ -22,6 +22,10 @@
 """
 Ngram models for language guessing.
 
+The models of all the languages can be compiled into one NumPy array, see
+:func:`compile_models`, which is used instead of the separate models when
+NumPy is available.
+
 .. note:: Original code from http://thomas.mangin.me.uk/data/source/ngram.py
 """
 
@@ -33,6 +37,18 @@ from os import path
 nb_ngrams = 400
 white_space_re = re.compile(r"\s+")
 
+#: The name of the compiled models in the directory of the models
+MODEL_FILE = "langmodels.npy"
+
+# The longest ngram taken from texts
+MAX_NGRAM = 4
+
+# The rank in the compiled models of ngrams missing from a language
+NO_RANK = 0xFFFF
+
+# The number of texts classified together, limiting the memory used
+BATCH_SIZE = 256
+
 
 class _NGram:
     def __init__(self, arg=None) -> None:
@@ -52,7 +68,7 @@ class _NGram:
             word = f"_{word}_"
             size = len(word)
             for i in range(size - 1):
-                for s in (1, 2, 3, 4):
+                for s in range(1, MAX_NGRAM + 1):
                     end = i + s
                     if end >= size:
                         break
@@ -94,30 +110,160 @@ class _NGram:
         return d
 
 
+def load_models(folder, ext=".lm"):
+    """Returns the ngram models in *folder*, by language."""
+    models = {}
+    folder = path.join(folder, f"*{ext}")
+    size = len(ext)
+
+    for fname in sorted(glob.glob(path.normcase(folder))):
+        lang = path.split(fname)[-1][:-size]
+        ngrams = {}
+        try:
+            with open(fname, encoding="utf-8") as fp:
+                for i, line in enumerate(fp):
+                    ngram, _t, _f = line.partition("\t")
+                    ngrams[ngram] = i
+        except UnicodeDecodeError:
+            continue
+
+        if ngrams:
+            models[lang] = _NGram(ngrams)
+    return models
+
+
+def compile_models(folder, ext=".lm", filename=None) -> None:
+    """
+    Compiles the ngram models in *folder* into one NumPy array.
+
+    The array has a record for every ngram that can be taken from texts,
+    sorted by the ngram, with the rank of the ngram in every language or
+    ``NO_RANK`` in a field named after the language. The first record has an
+    empty ngram and holds the number of ngrams of every language instead.
+
+    :param filename: Where to save the array, ``MODEL_FILE`` in *folder* by
+        default.
+    """
+    import numpy as np  # ruff:ignore[import-outside-top-level]
+
+    models = load_models(folder, ext)
+    if not models:
+        raise ValueError("no language files found")
+    vocabulary = sorted(
+        {
+            ngram
+            for model in models.values()
+            for ngram in model.ngrams
+            if len(ngram) <= MAX_NGRAM
+        }
+    )
+    array = np.full(
+        len(vocabulary) + 1,
+        NO_RANK,
+        dtype=[("ngram", f"<U{MAX_NGRAM}")] + [(lang, "<u2") for lang in models],
+    )
+    array["ngram"][1:] = vocabulary
+    positions = {ngram: i for i, ngram in enumerate(vocabulary, 1)}
+    for lang, model in models.items():
+        ranks = array[lang]
+        ranks[0] = len(model.ngrams)
+        for ngram, rank in model.ngrams.items():
+            if ngram in positions:
+                ranks[positions[ngram]] = rank
+    np.save(filename or path.join(folder, MODEL_FILE), array)
+
+
+class _CompiledModels:
+    """The ngram models of all languages compiled into one NumPy array."""
+
+    def __init__(self, filename) -> None:
+        import numpy as np  # ruff:ignore[import-outside-top-level]
+        from numpy.lib import recfunctions  # ruff:ignore[import-outside-top-level]
+
+        array = np.load(filename, mmap_mode="r")
+        self.languages = array.dtype.names[1:]
+        self.vocabulary = array["ngram"][1:]
+        # A view of the ranks as a matrix of ngrams by languages
+        ranks = recfunctions.structured_to_unstructured(array[list(self.languages)])
+        self.ngramcounts = ranks[0].astype(np.int64)
+        self.ranks = ranks[1:]
+
+    def classify_many(self, texts):
+        """Returns the closest language for every text, comparing to all at once."""
+        import numpy as np  # ruff:ignore[import-outside-top-level]
+
+        results = []
+        for start in range(0, len(texts), BATCH_SIZE):
+            batch = [_NGram(text).ngrams for text in texts[start : start + BATCH_SIZE]]
+            textindexes = np.fromiter(
+                (i for i, ngrams in enumerate(batch) for _ngram in ngrams),
+                dtype=np.intp,
+            )
+            ngrams = np.array(
+                [ngram for ngrams in batch for ngram in ngrams],
+                dtype=f"<U{MAX_NGRAM}",
+            )
+            textranks = np.fromiter(
+                (rank for ngrams in batch for rank in ngrams.values()),
+                dtype=np.int64,
+            )
+            # Only the ngrams a language shares with a text reduce its distance
+            # from the maximum of nb_ngrams for every ngram of the language
+            positions = np.searchsorted(self.vocabulary, ngrams)
+            positions[positions == len(self.vocabulary)] = 0
+            found = self.vocabulary[positions] == ngrams
+            ranks = self.ranks[positions[found]]
+            shared = np.where(
+                ranks == NO_RANK,
+                0,
+                nb_ngrams - np.abs(ranks - textranks[found, np.newaxis]),
+            )
+            # The ngrams of every text are next to each other, so the shared
+            # ngrams can be summed by text, leaving out texts without any
+            counts = np.bincount(textindexes[found], minlength=len(batch))
+            starts = np.cumsum(counts) - counts
+            sums = np.zeros((len(batch), len(self.languages)), dtype=np.int64)
+            nonempty = counts > 0
+            if nonempty.any():
+                sums[nonempty] = np.add.reduceat(shared, starts[nonempty], axis=0)
+            distances = nb_ngrams * self.ngramcounts - sums
+            closest = distances.argmin(axis=1)
+            results.extend(
+                ""
+                if distances[i, lang] > 0.8 * (nb_ngrams**2)
+                else self.languages[lang]
+                for i, lang in enumerate(closest)
+            )
+        return results
+
+
 class NGram:
-    def __init__(self, folder, ext=".lm") -> None:
-        self.ngrams = {}
-        folder = path.join(folder, f"*{ext}")
-        size = len(ext)
+    def __init__(self, folder, ext=".lm", compiled=True) -> None:
+        """
+        Loads the ngram models in *folder*.
 
-        for fname in glob.glob(path.normcase(folder)):
-            lang = path.split(fname)[-1][:-size]
-            ngrams = {}
+        :param compiled: Whether to use the compiled models in *folder*, if
+            there are any and NumPy is available.
+        """
+        self.ngrams = {}
+        self.compiled = None
+        modelfile = path.join(folder, MODEL_FILE)
+        if compiled and ext == ".lm" and path.isfile(modelfile):
             try:
-                with open(fname, encoding="utf-8") as fp:
-                    for i, line in enumerate(fp):
-                        ngram, _t, _f = line.partition("\t")
-                        ngrams[ngram] = i
-            except UnicodeDecodeError:
-                continue
-
-            if ngrams:
-                self.ngrams[lang] = _NGram(ngrams)
+                self.compiled = _CompiledModels(modelfile)
+            except ImportError:
+                pass
+            else:
+                return
 
+        self.ngrams = load_models(folder, ext)
         if not self.ngrams:
             raise ValueError("no language files found")
 
     def classify(self, text):
+        if self.compiled is not None:
+            return self.compiled.classify_many([text])[0]
+
         ngram = _NGram(text)
         r = "guess"
 
@@ -133,6 +279,12 @@ class NGram:
             r = ""
         return r
 
+    def classify_many(self, texts):
+        """Returns the closest language for every text in *texts*."""
+        if self.compiled is not None:
+            return self.compiled.classify_many(list(texts))
+        return [self.classify(text) for text in texts]
+
 
 class Generate:
     def __init__(self, folder, ext=".txt") -> None:
@@ -163,8 +315,13 @@ if __name__ == "__main__":
     # conf = Generate('/tmp')
     # conf.save('/tmp')
 
-    text = sys.stdin.readline()
     from translate.misc.file_discovery import get_abs_data_filename
 
+    if sys.argv[1:] == ["--compile"]:
+        # Recompile the models after changing the .lm files
+        compile_models(get_abs_data_filename("langmodels"))
+        sys.exit()
+
+    text = sys.stdin.readline()
     lm = NGram(get_abs_data_filename("langmodels"))
     print(lm.classify(text))  # ruff:ignore[print]
@@ -30,6 +30,54 @@ from typing import Any
 from translate import __version__
 from translate.misc import progressbar
 
+LOGGING_FORMAT = "%(name)s: %(levelname)s: %(message)s"
+
+# The parser, options and captured log records of a worker process
+_workerstate = None
+_workerrecords = []
+
+
+class _RecordingHandler(logging.Handler):
+    """Keeps the log records of a worker so the parent can emit them."""
+
+    def emit(self, record) -> None:
+        # Make sure the record can be sent to the parent
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        _workerrecords.append(record)
+
+
+def _initworker(parser, options) -> None:
+    """Prepares a worker process of :meth:`RecursiveOptionParser.parallelprocess`."""
+    global _workerstate  # ruff:ignore[global-statement]
+    _workerstate = (parser, options)
+    logging.getLogger().handlers = [_RecordingHandler()]
+
+
+def _processfilejob(fileprocessor, fullinputpath, fulltemplatepath, fulloutputpath):
+    """
+    Processes a single file in a worker process.
+
+    :return: Whether the file was processed, the error information formatted
+        for the errorlevel (or None if there was no error) and the log
+        records emitted while processing.
+    """
+    assert _workerstate is not None
+    parser, options = _workerstate
+    _workerrecords.clear()
+    errorinfo = None
+    try:
+        success = parser.processfile(
+            fileprocessor, options, fullinputpath, fulloutputpath, fulltemplatepath
+        )
+    except Exception:
+        success = False
+        errorinfo = parser.formaterrorinfo(options, sys.exc_info())
+    return success, errorinfo, list(_workerrecords)
+
 
 class ProgressBar:
     progress_types: dict[str, type[progressbar.ProgressBase]] = {
@@ -141,10 +189,11 @@ class RecursiveOptionParser(optparse.OptionParser):
         self.setmanpageoption()
         self.setprogressoptions()
         self.seterrorleveloptions()
+        self.setjobsoption()
         self.setformats(formats, usetemplates)
         self.passthrough = []
         self.allowmissingtemplate = allowmissingtemplate
-        logging.basicConfig(format="%(name)s: %(levelname)s: %(message)s")
+        logging.basicConfig(format=LOGGING_FORMAT)
 
     def get_prog_name(self):
         return os.path.basename(sys.argv[0])
@@ -242,28 +291,35 @@ class RecursiveOptionParser(optparse.OptionParser):
     ) -> None:
         """Print a warning message incorporating 'msg' to stderr."""
         if options:
-            if options.errorlevel == "traceback":
-                assert exc_info is not None
-                assert exc_info[0] is not None
-                errorinfo = "\n".join(
-                    traceback.format_exception(exc_info[0], exc_info[1], exc_info[2])
-                )
-            elif options.errorlevel == "exception":
-                assert exc_info is not None
-                assert exc_info[0] is not None
-                errorinfo = "\n".join(
-                    traceback.format_exception_only(exc_info[0], exc_info[1])
-                )
-            elif options.errorlevel == "message":
-                assert exc_info is not None
-                assert exc_info[1] is not None
-                errorinfo = str(exc_info[1])
-            else:
-                errorinfo = ""
+            errorinfo = self.formaterrorinfo(options, exc_info)
             if errorinfo:
                 msg += f": {errorinfo}"
         logging.getLogger(self.get_prog_name()).warning(msg)
 
+    @staticmethod
+    def formaterrorinfo(
+        options,
+        exc_info: tuple[type[BaseException], BaseException, TracebackType]
+        | tuple[None, None, None]
+        | None,
+    ) -> str:
+        """Formats the error information in *exc_info* for the errorlevel."""
+        if options.errorlevel == "traceback":
+            assert exc_info is not None
+            assert exc_info[0] is not None
+            return "\n".join(
+                traceback.format_exception(exc_info[0], exc_info[1], exc_info[2])
+            )
+        if options.errorlevel == "exception":
+            assert exc_info is not None
+            assert exc_info[0] is not None
+            return "\n".join(traceback.format_exception_only(exc_info[0], exc_info[1]))
+        if options.errorlevel == "message":
+            assert exc_info is not None
+            assert exc_info[1] is not None
+            return str(exc_info[1])
+        return ""
+
     @staticmethod
     def getusagestring(option):
         """Returns the usage string for the given option."""
@@ -426,6 +482,30 @@ class RecursiveOptionParser(optparse.OptionParser):
         )
         self.define_option(errorleveloption)
 
+    def setjobsoption(self) -> None:
+        """Sets the ``--jobs`` option."""
+        jobsoption = RecursiveOption(
+            None,
+            "--jobs",
+            dest="jobs",
+            default=1,
+            type="int",
+            metavar="JOBS",
+            help="process files in JOBS parallel processes, 0 uses all CPUs "
+            "(default: 1)",
+        )
+        self.define_option(jobsoption)
+
+    @staticmethod
+    def getjobs(options) -> int:
+        """Returns the number of processes to process the files with."""
+        jobs = getattr(options, "jobs", 1)
+        if jobs is None or jobs == 1:
+            return 1
+        if jobs <= 0:
+            return os.cpu_count() or 1
+        return jobs
+
     @staticmethod
     def getformathelp(formats) -> str:
         """Make a nice help string for describing formats..."""
@@ -655,36 +735,164 @@ class RecursiveOptionParser(optparse.OptionParser):
         # this makes for more merge-friendly content in single-output-file mode.
         inputfiles.sort()
         progress_bar = ProgressBar(options.progress, inputfiles)
+        jobs = self.getjobs(options)
+        if jobs > 1 and len(inputfiles) > 1 and self.canprocessinparallel(options):
+            self.parallelprocess(options, inputfiles, progress_bar, jobs)
+            return
         for inputpath in inputfiles:
-            try:
-                processingpaths = self.getprocessingpaths(options, inputpath)
-            except Exception:
-                self.warning(
-                    f"Couldn't handle input file {inputpath}", options, sys.exc_info()
-                )
-                continue
+            processingpaths = self.trygetprocessingpaths(options, inputpath)
             if processingpaths is None:
                 continue
-            fileprocessor, fullinputpath, fulltemplatepath, fulloutputpath = (
-                processingpaths
-            )
-            try:
-                success = self.processfile(
-                    fileprocessor,
-                    options,
-                    fullinputpath,
-                    fulloutputpath,
-                    fulltemplatepath,
-                )
-            except Exception:
-                self.warning(
-                    f"Error processing: input {fullinputpath}, output {fulloutputpath}, template {fulltemplatepath}",
-                    options,
-                    sys.exc_info(),
-                )
+            if self.isuptodate(options, *processingpaths):
                 success = False
+            else:
+                success = self.tryprocessfile(options, *processingpaths)
+                self.markprocessed(options, *processingpaths, success)
             progress_bar.report_progress(inputpath, success)
 
+    def trygetprocessingpaths(self, options, inputpath):
+        """Gets the processing paths, warning instead of raising on errors."""
+        try:
+            return self.getprocessingpaths(options, inputpath)
+        except Exception:
+            self.warning(
+                f"Couldn't handle input file {inputpath}", options, sys.exc_info()
+            )
+            return None
+
+    def tryprocessfile(
+        self, options, fileprocessor, fullinputpath, fulltemplatepath, fulloutputpath
+    ) -> bool:
+        """Processes a file, warning instead of raising on errors."""
+        try:
+            return self.processfile(
+                fileprocessor,
+                options,
+                fullinputpath,
+                fulloutputpath,
+                fulltemplatepath,
+            )
+        except Exception:
+            self.warning(
+                self.geterrormessage(fullinputpath, fulltemplatepath, fulloutputpath),
+                options,
+                sys.exc_info(),
+            )
+            return False
+
+    def isuptodate(
+        self, options, fileprocessor, fullinputpath, fulltemplatepath, fulloutputpath
+    ) -> bool:
+        """
+        Checks whether processing a file can be skipped because its output is
+        up to date.
+
+        This is always called in the main process, also when processing files
+        in parallel.
+        """
+        return False
+
+    def markprocessed(
+        self,
+        options,
+        fileprocessor,
+        fullinputpath,
+        fulltemplatepath,
+        fulloutputpath,
+        success,
+    ) -> None:
+        """Called in the main process once a file has been processed."""
+
+    @staticmethod
+    def geterrormessage(fullinputpath, fulltemplatepath, fulloutputpath) -> str:
+        return f"Error processing: input {fullinputpath}, output {fulloutputpath}, template {fulltemplatepath}"
+
+    def canprocessinparallel(self, options) -> bool:
+        """
+        Checks whether the files can be processed in parallel.
+
+        This is only the case when every input file has its own output file.
+        """
+        return bool(options.recursiveoutput)
+
+    def parallelprocess(self, options, inputfiles, progress_bar, jobs) -> None:
+        """
+        Processes the input files in a pool of *jobs* worker processes.
+
+        The processing paths are worked out in this process first. Results,
+        errors and log messages of the workers are then reported here in the
+        order of *inputfiles*, so the output is the same as when processing
+        the files one by one.
+        """
+        import pickle  # ruff:ignore[import-outside-top-level,suspicious-pickle-import]
+        from concurrent.futures import ProcessPoolExecutor  # ruff:ignore[import-outside-top-level]
+
+        tasks = []
+        for inputpath in inputfiles:
+            processingpaths = self.trygetprocessingpaths(options, inputpath)
+            if processingpaths is not None:
+                uptodate = self.isuptodate(options, *processingpaths)
+                tasks.append((inputpath, processingpaths, uptodate))
+        outputpaths = [
+            processingpaths[3]
+            for _inputpath, processingpaths, uptodate in tasks
+            if not uptodate
+        ]
+        fileprocessors = {
+            processingpaths[0]
+            for _inputpath, processingpaths, uptodate in tasks
+            if not uptodate
+        }
+        try:
+            pickle.dumps((self, options, fileprocessors))
+        except Exception:
+            self.warning("Unable to process files in parallel", options, sys.exc_info())
+            serial = True
+        else:
+            # Processing several files to the same output depends on the order
+            serial = len(set(outputpaths)) != len(outputpaths)
+        if serial or not outputpaths:
+            for inputpath, processingpaths, uptodate in tasks:
+                if uptodate:
+                    success = False
+                else:
+                    success = self.tryprocessfile(options, *processingpaths)
+                    self.markprocessed(options, *processingpaths, success)
+                progress_bar.report_progress(inputpath, success)
+            return
+        with ProcessPoolExecutor(
+            max_workers=min(jobs, len(outputpaths)),
+            initializer=_initworker,
+            initargs=(self, options),
+        ) as executor:
+            futures = [
+                None if uptodate else executor.submit(_processfilejob, *processingpaths)
+                for _inputpath, processingpaths, uptodate in tasks
+            ]
+            for (inputpath, processingpaths, _uptodate), future in zip(
+                tasks, futures, strict=True
+            ):
+                if future is None:
+                    progress_bar.report_progress(inputpath, False)
+                    continue
+                message = self.geterrormessage(*processingpaths[1:])
+                try:
+                    success, errorinfo, records = future.result()
+                except Exception:
+                    self.warning(message, options, sys.exc_info())
+                    success = False
+                else:
+                    for record in records:
+                        logger = logging.getLogger(record.name)
+                        if logger.isEnabledFor(record.levelno):
+                            logger.handle(record)
+                    if errorinfo is not None:
+                        if errorinfo:
+                            message += f": {errorinfo}"
+                        self.warning(message)
+                self.markprocessed(options, *processingpaths, success)
+                progress_bar.report_progress(inputpath, success)
+
     def ensurerecursiveoutputdirexists(self, options) -> None:
         if not self.isrecursive(options.output, "output"):
             if not options.output:
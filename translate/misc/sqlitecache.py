@@ -0,0 +1,171 @@
+#
+# Copyright 2026 Translate Toolkit contributors
+#
+# This file is part of the Translate Toolkit.
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+"""
+Persistent caches in SQLite databases.
+
+A cache keeps values by key in an SQLite database, so that they can be reused
+by later runs. The least recently used values are dropped when the cache grows
+beyond its size.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    used INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS cache_used ON cache (used);
+"""
+
+
+class SQLiteCache:
+    """
+    Values stored by key in an SQLite database.
+
+    Subclasses work out the keys, and convert the values to and from text in
+    :meth:`encode` and :meth:`decode`.
+    """
+
+    #: The version of the table, which is recreated when it differs
+    schemaversion = 1
+
+    #: The default number of values to keep
+    defaultmaxsize = 1000000
+
+    #: The number of new values to keep in memory before writing them out
+    flushsize = 10000
+
+    def __init__(self, filename, maxsize=None) -> None:
+        """
+        Opens the cache in *filename*.
+
+        :param maxsize: The number of values to keep at most.
+        """
+        self.filename = filename
+        self.maxsize = self.defaultmaxsize if maxsize is None else maxsize
+        #: The number of values found in the cache
+        self.hits = 0
+        #: The number of values not found in the cache
+        self.misses = 0
+        self.connection = sqlite3.connect(filename)
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        if version != self.schemaversion:
+            with self.connection:
+                self.connection.execute("DROP TABLE IF EXISTS cache")
+                self.connection.execute(f"PRAGMA user_version = {self.schemaversion}")
+        self.connection.executescript(SCHEMA)
+        self.lastused = self.connection.execute(
+            "SELECT COALESCE(MAX(used), 0) FROM cache"
+        ).fetchone()[0]
+        self.newvalues = {}
+        self.usedkeys = {}
+
+    def close(self) -> None:
+        """Writes out the new values, dropping the least recently used ones."""
+        self.flush()
+        with self.connection:
+            (count,) = self.connection.execute("SELECT COUNT(*) FROM cache").fetchone()
+            if count > self.maxsize:
+                self.connection.execute(
+                    "DELETE FROM cache WHERE key IN "
+                    "(SELECT key FROM cache ORDER BY used LIMIT ?)",
+                    (count - self.maxsize,),
+                )
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def encode(self, value) -> str | None:
+        """
+        Converts *value* to the text stored for it.
+
+        :return: The text, or None if the value can't be stored.
+        """
+        raise NotImplementedError
+
+    def decode(self, text):
+        """Converts text stored by :meth:`encode` back to its value."""
+        raise NotImplementedError
+
+    def get(self, key):
+        """
+        Returns the value stored for *key*.
+
+        :return: The value, or None if it is not in the cache.
+        """
+        if key is None:
+            self.misses += 1
+            return None
+        text = self.newvalues.get(key)
+        if text is None:
+            row = self.connection.execute(
+                "SELECT value FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            (text,) = row
+        self.hits += 1
+        self.lastused += 1
+        self.usedkeys[key] = self.lastused
+        return self.decode(text)
+
+    def set(self, key, value) -> None:
+        """Stores *value* for *key*."""
+        if key is None:
+            return
+        text = self.encode(value)
+        if text is None:
+            return
+        self.lastused += 1
+        self.newvalues[key] = text
+        self.usedkeys[key] = self.lastused
+        if len(self.newvalues) >= self.flushsize:
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes out the new values and when values were last used."""
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO cache (key, value, used) VALUES (?, ?, ?)",
+                (
+                    (key, text, self.usedkeys.pop(key))
+                    for key, text in self.newvalues.items()
+                ),
+            )
+            self.connection.executemany(
+                "UPDATE cache SET used = ? WHERE key = ?",
+                ((used, key) for key, used in self.usedkeys.items()),
+            )
+        self.newvalues = {}
+        self.usedkeys = {}
+
+    def getstats(self) -> str:
+        """Returns a summary of how many values were found in the cache."""
+        total = self.hits + self.misses
+        ratio = self.hits / total if total else 0
+        return f"{self.hits} hits, {self.misses} misses ({ratio:.1%} hit ratio)"
@@ -200,6 +200,13 @@ def getText(node, xml_space="preserve"):
     optional default to use in case nothing is specified in this node.
     """
     xml_space = getXMLspace(node, xml_space)
+    if len(node) == 0:
+        # Without children (also comments and processing instructions), the
+        # text of the node is all there is, and is faster to get than with XPath
+        text = node.text or ""
+        if xml_space == "default":
+            return MULTIWHITESPACE_RE.sub(" ", text).strip(" ")
+        return text
     if xml_space == "default":
         return str(string_xpath_normalized(node))  # specific to lxml.etree
     return str(string_xpath(node))  # specific to lxml.etree
@@ -0,0 +1,286 @@
+#
+# Copyright 2026 Translate Toolkit contributors
+#
+# This file is part of the Translate Toolkit.
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+"""
+Persistent full-text index of localization files.
+
+The index keeps the text of every unit of a set of files in an SQLite FTS5
+table with trigram postings, so that :doc:`pogrep </commands/pogrep>` only has
+to parse the files and search the units that contain the strings it looks
+for. Searches through the index return a superset of the units that match:
+case, accelerators and the structure of regular expressions are only taken
+into account when the candidate units are searched.
+
+Files are indexed again when their content changes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import sqlite3
+from re import _constants as sre_constants  # ruff:ignore[import-private-name]
+from re import _parser as sre_parse  # ruff:ignore[import-private-name]
+
+from translate.lang import data
+from translate.misc.multistring import multistring
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    mtime INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    digest TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS units (
+    id INTEGER PRIMARY KEY,
+    file INTEGER NOT NULL,
+    seq INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS units_file ON units (file);
+CREATE VIRTUAL TABLE IF NOT EXISTS texts USING fts5(
+    source, target, notes, locations, tokenize = 'trigram'
+);
+"""
+
+#: The parts of units that are indexed
+PARTS = ("source", "target", "notes", "locations")
+
+#: The characters that can be ignored as accelerators
+ACCELERATORS = "&_~"
+
+_REPEATS = (
+    sre_constants.MAX_REPEAT,
+    sre_constants.MIN_REPEAT,
+    sre_constants.POSSESSIVE_REPEAT,
+)
+
+
+def preparetext(text) -> str:
+    """Returns *text* as it is indexed and searched."""
+    if text is None:
+        return ""
+    if isinstance(text, multistring):
+        text = "\n".join(text.strings)
+    text = data.normalize(text).lower()
+    for accelerator in ACCELERATORS:
+        text = text.replace(accelerator, "")
+    return text
+
+
+def _literalruns(pattern):
+    """Returns runs of literal characters that every match of *pattern* contains."""
+    runs = [""]
+    for op, av in pattern:
+        if op is sre_constants.LITERAL:
+            runs[-1] += chr(av)
+        elif op is sre_constants.SUBPATTERN and all(
+            subop is sre_constants.LITERAL for subop, _subav in av[3]
+        ):
+            runs[-1] += "".join(chr(subav) for _subop, subav in av[3])
+        elif op is sre_constants.SUBPATTERN:
+            runs.extend(_literalruns(av[3]))
+            runs.append("")
+        elif op in _REPEATS and av[0] >= 1:
+            runs.extend(_literalruns(av[2]))
+            runs.append("")
+        else:
+            runs.append("")
+    return [run for run in runs if run]
+
+
+def querypieces(searchstring, useregexp=False, accelchar=None):
+    """
+    Returns what units have to contain to possibly match *searchstring*.
+
+    :return: A list of alternatives, each a list of strings of which a unit
+        has to contain all, or None if any unit might match.
+    """
+    if useregexp:
+        try:
+            parsed = sre_parse.parse(searchstring)
+        except re.error:
+            return None
+        if len(parsed) == 1 and parsed[0][0] is sre_constants.BRANCH:
+            branches = parsed[0][1][1]
+        else:
+            branches = [parsed]
+        alternatives = [_literalruns(branch) for branch in branches]
+    else:
+        alternatives = [[searchstring]]
+    query = []
+    for strings in alternatives:
+        pieces = []
+        for string in strings:
+            # Accelerators were removed from the index, so pieces are only
+            # contiguous up to a doubled accelerator, which became "#"
+            prepared = preparetext(string)
+            pieces.extend(prepared.split("#") if accelchar else [prepared])
+        # The trigram index can only find strings of at least three characters
+        pieces = [piece for piece in pieces if len(piece) >= 3]
+        if not pieces:
+            return None
+        query.append(pieces)
+    return query
+
+
+def _digest(filename):
+    with open(filename, "rb") as handle:
+        return hashlib.file_digest(handle, "sha256").hexdigest()
+
+
+def _phrase(text):
+    return '"{}"'.format(text.replace('"', '""'))
+
+
+class GrepIndex:
+    """The text of the units of files, stored in an SQLite database."""
+
+    def __init__(self, filename) -> None:
+        self.filename = filename
+        self.connection = sqlite3.connect(filename)
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            with self.connection:
+                self.connection.execute("DROP TABLE IF EXISTS files")
+                self.connection.execute("DROP TABLE IF EXISTS units")
+                self.connection.execute("DROP TABLE IF EXISTS texts")
+                self.connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self.connection.executescript(SCHEMA)
+        self.searches = {}
+        self.pending = {}
+
+    def close(self) -> None:
+        self.connection.commit()
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def isfresh(self, path) -> bool:
+        """
+        Checks whether the index has the current content of the file *path*.
+
+        The content is only compared when the modification time or size of
+        the file changed since it was indexed.
+        """
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        row = self.connection.execute(
+            "SELECT mtime, size, digest FROM files WHERE path = ?", (path,)
+        ).fetchone()
+        if row is not None and row[:2] == (stat.st_mtime_ns, stat.st_size):
+            return True
+        digest = _digest(path)
+        if row is not None and row[2] == digest:
+            self.connection.execute(
+                "UPDATE files SET mtime = ?, size = ? WHERE path = ?",
+                (stat.st_mtime_ns, stat.st_size, path),
+            )
+            return True
+        self.pending[path] = (stat.st_mtime_ns, stat.st_size, digest)
+        return False
+
+    def indexunits(self, path, units):
+        """
+        Indexes the *units* of the file *path* while iterating over them.
+
+        The file has to be found out of date by :meth:`isfresh` first, and is
+        only recorded as indexed once all its units were read.
+        """
+        path = os.path.abspath(path)
+        texts = []
+        for unit in units:
+            texts.append(
+                (
+                    preparetext(unit.source),
+                    preparetext(unit.target),
+                    preparetext(unit.getnotes()),
+                    preparetext(" ".join(unit.getlocations())),
+                )
+            )
+            yield unit
+        self.searches.clear()
+        mtime, size, digest = self.pending.pop(path)
+        connection = self.connection
+        row = connection.execute(
+            "SELECT id FROM files WHERE path = ?", (path,)
+        ).fetchone()
+        if row is not None:
+            (fileid,) = row
+            connection.execute(
+                "DELETE FROM texts WHERE rowid IN (SELECT id FROM units WHERE file = ?)",
+                (fileid,),
+            )
+            connection.execute("DELETE FROM units WHERE file = ?", (fileid,))
+            connection.execute(
+                "UPDATE files SET mtime = ?, size = ?, digest = ? WHERE id = ?",
+                (mtime, size, digest, fileid),
+            )
+        else:
+            fileid = connection.execute(
+                "INSERT INTO files (path, mtime, size, digest) VALUES (?, ?, ?, ?)",
+                (path, mtime, size, digest),
+            ).lastrowid
+        (start,) = connection.execute(
+            "SELECT COALESCE(MAX(id), 0) + 1 FROM units"
+        ).fetchone()
+        connection.executemany(
+            "INSERT INTO units (id, file, seq) VALUES (?, ?, ?)",
+            ((start + seq, fileid, seq) for seq in range(len(texts))),
+        )
+        connection.executemany(
+            "INSERT INTO texts (rowid, source, target, notes, locations) "
+            "VALUES (?, ?, ?, ?, ?)",
+            ((start + seq, *text) for seq, text in enumerate(texts)),
+        )
+
+    def search(self, query, parts=PARTS):
+        """
+        Finds the units that might match *query* in the given *parts*.
+
+        :param query: Alternatives of pieces, as returned by :func:`querypieces`.
+        :return: The numbers of the candidate units of every indexed file,
+            by the absolute path of the file.
+        """
+        expression = "{{{}}} : ({})".format(
+            " ".join(parts),
+            " OR ".join(
+                "({})".format(" AND ".join(_phrase(piece) for piece in pieces))
+                for pieces in query
+            ),
+        )
+        found = self.searches.get(expression)
+        if found is None:
+            found = self.searches[expression] = {}
+            for path, seq in self.connection.execute(
+                "SELECT files.path, units.seq FROM texts "
+                "JOIN units ON units.id = texts.rowid "
+                "JOIN files ON files.id = units.file "
+                "WHERE texts MATCH ?",
+                (expression,),
+            ):
+                found.setdefault(path, set()).add(seq)
+        return found
@@ -31,6 +31,9 @@ import math
 
 logger = logging.getLogger(__name__)
 
+#: The most distances that :func:`native_distances` keeps in memory at once
+MAX_DISTANCES = 1 << 22
+
 
 def python_distance(a, b, stopvalue=-1):
     """
@@ -72,7 +75,54 @@ def native_distance(a, b, stopvalue=0):
     return Levenshtein.distance(a, b)
 
 
+def native_distances(queries, choices, stopvalue):
+    """
+    Calculates the distances between every query and all the choices in one
+    call, using several threads if NumPy is available. The distances of as
+    many queries as fit in :data:`MAX_DISTANCES` are calculated at a time.
+
+    Returns a list with, for every query, a list of (index, distance) tuples
+    for the choices no further than stopvalue from it.
+    """
+    # NumPy is only loaded when needed, as it is slow to import
+    try:
+        import numpy as np  # ruff:ignore[import-outside-top-level]
+    except ImportError:
+        return [
+            [
+                (index, dist)
+                for _choice, dist, index in process.extract(
+                    query,
+                    choices,
+                    scorer=Levenshtein.distance,
+                    score_cutoff=stopvalue,
+                    limit=None,
+                )
+            ]
+            for query in queries
+        ]
+    results = []
+    rows = max(1, MAX_DISTANCES // max(1, len(choices)))
+    for start in range(0, len(queries), rows):
+        matrix = process.cdist(
+            queries[start : start + rows],
+            choices,
+            scorer=Levenshtein.distance,
+            score_cutoff=stopvalue,
+            workers=-1,
+        )
+        results.extend(
+            [
+                (int(index), int(row[index]))
+                for index in np.flatnonzero(row <= stopvalue)
+            ]
+            for row in matrix
+        )
+    return results
+
+
 try:
+    from rapidfuzz import process
     from rapidfuzz.distance import Levenshtein
 
     distance = native_distance
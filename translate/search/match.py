@@ -23,8 +23,12 @@ units.
 
 from __future__ import annotations
 
+import bisect
 import heapq
+import math
 import re
+from collections import Counter
+from itertools import chain
 from operator import itemgetter
 
 from translate.misc.multistring import multistring
@@ -37,6 +41,39 @@ def sourcelen(unit):
     return len(unit.source)
 
 
+NGRAM_LENGTH = 3
+# How many postings may be counted per candidate that would be compared
+# otherwise before the n-gram index is not worth using.
+NGRAM_SCAN_RATIO = 4
+
+
+def ngram_tokens(text):
+    """
+    Returns the character trigrams of text as a list of unique tokens.
+
+    Repeated trigrams are numbered so that the number of tokens shared by two
+    strings equals the size of the multiset intersection of their trigrams.
+    """
+    seen = {}
+    tokens = []
+    for i in range(len(text) - NGRAM_LENGTH + 1):
+        gram = text[i : i + NGRAM_LENGTH]
+        count = seen.get(gram, 0)
+        seen[gram] = count + 1
+        tokens.append(gram + str(count) if count else gram)
+    return tokens
+
+
+def required_ngrams(min_similarity, length):
+    """
+    Returns the number of trigrams two strings, the longest of the given
+    length, must at least share to be similar enough according to
+    :class:`~translate.search.lshtein.LevenshteinComparer`.
+    """
+    stopvalue = math.ceil((100.0 - min_similarity) / 100 * length)
+    return length - NGRAM_LENGTH + 1 - NGRAM_LENGTH * stopvalue
+
+
 def _sort_matches(matches, match_info) -> None:
     """
     This function will sort a list of matches according to the match's starting
@@ -54,6 +91,9 @@ class matcher:
     """
 
     sort_reverse = False
+    #: Counts the changes of the candidates, so that users can tell when
+    #: matches they remember might have changed
+    generation = 0
 
     def __init__(
         self,
@@ -63,18 +103,22 @@ class matcher:
         max_length=70,
         comparer=None,
         usefuzzy=False,
+        ngram_index=False,
     ) -> None:
         """
         max_candidates is the maximum number of candidates that should be
         assembled, min_similarity is the minimum similarity that must be
         attained to be included in the result, comparer is an optional Comparer
-        with similarity() function.
+        with similarity() function. If ngram_index is set, a trigram index of
+        the candidates is kept so that candidates which cannot reach the
+        required similarity are not passed to a Levenshtein comparer.
         """
         if comparer is None:
             comparer = lshtein.LevenshteinComparer(max_length)
         self.comparer = comparer
         self.setparameters(max_candidates, min_similarity, max_length)
         self.usefuzzy = usefuzzy
+        self.ngram_index = ngram_index
         self.inittm(store)
         self.addpercentage = True
 
@@ -100,6 +144,10 @@ class matcher:
         # reverse is deprecated - just use self.sort_reverse
         self.existingunits = {}
         self.candidates = base.TranslationStore()
+        self.ngrams = {}
+        self.ngramorder = None
+        self.sourceindex = None
+        self.generation += 1
 
         if isinstance(stores, base.TranslationStore):
             stores = [stores]
@@ -140,9 +188,87 @@ class matcher:
             simpleunit.addnote(candidate.getnotes(origin="translator"))
             simpleunit.fuzzy = candidate.isfuzzy()  # ty:ignore[unresolved-attribute]
             self.candidates.units.append(simpleunit)
+            if self.ngram_index:
+                self.indexunit(simpleunit)
+        self.ngramorder = None
+        self.sourceindex = None
+        self.generation += 1
         if sort:
             self.candidates.units.sort(key=sourcelen, reverse=self.sort_reverse)
 
+    def indexunit(self, unit) -> None:
+        """Adds the trigrams of the unit source to the n-gram index."""
+        key = id(unit)
+        for token in ngram_tokens(unit.source):
+            postings = self.ngrams.get(token)
+            if postings is None:
+                self.ngrams[token] = [key]
+            else:
+                postings.append(key)
+
+    def ngramcandidates(self, text, minimum, startindex, stoplength):
+        """
+        Returns the positions in the candidates list, starting from
+        startindex, of the candidates sharing enough trigrams with text,
+        together with the number of shared trigrams counted for them, or None
+        if scanning all candidates up to stoplength is expected to be cheaper.
+
+        Only candidates sharing at least minimum trigrams with text are of
+        interest, so they all contain at least one of the rarest
+        ``len(tokens) - minimum + 1`` trigrams of text, and only those are
+        counted. A candidate sharing n trigrams with text therefore has a count
+        of at least ``n - minimum + 1``.
+        """
+        if self.ngramorder is None:
+            self.ngramorder = {
+                id(unit): position
+                for position, unit in enumerate(self.candidates.units)
+            }
+        order = self.ngramorder
+        ngrams = self.ngrams
+        postings = [ngrams.get(token, ()) for token in ngram_tokens(str(text))]
+        postings.sort(key=len)
+        postings = postings[: len(postings) - minimum + 1]
+        # Counting is much cheaper than comparing, but with very common
+        # trigrams the postings can outgrow the candidates to be compared.
+        units = self.candidates.units
+        stopindex = len(units)
+        endindex = startindex
+        while endindex < stopindex:
+            mid = (endindex + stopindex) // 2
+            if sourcelen(units[mid]) <= stoplength:
+                endindex = mid + 1
+            else:
+                stopindex = mid
+        if sum(map(len, postings)) > NGRAM_SCAN_RATIO * (endindex - startindex):
+            return None
+        counts = Counter(chain.from_iterable(postings))
+        positions = sorted(
+            position for key in counts if (position := order[key]) >= startindex
+        )
+        return positions, counts
+
+    def exactcandidate(self, text):
+        """
+        Returns the candidate with *text* as its source when that is the only
+        match to find, or None if *text* has to be compared to the candidates.
+
+        An identical source is the best possible match, and the first one in
+        the candidates list wins the tie with any other identical sources.
+        This only holds when the strings are not truncated for comparing.
+        """
+        if (
+            self.MAX_CANDIDATES != 1
+            or not isinstance(self.comparer, lshtein.LevenshteinComparer)
+            or len(text) > min(self.MAX_LENGTH, self.comparer.MAX_LEN)
+        ):
+            return None
+        if self.sourceindex is None:
+            self.sourceindex = {}
+            for unit in self.candidates.units:
+                self.sourceindex.setdefault(str(unit.source), unit)
+        return self.sourceindex.get(str(text))
+
     def setparameters(
         self, max_candidates=10, min_similarity=75, max_length=70
     ) -> None:
@@ -179,7 +305,14 @@ class matcher:
                  *True* (default) the match quality is given as a
                  percentage in the notes.
         """
-        bestcandidates = [(0.0, None)] * self.MAX_CANDIDATES
+        exact = self.exactcandidate(text)
+        if exact is not None:
+            return self.buildunits([(100.0, exact)])
+
+        # The position in the candidates list breaks ties between equally
+        # similar candidates (favouring the earlier one), as units can not be
+        # compared
+        bestcandidates = [(0.0, 0, None)] * self.MAX_CANDIDATES
         # We use self.MIN_SIMILARITY, but if we already know we have max_candidates
         # that are better, we can adjust min_similarity upwards for speedup
         min_similarity = self.MIN_SIMILARITY
@@ -204,15 +337,47 @@ class matcher:
         stoplength = self.getstoplength(min_similarity, text)
         lowestscore = 0
 
-        for candidate in self.candidates.units[startindex:]:
+        # With the n-gram index, only consider candidates sharing enough
+        # trigrams with text to be within the Levenshtein distance allowed by
+        # min_similarity (q-gram lemma). The index is not used when the
+        # comparer might truncate the strings.
+        units = self.candidates.units
+        positions = range(startindex, len(units))
+        counts = None
+        textlength = len(text)
+        if (
+            self.ngram_index
+            and isinstance(self.comparer, lshtein.LevenshteinComparer)
+            and stoplength <= self.comparer.MAX_LEN
+        ):
+            minimum = min(
+                (
+                    required_ngrams(min_similarity, max(textlength, length))
+                    for length in range(math.ceil(startlength), int(stoplength) + 1)
+                ),
+                default=0,
+            )
+            if minimum > 0:
+                selected = self.ngramcandidates(text, minimum, startindex, stoplength)
+                if selected is not None:
+                    positions, counts = selected
+
+        for position in positions:
+            candidate = units[position]
             cmpstring = candidate.source
             if len(cmpstring) > stoplength:
                 break
+            if counts is not None:
+                required = required_ngrams(
+                    min_similarity, max(textlength, len(cmpstring))
+                )
+                if counts[id(candidate)] < required - minimum + 1:
+                    continue
             similarity = self.comparer.similarity(text, cmpstring, min_similarity)
             if similarity < min_similarity:
                 continue
             if similarity > lowestscore:
-                heapq.heapreplace(bestcandidates, (similarity, candidate))
+                heapq.heapreplace(bestcandidates, (similarity, -position, candidate))
                 lowestscore = bestcandidates[0][0]
                 if lowestscore >= 100:
                     break
@@ -223,9 +388,75 @@ class matcher:
         # Remove the empty ones:
         bestcandidates = [item for item in bestcandidates if item[0] != 0]
         # Sort for use as a general list, and reverse so the best one is at index 0
-        bestcandidates.sort(key=itemgetter(0), reverse=True)
+        bestcandidates.sort(key=itemgetter(0, 1), reverse=True)
+        bestcandidates = [(score, candidate) for score, _, candidate in bestcandidates]
         return self.buildunits(bestcandidates)
 
+    def matches_many(self, texts):
+        """
+        Returns lists of possible matches for several source texts.
+
+        The results are the same as calling :meth:`matches` for every text, but
+        with RapidFuzz available all texts of the same length are compared to
+        their candidates in one call.
+
+        :param texts: The texts that will be searched for in the translation
+                      memory
+        :return: a list with a list of units, as returned by :meth:`matches`,
+                 for every text
+        """
+        if lshtein.distance is not lshtein.native_distance or not isinstance(
+            self.comparer, lshtein.LevenshteinComparer
+        ):
+            return [self.matches(text) for text in texts]
+
+        results = [None] * len(texts)
+        bylength = {}
+        for i, text in enumerate(texts):
+            exact = self.exactcandidate(text)
+            if exact is not None:
+                results[i] = self.buildunits([(100.0, exact)])
+            else:
+                bylength.setdefault(len(text), []).append(i)
+
+        units = self.candidates.units
+        min_similarity = self.MIN_SIMILARITY
+        for textlength, indexes in bylength.items():
+            text = texts[indexes[0]]
+            startlength = self.getstartlength(min_similarity, text)
+            stoplength = self.getstoplength(min_similarity, text)
+            if not textlength or max(textlength, stoplength) > self.comparer.MAX_LEN:
+                # The comparer would truncate the strings
+                for i in indexes:
+                    results[i] = self.matches(texts[i])
+                continue
+            startindex = bisect.bisect_left(units, startlength, key=sourcelen)
+            endindex = bisect.bisect_right(units, stoplength, key=sourcelen)
+            window = units[startindex:endindex]
+            longest = max(textlength, math.floor(stoplength))
+            stopvalue = math.ceil((100.0 - min_similarity) / 100 * longest)
+            distances = lshtein.native_distances(
+                [texts[i] for i in indexes],
+                [candidate.source for candidate in window],
+                stopvalue,
+            )
+            for i, found in zip(indexes, distances, strict=True):
+                bestcandidates = []
+                for position, dist in found:
+                    candidate = window[position]
+                    # Same calculation as LevenshteinComparer.similarity_real
+                    l2 = max(textlength, len(candidate.source))
+                    similarity = 100 - (dist * 1.0 / l2) * 100
+                    if similarity >= min_similarity and similarity != 0:
+                        bestcandidates.append((similarity, -position, candidate))
+                bestcandidates = heapq.nlargest(
+                    self.MAX_CANDIDATES, bestcandidates, key=itemgetter(0, 1)
+                )
+                results[i] = self.buildunits(
+                    [(score, candidate) for score, _, candidate in bestcandidates]
+                )
+        return results
+
     def buildunits(self, candidates):
         """
         Builds a list of units conforming to base API, with the score
@@ -0,0 +1,213 @@
+#
+# Copyright 2026 Translate Toolkit contributors
+#
+# This file is part of the Translate Toolkit.
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+"""
+Persistent translation memory index.
+
+The index keeps the translation memory candidates of a set of TM files in an
+SQLite database, so that they don't have to be parsed again every time a
+:class:`~translate.search.match.matcher` is needed. TM files are only parsed
+again when their content changes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+
+from translate.misc.multistring import multistring
+from translate.search import match
+from translate.storage import base, factory
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    mtime INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    digest TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS units (
+    path TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    source TEXT NOT NULL,
+    target TEXT NOT NULL,
+    sources TEXT NOT NULL,
+    targets TEXT NOT NULL,
+    notes TEXT NOT NULL,
+    fuzzy INTEGER NOT NULL,
+    PRIMARY KEY (path, seq)
+);
+CREATE INDEX IF NOT EXISTS units_length ON units (length);
+"""
+
+# The candidates as matcher.inittm would build them: translated units with a
+# source of at least two characters, skipping units with the same translation
+# as the previous usable unit with the same source, sorted by source length.
+CANDIDATES = """
+SELECT source, target, sources, targets, notes, fuzzy
+FROM (
+    SELECT units.*, files.position,
+        LAG(units.targets) OVER (
+            PARTITION BY units.sources ORDER BY files.position, units.seq
+        ) AS previous
+    FROM units JOIN files ON units.path = files.path
+    WHERE units.length >= 2 AND (? OR NOT units.fuzzy)
+)
+WHERE previous IS NULL OR previous != targets
+ORDER BY length, position, seq
+"""
+
+
+def _strings(text):
+    """Returns all the strings of a possibly plural string."""
+    if isinstance(text, multistring):
+        return text.strings
+    return [text]
+
+
+def _digest(filename):
+    with open(filename, "rb") as handle:
+        return hashlib.file_digest(handle, "sha256").hexdigest()
+
+
+class TMIndex:
+    """Translation memory candidates stored in an SQLite database."""
+
+    def __init__(self, filename) -> None:
+        self.filename = filename
+        self.connection = sqlite3.connect(filename)
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            with self.connection:
+                self.connection.execute("DROP TABLE IF EXISTS files")
+                self.connection.execute("DROP TABLE IF EXISTS units")
+                self.connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self.connection.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def update(self, tmfiles):
+        """
+        Brings the index up to date with the given TM files.
+
+        Files are only parsed again if their content changed since they were
+        last indexed, and files that are no longer listed are dropped from the
+        index.
+
+        :return: The names of the files that were (re)indexed.
+        """
+        if isinstance(tmfiles, str):
+            tmfiles = [tmfiles]
+        paths = [os.path.abspath(tmfile) for tmfile in tmfiles]
+        indexed = []
+        with self.connection:
+            known = {
+                path: (mtime, size, digest)
+                for path, mtime, size, digest in self.connection.execute(
+                    "SELECT path, mtime, size, digest FROM files"
+                )
+            }
+            for path in set(known) - set(paths):
+                self.connection.execute("DELETE FROM units WHERE path = ?", (path,))
+                self.connection.execute("DELETE FROM files WHERE path = ?", (path,))
+            for position, path in enumerate(paths):
+                stat = os.stat(path)
+                mtime, size, digest = known.get(path, (None, None, None))
+                if (mtime, size) != (stat.st_mtime_ns, stat.st_size):
+                    current = _digest(path)
+                    if current != digest:
+                        digest = current
+                        self._indexfile(path)
+                        indexed.append(path)
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?)",
+                    (path, position, stat.st_mtime_ns, stat.st_size, digest),
+                )
+        return indexed
+
+    def _indexfile(self, path) -> None:
+        _store, units = factory.iterobject(path)
+        self.connection.execute("DELETE FROM units WHERE path = ?", (path,))
+        self.connection.executemany(
+            "INSERT INTO units VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                (
+                    path,
+                    seq,
+                    len(unit.source),
+                    str(unit.source),
+                    str(unit.target),
+                    json.dumps(_strings(unit.source)),
+                    json.dumps(_strings(unit.target)),
+                    unit.getnotes(origin="translator"),
+                    unit.isfuzzy(),
+                )
+                for seq, unit in enumerate(units)
+                if unit.source and unit.target
+            ),
+        )
+
+    def candidates(self, usefuzzy=False):
+        """
+        Returns the sorted simple units a :class:`~translate.search.match.matcher`
+        would build from the indexed TM files.
+        """
+        units = []
+        for source, target, sources, targets, notes, fuzzy in self.connection.execute(
+            CANDIDATES, (usefuzzy,)
+        ):
+            simpleunit = base.TranslationUnit(source)
+            simpleunit.target = target
+            sources = json.loads(sources)
+            if len(sources) > 1:
+                simpleunit.orig_source = multistring(sources)  # ty:ignore[unresolved-attribute]
+                simpleunit.orig_target = multistring(json.loads(targets))  # ty:ignore[unresolved-attribute]
+            simpleunit.addnote(notes)
+            simpleunit.fuzzy = bool(fuzzy)  # ty:ignore[unresolved-attribute]
+            units.append(simpleunit)
+        return units
+
+
+class tmindexmatcher(match.matcher):
+    """A matcher using the candidates from a :class:`TMIndex`."""
+
+    def inittm(self, tmindex, reverse=False) -> None:  # ty:ignore[invalid-method-override]
+        """Initialises the memory from the index instead of parsing stores."""
+        self.existingunits = {}
+        self.candidates = base.TranslationStore()
+        self.ngrams = {}
+        self.ngramorder = None
+        self.sourceindex = None
+        self.generation += 1
+        self.candidates.units = tmindex.candidates(self.usefuzzy)
+        if self.ngram_index:
+            for unit in self.candidates.units:
+                self.indexunit(unit)
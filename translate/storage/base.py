@@ -23,6 +23,7 @@ from __future__ import annotations
 import codecs
 import logging
 import os
+import sys
 from io import BytesIO
 from itertools import starmap
 from typing import (
@@ -41,13 +42,13 @@ from typing import (
 
 from translate.lang.data import get_cldr_plural_tags
 from translate.misc.multistring import multistring
-from translate.storage.placeables import StringElem
-from translate.storage.placeables import parse as rich_parse
 from translate.storage.workflow import StateEnum as states
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Generator
 
+    from translate.storage.placeables import StringElem
+
 logger = logging.getLogger(__name__)
 
 # Simple BOM based encoding detection
@@ -95,6 +96,14 @@ def is_path_input(value: object) -> TypeGuard[str | os.PathLike[str]]:
     return isinstance(value, (str, os.PathLike))
 
 
+def normalize_source(source: str) -> str:
+    """
+    Folds the case and whitespace of a source string, for finding units with
+    :meth:`TranslationStore.findnormalizedunit`.
+    """
+    return " ".join(str(source).split()).casefold()
+
+
 def path_input_str(value: str | os.PathLike[str]) -> str:
     """Convert a path-like value to a normalized string path."""
     return os.fspath(value)
@@ -309,6 +318,9 @@ class TranslationUnit:
              <StringElem([<StringElem(['bar'])>])>,
              <StringElem([<StringElem(['baz'])>])>]
         """
+        # The placeables are only loaded when rich strings are used
+        from translate.storage.placeables import parse as rich_parse  # ruff:ignore[import-outside-top-level]
+
         if isinstance(mulstring, multistring):
             return [rich_parse(s, self.rich_parsers) for s in mulstring.strings]
         return [rich_parse(mulstring, self.rich_parsers)]
@@ -322,6 +334,7 @@ class TranslationUnit:
         """Set the source string to the given value."""
         self._rich_source = None
         self._source = source
+        self._update_store_index()
 
     @property
     def target(self):
@@ -346,6 +359,8 @@ class TranslationUnit:
             raise ValueError("value must be iterable")
         if len(value) < 1:
             raise ValueError("value must have at least one element.")
+        from translate.storage.placeables import StringElem  # ruff:ignore[import-outside-top-level]
+
         if not isinstance(value[0], StringElem):
             raise TypeError("value[0] must be of type StringElem.")
         self._rich_source = list(value)
@@ -366,6 +381,8 @@ class TranslationUnit:
             raise ValueError("value must be iterable")
         if len(value) < 1:
             raise ValueError("value must have at least one element.")
+        from translate.storage.placeables import StringElem  # ruff:ignore[import-outside-top-level]
+
         if not isinstance(value[0], StringElem):
             raise TypeError("value[0] must be of type StringElem.")
         self._rich_target = list(value)
@@ -465,11 +482,35 @@ class TranslationUnit:
     def setcontext(self, context) -> None:
         """Set the message context."""
         self._context = context or ""
+        self._update_store_index()
+
+    def _update_store_index(self) -> None:
+        """
+        Updates the indexes of the store of this unit after its source,
+        context or locations were set.
+        """
+        if self._store is not None:
+            self._store.update_unit_index(self)
 
     def getpreviouscontext(self):
         """Get the context value suitable for previous-message metadata."""
         return self.getcontext()
 
+    def internstrings(self) -> None:
+        """
+        Interns the source and context strings of this unit.
+
+        This is used by stores with :attr:`TranslationStore.intern_strings`
+        set. Units which don't keep their strings in ``_source`` and
+        ``_context`` should override this.
+        """
+        source = getattr(self, "_source", None)
+        if type(source) is str:
+            self._source = sys.intern(source)
+        context = getattr(self, "_context", None)
+        if type(context) is str:
+            self._context = sys.intern(context)
+
     @property
     def prev_source(self):
         """Previous source text for fuzzy/reused units, if available."""
@@ -871,6 +912,12 @@ class TranslationStore(Generic[U]):
     default_encoding = "utf-8"
     sourcelanguage = None
     targetlanguage = None
+    intern_strings = False
+    """Indicates whether the source strings, contexts and ids of the units
+    added to the store are interned, so that stores loaded in the same
+    process share a single copy of identical strings. This helps tools which
+    load a template, the input and translation memories with mostly the same
+    strings. It is set per store with :meth:`internstrings`."""
 
     def __init__(self, unitclass=None, encoding=None) -> None:
         """Construct a blank TranslationStore."""
@@ -881,6 +928,12 @@ class TranslationStore(Generic[U]):
         self.locationindex = {}
         self.sourceindex = {}
         self.id_index = {}
+        #: Units by their source with case and whitespace folded, only built
+        #: once :meth:`findnormalizedunit` is used
+        self.normalizedsourceindex: dict[str, list[U]] | None = None
+        # The keys every unit is indexed with, so that it can be removed from
+        # the indexes after it changed
+        self._indexedkeys: dict[int, tuple] = {}
         self._plural_tags_cache: dict[tuple[str | None, int | None], list[str]] = {}
 
     @property
@@ -940,7 +993,12 @@ class TranslationStore(Generic[U]):
         :param unit: The unit that will be added.
         """
         unit._store = self
+        if self.intern_strings:
+            unit.internstrings()
         self.units.append(unit)
+        if self.id_index:
+            unit.index = len(self.units) - 1
+            self._indexunit(unit)
 
     def removeunit(self, unit: U) -> None:
         """
@@ -979,6 +1037,24 @@ class TranslationStore(Generic[U]):
             return self.sourceindex[source]
         return None
 
+    def findnormalizedunit(self, source: str) -> U | None:
+        """
+        Find the first unit with the given source string, ignoring
+        differences in case and whitespace.
+        """
+        self.require_index()
+        if self.normalizedsourceindex is None:
+            self.normalizedsourceindex = {}
+            for unit, _unitid, sources, _locations in self._indexedkeys.values():
+                for unitsource in sources:
+                    self.normalizedsourceindex.setdefault(
+                        normalize_source(unitsource), []
+                    ).append(unit)
+        units = self.normalizedsourceindex.get(normalize_source(source))
+        if units:
+            return units[0]
+        return None
+
     def translate(self, source: str) -> str | None:
         """Return the translated string for a given source string."""
         unit = self.findunit(source)
@@ -987,59 +1063,117 @@ class TranslationStore(Generic[U]):
         return None
 
     def remove_unit_from_index(self, unit) -> None:
-        """Remove a unit from source and locaton indexes."""
-
-        def remove_source(source) -> None:
-            if source in self.sourceindex:
-                self.sourceindex[source].remove(unit)
-                if len(self.sourceindex[source]) == 0:
-                    del self.sourceindex[source]
-
-        if unit.hasplural():
-            for source in unit.source.strings:
-                remove_source(source)
+        """Remove a unit from the indexes."""
+        keys = self._indexedkeys.pop(id(unit), None)
+        if keys is not None and keys[0] is unit:
+            _unit, unitid, sources, locations = keys
         else:
-            remove_source(unit.source)
-
-        for location in unit.getlocations():
-            if location in self.locationindex and self.locationindex[location] == unit:
+            unitid, sources, locations = self._getindexkeys(unit)
+        if unitid is not None and self.id_index.get(unitid) is unit:
+            del self.id_index[unitid]
+
+        def remove_source(index, source) -> None:
+            units = index.get(source)
+            if units is not None:
+                index[source] = [other for other in units if other is not unit]
+                if len(index[source]) == 0:
+                    del index[source]
+
+        for source in sources:
+            remove_source(self.sourceindex, source)
+            if self.normalizedsourceindex is not None:
+                remove_source(self.normalizedsourceindex, normalize_source(source))
+
+        for location in locations:
+            if self.locationindex.get(location) is unit:
                 del self.locationindex[location]
 
+    def _getindexkeys(self, unit) -> tuple:
+        """Returns the id, sources and locations *unit* is indexed with."""
+        unitid = unit.getid()
+        if self.intern_strings and type(unitid) is str:
+            unitid = sys.intern(unitid)
+        sources = unit.source.strings if unit.hasplural() else [unit.source]
+        if self.intern_strings:
+            sources = [
+                sys.intern(source) if type(source) is str else source
+                for source in sources
+            ]
+        return unitid, sources, unit.getlocations()
+
     def add_unit_to_index(self, unit) -> None:
         """Add a unit to source and location indices."""
-        self.id_index[unit.getid()] = unit
+        unitid, sources, locations = self._getindexkeys(unit)
+        self._indexedkeys[id(unit)] = (unit, unitid, sources, locations)
+        self.id_index[unitid] = unit
 
-        def insert_unit(source) -> None:
-            if source not in self.sourceindex:
-                self.sourceindex[source] = [unit]
+        def insert_unit(index, source) -> None:
+            if source not in index:
+                index[source] = [unit]
             else:
-                self.sourceindex[source].append(unit)
+                index[source].append(unit)
 
-        if unit.hasplural():
-            for source in unit.source.strings:
-                insert_unit(source)
-        else:
-            insert_unit(unit.source)
+        for source in sources:
+            insert_unit(self.sourceindex, source)
+            if self.normalizedsourceindex is not None:
+                insert_unit(self.normalizedsourceindex, normalize_source(source))
 
-        for location in unit.getlocations():
+        for location in locations:
             # If locations aren't unique, keep the first unit.
             if location not in self.locationindex:
                 # FIXME: maybe better store a list of units like sourceindex in
                 # case there are several units with the same location.
                 self.locationindex[location] = unit
 
+    def _indexunit(self, unit) -> None:
+        """Adds *unit* to the indexes, unless it is a header or blank."""
+        if unit.isheader() or unit.isblank():
+            # Remember the unit, so that it is indexed once it gets a source
+            self._indexedkeys[id(unit)] = (unit, None, (), ())
+        else:
+            self.add_unit_to_index(unit)
+
+    def update_unit_index(self, unit) -> None:
+        """
+        Updates the indexes after the source, context or locations of *unit*
+        changed.
+
+        Units call this when these are set through their setters, changes
+        made in other ways need :meth:`makeindex`.
+        """
+        keys = self._indexedkeys.get(id(unit))
+        if keys is not None and keys[0] is unit:
+            self.remove_unit_from_index(unit)
+            self._indexunit(unit)
+
+    def internstrings(self) -> None:
+        """
+        Interns the strings of the units in this store, and of the units
+        added later, see :attr:`intern_strings`.
+        """
+        self.intern_strings = True
+        for unit in self.units:
+            unit.internstrings()
+        if self.id_index:
+            self.makeindex()
+
     def makeindex(self) -> None:
         """
         Indexes the items in this store. At least .sourceindex should be
         useful.
+
+        The indexes are kept up to date as units are added, removed or
+        changed afterwards.
         """
         self.locationindex = {}
         self.sourceindex = {}
         self.id_index = {}
+        self._indexedkeys = {}
+        if self.normalizedsourceindex is not None:
+            self.normalizedsourceindex = {}
         for index, unit in enumerate(self.units):
             unit.index = index
-            if not (unit.isheader() or unit.isblank()):
-                self.add_unit_to_index(unit)
+            self._indexunit(unit)
 
     def require_index(self) -> None:
         """Make sure source index exists."""
@@ -23,10 +23,16 @@ from __future__ import annotations
 import os
 from functools import lru_cache
 from importlib import import_module
-from typing import BinaryIO
+from itertools import chain
+from typing import TYPE_CHECKING, BinaryIO
 
 from translate.storage.base import TranslationStore
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from translate.storage.base import TranslationUnit
+
 # TODO: Monolingual formats (with template?)
 
 decompressclass = {
@@ -210,22 +216,13 @@ def getclass(
     return storeclass
 
 
-def getobject(
-    storefile: str | TranslationStore | BinaryIO,
-    localfiletype: str | None = None,
-    ignore: str | None = None,
-    classes: dict | None = None,
-    classes_str: dict | None = None,
-    hiddenclasses: dict | None = None,
-) -> TranslationStore:
+def _getclassandfile(
+    storefile, localfiletype, ignore, classes, classes_str, hiddenclasses
+):
     """
-    Factory that returns a usable object for the type of file presented.
-    :param storefile: File object or file name.
-
-    Specify ignore to ignore some part at the back of the name (like .gz).
+    Returns the class for the file presented, its name, and the file to
+    parse, or None if there is nothing to parse.
     """
-    if isinstance(storefile, TranslationStore):
-        return storefile
     if classes_str is None:
         classes_str = _classes_str
     if hiddenclasses is None:
@@ -246,19 +243,98 @@ def getobject(
         classes_str=classes_str,
         hiddenclasses=hiddenclasses,
     )
-    if os.path.exists(storefilename) or not getattr(storefile, "closed", True):
-        _name, ext = os.path.splitext(storefilename)
-        ext = ext[len(os.path.extsep) :].lower()
-        if ext in decompressclass:
-            file = import_class(*decompressclass[ext])
-            storefile = file(storefilename)
+    if not os.path.exists(storefilename) and getattr(storefile, "closed", True):
+        return storeclass, storefilename, None
+    _name, ext = os.path.splitext(storefilename)
+    ext = ext[len(os.path.extsep) :].lower()
+    if ext in decompressclass:
+        file = import_class(*decompressclass[ext])
+        storefile = file(storefilename)
+    return storeclass, storefilename, storefile
+
+
+def getobject(
+    storefile: str | TranslationStore | BinaryIO,
+    localfiletype: str | None = None,
+    ignore: str | None = None,
+    classes: dict | None = None,
+    classes_str: dict | None = None,
+    hiddenclasses: dict | None = None,
+    intern_strings: bool = False,
+) -> TranslationStore:
+    """
+    Factory that returns a usable object for the type of file presented.
+    :param storefile: File object or file name.
+    :param intern_strings: Whether the store interns the strings of its
+        units, see :meth:`~translate.storage.base.TranslationStore.internstrings`.
+
+    Specify ignore to ignore some part at the back of the name (like .gz).
+    """
+    if isinstance(storefile, TranslationStore):
+        return storefile
+    storeclass, storefilename, storefile = _getclassandfile(
+        storefile, localfiletype, ignore, classes, classes_str, hiddenclasses
+    )
+    if storefile is not None:
         store = storeclass.parsefile(storefile)
     else:
         store = storeclass()
         store.filename = storefilename
+    if intern_strings:
+        store.internstrings()
     return store
 
 
+def iterobject(
+    storefile: str | TranslationStore | BinaryIO,
+    localfiletype: str | None = None,
+    ignore: str | None = None,
+    classes: dict | None = None,
+    classes_str: dict | None = None,
+    hiddenclasses: dict | None = None,
+    intern_strings: bool = False,
+) -> tuple[TranslationStore, Iterator[TranslationUnit]]:
+    """
+    Factory that returns an object for the type of file presented, like
+    :func:`getobject`, together with an iterator over its units.
+
+    Files of formats which can be parsed incrementally, like PO, are only
+    parsed while iterating over the units, and are never held in memory as a
+    whole. The returned store then holds just the header.
+    """
+    if isinstance(storefile, TranslationStore):
+        return storefile, iter(storefile.units)
+    storeclass, storefilename, storefile = _getclassandfile(
+        storefile, localfiletype, ignore, classes, classes_str, hiddenclasses
+    )
+    if storefile is not None and not hasattr(storeclass, "iterparse"):
+        store = storeclass.parsefile(storefile)
+        if intern_strings:
+            store.internstrings()
+        return store, iter(store.units)
+    store = storeclass()
+    store.filename = storefilename
+    if intern_strings:
+        store.internstrings()
+    if storefile is None:
+        return store, iter(store.units)
+    if isinstance(storefile, str):
+        units = store.iterparse(storefile)
+    else:
+        units = _iterparsehandle(store, storefile)
+    # Parse up to the header, so that the store is set up as for getobject
+    first = next(units, None)
+    if first is None:
+        return store, iter(())
+    return store, chain([first], units)
+
+
+def _iterparsehandle(store, storehandle):
+    """Parses a file object incrementally, closing it like ``parsefile`` does."""
+    with storehandle:
+        yield from store.iterparse(storehandle)
+
+
 supported = [
     (
         "Gettext PO file",
@@ -358,9 +358,7 @@ class MultilingualLISAunit(LISAunit):
             if hasattr(store, "_invalidate_indexes"):
                 store._invalidate_indexes()
             else:
-                store.locationindex = {}
-                store.sourceindex = {}
-                store.id_index = {}
+                store.update_unit_index(self)
 
     def setsource(self, text, sourcelang=None) -> None:
         super().setsource(text, sourcelang or self._get_source_language() or "en")
@@ -538,9 +536,10 @@ class LISAfile(base.TranslationStore[U]):
                     qname = etree.QName(node)
                     if qname.namespace == old_ns:
                         node.tag = namespaced(self.namespace, qname.localname)
-        super().addunit(unit)
         if new:
             self.body.append(unit.xmlelement)  # ty:ignore[unresolved-attribute]
+        # Index the unit once it is in the document, as its id may depend on it
+        super().addunit(unit)
 
     def removeunit(self, unit) -> None:
         super().removeunit(unit)
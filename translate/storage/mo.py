@@ -42,6 +42,9 @@ in very small files.
 from __future__ import annotations
 
 import array
+import bisect
+import itertools
+import mmap
 import re
 import struct
 
@@ -67,6 +70,57 @@ def hashpjw(str_param):
     return hval
 
 
+def hash_keys(keys, hash_size):
+    """
+    Hashes the keys for a hash table of *hash_size*, like :func:`hashpjw`.
+
+    :return: The positions in the hash table to start looking at for every
+        key, and the increments to look further with.
+    """
+    try:
+        import numpy as np  # ruff:ignore[import-outside-top-level]
+    except ImportError:
+        hashes = [hashpjw(key) for key in keys]
+        return (
+            [hash_value % hash_size for hash_value in hashes],
+            [1 + (hash_value % (hash_size - 2)) for hash_value in hashes],
+        )
+    # Work on one byte of all keys at once, with the keys sorted by length so
+    # the keys still being hashed come first. Like hashpjw, a key is hashed up
+    # to its first NUL.
+    data = np.frombuffer(b"".join(keys), dtype=np.uint8)
+    ends = np.cumsum(np.fromiter(map(len, keys), dtype=np.int64, count=len(keys)))
+    starts = np.empty_like(ends)
+    starts[:1] = 0
+    starts[1:] = ends[:-1]
+    nuls = np.append(np.flatnonzero(data == 0), len(data))
+    lengths = np.minimum(nuls[np.searchsorted(nuls, starts)], ends) - starts
+    order = np.argsort(-lengths, kind="stable")
+    starts = starts[order]
+    active = np.searchsorted(-lengths[order], -np.arange(lengths.max(initial=0)))
+    # The hash value can grow beyond 64 bits, so the bits above 32 bits are
+    # only kept modulo the sizes used, once there are any
+    moduli = np.array([[hash_size], [hash_size - 2]], dtype=np.uint64)
+    low = np.zeros(len(keys), dtype=np.uint64)
+    high = np.zeros((2, len(keys)), dtype=np.uint64)
+    overflow = False
+    for i, count in enumerate(active.tolist()):
+        hash_value = (low[:count] << 4) + data[starts[:count] + i]
+        carry = hash_value >> 32
+        if overflow or carry.any():
+            overflow = True
+            high[:, :count] = (high[:, :count] * 16 + carry) % moduli
+            hash_value &= 0xFFFFFFFF
+        g = hash_value & 0xF0000000
+        low[:count] = hash_value ^ (g >> 24) ^ g
+    hashes = (high * (2**32 % moduli) + low) % moduli
+    cursors = np.empty(len(keys), dtype=np.uint64)
+    increments = np.empty(len(keys), dtype=np.uint64)
+    cursors[order] = hashes[0]
+    increments[order] = hashes[1] + 1
+    return cursors.tolist(), increments.tolist()
+
+
 def get_next_prime_number(start):
     # find the smallest prime number that is greater or equal "start"
     # this is based on hash lib implementation in gettext
@@ -138,18 +192,6 @@ class mofile(poheader.poheader, base.TranslationStore):
         """Output a string representation of the MO data file."""
         # check the header of this file for the copyright note of this function
 
-        def add_to_hash_table(string, i) -> None:
-            hash_value = hashpjw(string)
-            hash_cursor = hash_value % hash_size
-            increment = 1 + (hash_value % (hash_size - 2))
-            while hash_table[hash_cursor] != 0:
-                hash_cursor += increment
-                hash_cursor %= hash_size
-            hash_table[hash_cursor] = i + 1
-
-        def lst_encode(lst, join_char=b""):
-            return join_char.join([i.encode("utf-8") for i in lst])
-
         # hash_size should be the smallest prime number that is greater
         # or equal (4 / 3 * N) - where N is the number of keys/units.
         # see gettext-0.17:gettext-tools/src/write-mo.c:406
@@ -161,51 +203,62 @@ class mofile(poheader.poheader, base.TranslationStore):
             # If the unit is not translated, we should rather omit it entirely
             if not unit.istranslated():
                 continue
-            if isinstance(unit.source, multistring):
-                source = lst_encode(unit.msgidcomments) + lst_encode(
-                    unit.source.strings, b"\0"
-                )
-            else:
-                source = lst_encode(unit.msgidcomments) + unit.source.encode("utf-8")
+            source = unit.source
+            if isinstance(source, multistring):
+                source = "\0".join(source.strings)
+            if unit.msgidcomments:
+                source = "".join(unit.msgidcomments) + source
             if unit.msgctxt:
-                source = lst_encode(unit.msgctxt) + b"\x04" + source
-            if isinstance(unit.target, multistring):
-                target = lst_encode(unit.target.strings, b"\0")
+                source = "".join(unit.msgctxt) + "\x04" + source
+            target = unit.target
+            if not target:
+                continue
+            if isinstance(target, multistring):
+                target = "\0".join(target.strings)
             elif unit.isheader():
                 # Support for "reproducible builds": Delete information that
                 # may vary between builds in the same conditions.
-                target = POT_HEADER.sub("", unit.target).encode("utf-8")
-            else:
-                target = unit.target.encode("utf-8")
-            if unit.target:
-                MESSAGES[source] = target
-        # using "I" works for 32- and 64-bit systems, but not for 16-bit!
-        hash_table = array.array("I", [0] * hash_size)
+                target = POT_HEADER.sub("", target)
+            MESSAGES[source.encode("utf-8")] = target.encode("utf-8")
         # the keys are sorted in the .mo file
         keys = sorted(MESSAGES.keys())
-        offsets = []
-        ids = strs = b""
-        for i, id in enumerate(keys):
-            # For each string, we need size and file offset.  Each string is
-            # NUL terminated; the NUL does not count into the size.
-            # TODO: We don't do any encoding detection from the PO Header
-            add_to_hash_table(id, i)
-            string = MESSAGES[id]  # id already encoded for use as dictionary key
-            offsets.append((len(ids), len(id), len(strs), len(string)))
-            ids = ids + id + b"\0"
-            strs = strs + string + b"\0"
+        values = [MESSAGES[key] for key in keys]
+        # using "I" works for 32- and 64-bit systems, but not for 16-bit!
+        hash_table = array.array("I", bytes(4 * hash_size))
+        cursors, increments = hash_keys(keys, hash_size)
+        for i, (hash_cursor, increment) in enumerate(
+            zip(cursors, increments, strict=True)
+        ):
+            while hash_table[hash_cursor] != 0:
+                hash_cursor += increment
+                hash_cursor %= hash_size
+            hash_table[hash_cursor] = i + 1
+        # For each string, we need size and file offset.  Each string is
+        # NUL terminated; the NUL does not count into the size.
+        # TODO: We don't do any encoding detection from the PO Header
+        ids = b"".join(key + b"\0" for key in keys)
+        strs = b"".join(value + b"\0" for value in values)
         # The header is 7 32-bit unsigned integers
         keystart = 7 * 4 + 16 * len(keys) + hash_size * 4
         # and the values start after the keys
         valuestart = keystart + len(ids)
-        koffsets = []
-        voffsets = []
         # The string table first has the list of keys, then the list of values.
         # Each entry has first the size of the string, then the file offset.
-        for o1, l1, o2, l2 in offsets:
-            koffsets = [*koffsets, l1, o1 + keystart]
-            voffsets = [*voffsets, l2, o2 + valuestart]
-        offsets = koffsets + voffsets
+        offsets = array.array("i")
+        for strings, start in ((keys, keystart), (values, valuestart)):
+            lengths = array.array("i", map(len, strings))
+            table = array.array("i", bytes(8 * len(strings)))
+            table[::2] = lengths
+            table[1::2] = array.array(
+                "i",
+                itertools.islice(
+                    itertools.accumulate(
+                        (length + 1 for length in lengths), initial=start
+                    ),
+                    len(strings),
+                ),
+            )
+            offsets.extend(table)
         out.write(
             struct.pack(
                 "Iiiiiii",
@@ -220,7 +273,7 @@ class mofile(poheader.poheader, base.TranslationStore):
         )
         # additional data is not necessary for empty mo files
         if len(keys) > 0:
-            out.write(array.array("i", offsets).tobytes())
+            out.write(offsets.tobytes())
             out.write(hash_table.tobytes())
             out.write(ids)
             out.write(strs)
@@ -282,34 +335,243 @@ class mofile(poheader.poheader, base.TranslationStore):
                 f"Unable to process version {version_maj}.{version_min} MO files"
             )
         for i in range(lenkeys):
-            nextkey = startkey + (i * 2 * 4)
-            nextvalue = startvalue + (i * 2 * 4)
-            klength, koffset = struct.unpack(
-                f"{endian}ii", content[nextkey : nextkey + (2 * 4)]
+            self.addunit(self._readunit(content, endian, startkey, startvalue, i))
+
+    def _readunit(self, content, endian, startkey, startvalue, i) -> mounit:
+        """Creates the unit for message *i*, taking the encoding from the header."""
+        nextkey = startkey + (i * 2 * 4)
+        nextvalue = startvalue + (i * 2 * 4)
+        klength, koffset = struct.unpack(
+            f"{endian}ii", content[nextkey : nextkey + (2 * 4)]
+        )
+        vlength, voffset = struct.unpack(
+            f"{endian}ii", content[nextvalue : nextvalue + (2 * 4)]
+        )
+        source = content[koffset : koffset + klength]
+        context = None
+        if b"\x04" in source:
+            context, source = source.split(b"\x04")
+        # Still need to handle KDE comments
+        if not source:
+            charset = re.search(
+                rb"charset=([^\s]+)", content[voffset : voffset + vlength]
             )
-            vlength, voffset = struct.unpack(
-                f"{endian}ii", content[nextvalue : nextvalue + (2 * 4)]
+            if charset:
+                self.encoding = charset.group(1).decode()
+        source = multistring([s.decode(self.encoding) for s in source.split(b"\0")])
+        target = multistring(
+            [
+                s.decode(self.encoding)
+                for s in content[voffset : voffset + vlength].split(b"\0")
+            ]
+        )
+        newunit = mounit(source)
+        newunit.target = target
+        if context is not None:
+            newunit.msgctxt.append(context.decode(self.encoding))
+        return newunit
+
+
+class lazymofile(mofile):
+    """
+    A .mo file whose messages are only read when they are needed.
+
+    The file is memory mapped rather than read. :meth:`findunit`,
+    :meth:`findid` and :meth:`translate` find messages like :class:`mofile`
+    does, but through an index of the keys of the file, so that opening a
+    large catalog to look up a few messages only creates the units found.
+    The header is found through the hash table of the file. All units are
+    created when they are accessed, after which lookups use them as in
+    :class:`mofile`.
+    """
+
+    def __init__(self, inputfile=None, **kwargs) -> None:
+        self._units = []
+        # The content and header of the file while the units aren't created
+        self._content = b""
+        self._table = None
+        # The units already looked up, by their message number
+        self._found = {}
+        # The message numbers by source and by id, see _getindexes
+        self._indexes = None
+        super().__init__(**kwargs)
+        if inputfile is not None:
+            self.parse(inputfile)
+
+    @property
+    def units(self):
+        if self._table is not None:
+            table, self._table = self._table, None
+            endian, lenkeys, startkey, startvalue, _sizehash, _offsethash = table
+            for i in range(lenkeys):
+                unit = self._found.pop(i, None)
+                if unit is None:
+                    unit = self._readunit(
+                        self._content, endian, startkey, startvalue, i
+                    )
+                self.addunit(unit)
+            self._found = {}
+            self._indexes = None
+            self._close()
+        return self._units
+
+    @units.setter
+    def units(self, units) -> None:
+        self._table = None
+        self._found = {}
+        self._indexes = None
+        self._close()
+        self._units = units
+
+    def _close(self) -> None:
+        if isinstance(self._content, mmap.mmap):
+            self._content.close()
+        self._content = b""
+
+    @classmethod
+    def _from_handle(cls, storehandle):
+        newstore = cls()
+        newstore.parse(storehandle)
+        newstore.fileobj = storehandle
+        newstore._assignname()
+        return newstore
+
+    def parse(self, input) -> None:  # ty:ignore[invalid-method-override]
+        """Parses the given file, file name or file source string."""
+        self.units = []
+        if isinstance(input, str):
+            self.filename = input
+            with open(input, "rb") as inputfile:
+                self.parse(inputfile)
+            return
+        if hasattr(input, "name"):
+            self.filename = input.name
+        elif not getattr(self, "filename", ""):
+            self.filename = ""
+        content = input
+        if hasattr(input, "read"):
+            try:
+                content = mmap.mmap(input.fileno(), 0, access=mmap.ACCESS_READ)
+            except (AttributeError, OSError, ValueError):
+                # Not a file on disk, or an empty one
+                content = input.read()
+            input.close()
+        (
+            endian,
+            version_maj,
+            version_min,
+            lenkeys,
+            startkey,
+            startvalue,
+            sizehash,
+            offsethash,
+        ) = self.parse_header(content)
+        if version_maj >= 1:
+            raise base.ParseError(
+                f"Unable to process version {version_maj}.{version_min} MO files"
             )
-            source = content[koffset : koffset + klength]
-            context = None
-            if b"\x04" in source:
-                context, source = source.split(b"\x04")
-            # Still need to handle KDE comments
-            if not source:
-                charset = re.search(
-                    rb"charset=([^\s]+)", content[voffset : voffset + vlength]
+        self._content = content
+        self._table = (endian, lenkeys, startkey, startvalue, sizehash, offsethash)
+        # Looking up the header sets the encoding
+        self._findmessage(b"")
+
+    def _getrawkey(self, i) -> bytes:
+        """Returns the key of message *i*, with its context and plural source."""
+        endian, _lenkeys, startkey, _startvalue, _sizehash, _offsethash = self._table
+        length, offset = struct.unpack_from(
+            f"{endian}ii", self._content, startkey + 8 * i
+        )
+        return self._content[offset : offset + length]
+
+    def _getkey(self, i) -> bytes:
+        """Returns the key of message *i* up to the plural source."""
+        return self._getrawkey(i).split(b"\0", 1)[0]
+
+    def _getindexes(self) -> tuple[dict[bytes, int], dict[bytes, int]]:
+        """
+        Returns the message numbers by encoded source and id.
+
+        Like the indexes of :class:`mofile`, a source finds the first message
+        with it as its (singular) source, and an id the last one, whatever
+        their context. The header is not indexed.
+        """
+        if self._indexes is None:
+            sourceindex = {}
+            idindex = {}
+            for i in range(self._table[1]):
+                sources = self._getrawkey(i).split(b"\x04", 1)[-1].split(b"\0")
+                if not any(sources):
+                    # Headers aren't indexed
+                    continue
+                sourceindex.setdefault(sources[0], i)
+                idindex[sources[0]] = i
+            self._indexes = (sourceindex, idindex)
+        return self._indexes
+
+    def _findindex(self, key) -> int | None:
+        """Returns the number of the message with *key*, or None."""
+        endian, lenkeys, _startkey, _startvalue, sizehash, offsethash = self._table
+        if sizehash > 2:
+            # Gettext hashes the key up to the plural source
+            hash_value = hashpjw(key)
+            hash_cursor = hash_value % sizehash
+            increment = 1 + (hash_value % (sizehash - 2))
+            for _probe in range(sizehash):
+                (entry,) = struct.unpack_from(
+                    f"{endian}I", self._content, offsethash + 4 * hash_cursor
                 )
-                if charset:
-                    self.encoding = charset.group(1).decode()
-            source = multistring([s.decode(self.encoding) for s in source.split(b"\0")])
-            target = multistring(
-                [
-                    s.decode(self.encoding)
-                    for s in content[voffset : voffset + vlength].split(b"\0")
-                ]
-            )
-            newunit = mounit(source)
-            newunit.target = target
-            if context is not None:
-                newunit.msgctxt.append(context.decode(self.encoding))
-            self.addunit(newunit)
+                if entry == 0:
+                    return None
+                if entry <= lenkeys and self._getkey(entry - 1) == key:
+                    return entry - 1
+                hash_cursor = (hash_cursor + increment) % sizehash
+            return None
+        # Without a hash table, rely on the keys being sorted
+        i = bisect.bisect_left(range(lenkeys), key, key=self._getkey)
+        if i < lenkeys and self._getkey(i) == key:
+            return i
+        return None
+
+    def _getunit(self, i) -> mounit:
+        """Returns the unit of message *i*, creating it if needed."""
+        unit = self._found.get(i)
+        if unit is None:
+            endian, _lenkeys, startkey, startvalue, _sizehash, _offsethash = self._table
+            unit = self._readunit(self._content, endian, startkey, startvalue, i)
+            unit._store = self
+            self._found[i] = unit
+        return unit
+
+    def _findmessage(self, key) -> mounit | None:
+        """Returns the unit of the message with *key*, or None."""
+        i = self._findindex(key)
+        if i is None:
+            return None
+        return self._getunit(i)
+
+    def _lookup(self, text, index) -> mounit | None:
+        try:
+            key = text.encode(self.encoding)
+        except UnicodeEncodeError:
+            return None
+        i = index.get(key)
+        if i is None:
+            return None
+        return self._getunit(i)
+
+    def findunit(self, source: str) -> mounit | None:
+        """Find the unit with the given source string."""
+        if self._table is None:
+            return super().findunit(source)
+        return self._lookup(source, self._getindexes()[0])
+
+    def findid(self, id):
+        """Find the unit with the given id."""
+        if self._table is None:
+            return super().findid(id)
+        return self._lookup(id, self._getindexes()[1])
+
+    def header(self):
+        if self._table is None:
+            return super().header()
+        return self._findmessage(b"")
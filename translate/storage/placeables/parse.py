@@ -44,9 +44,8 @@ def parse(
 
     An over-simplification of the algorithm: the leaves in the ``StringElem``
     tree are expanded to the output of the first parsing function in
-    ``parse_funcs``. The next level of recursion is then started on the new
-    set of leaves with the used parsing function removed from
-    ``parse_funcs``.
+    ``parse_funcs`` that parses them. The new set of leaves is then parsed
+    with the parsing functions after the used one.
 
     :param tree: The string or string element sub-tree to parse.
     :param parse_funcs: A list of parsing functions. Each function takes
@@ -59,9 +58,18 @@ def parse(
         tree = StringElem(tree)
     if not parse_funcs:
         return tree
+    return _parse(tree, parse_funcs, 0)
 
-    parse_func = parse_funcs[0]
 
+def _parse(tree, parse_funcs, start):
+    """
+    Parses the leaves of *tree* with the parsing functions from *start* on.
+
+    Instead of recursing once for every parsing function, the functions are
+    tried on every leaf in turn until one of them parses it. The parts of the
+    leaf are then parsed with the functions after that one, which gives the
+    same tree in a single walk over it.
+    """
     for leaf in tree.flatten():
         # FIXME: we might rather want to test for editability, but for now this
         # works better
@@ -72,7 +80,14 @@ def parse(
         if not unileaf:
             continue
 
-        subleaves = parse_func(unileaf)
+        subleaves = None
+        index = start
+        while index < len(parse_funcs):
+            subleaves = parse_funcs[index](unileaf)
+            if subleaves is not None:
+                break
+            index += 1
+
         if subleaves is not None:
             if (
                 len(subleaves) == 1
@@ -93,7 +108,7 @@ def parse(
             else:
                 leaf.sub = subleaves
 
-        parse(leaf, parse_funcs[1:])
+            _parse(leaf, parse_funcs, index + 1)
 
         if isinstance(leaf, StringElem):
             leaf.prune()
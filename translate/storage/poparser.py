@@ -40,7 +40,7 @@ from collections import defaultdict
 from typing import TYPE_CHECKING, cast
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable, Iterator
 
     from .pypo import pofile, pounit
 
@@ -61,10 +61,43 @@ class PoParseError(ValueError):
         )
 
 
+class LineBuffer:
+    """
+    Lines of an input read on demand, for parsing input which is not in memory.
+
+    The lines can be looked up by their index like in a list, but only the
+    lines which were not released yet are kept.
+    """
+
+    def __init__(self, lines: Iterable[bytes] | Iterable[str]) -> None:
+        self._lines = iter(lines)
+        self._buffer: list = []
+        # Index of the first line in the buffer
+        self._offset = 0
+
+    def __getitem__(self, index: int) -> bytes | str:
+        index -= self._offset
+        if index < 0:
+            raise ValueError(f"Line {index + self._offset} was already released")
+        buffer = self._buffer
+        while index >= len(buffer):
+            try:
+                buffer.append(next(self._lines))
+            except StopIteration:
+                raise IndexError(index + self._offset) from None
+        return buffer[index]
+
+    def release(self, index: int) -> None:
+        """Drops the lines before *index*, which won't be looked at anymore."""
+        if index > self._offset:
+            del self._buffer[: index - self._offset]
+            self._offset = index
+
+
 class PoParseState:
     def __init__(
         self,
-        input_lines: list[bytes] | list[str],
+        input_lines: list[bytes] | list[str] | LineBuffer,
         UnitClass: Callable[[], pounit],
         encoding: str | None = None,
     ) -> None:
@@ -105,6 +138,7 @@ class PoParseState:
                 error_line=self.charset_line,
             ) from error
         self.encoding = encoding
+        self._current_encoding = encoding
         self.next_line = ""
         self.lineno = 0
         self.eof = False
@@ -151,6 +185,11 @@ class PoParseState:
                 self.next_line = next_line
         return current
 
+    def release_lines(self) -> None:
+        """Releases the lines before the current one if the input allows it."""
+        if isinstance(self._input_lines, LineBuffer) and not self.eof:
+            self._input_lines.release(self.lineno - 1)
+
     def new_input(self, input_lines: list[bytes] | list[str]) -> PoParseState:
         return PoParseState(input_lines, self.UnitClass, self.encoding)
 
@@ -317,13 +356,19 @@ def parse_message(
 
 
 def parse_msgctxt(parse_state: PoParseState, unit: pounit) -> bool:
+    # Most units have no context, avoid creating an empty list for them
+    if not parse_state.next_line.startswith("msgctxt"):
+        return False
     parse_message(parse_state, "msgctxt", 7, unit.msgctxt)
     return len(unit.msgctxt) > 0
 
 
 def parse_msgid(parse_state: PoParseState, unit: pounit) -> bool:
-    parse_message(parse_state, "msgid", 5, unit.msgid, unit.msgidcomments)
-    return len(unit.msgid) > 0 or len(unit.msgidcomments) > 0
+    msgidcomments: list[str] = []
+    parse_message(parse_state, "msgid", 5, unit.msgid, msgidcomments)
+    if msgidcomments:
+        unit.msgidcomments.extend(msgidcomments)
+    return len(unit.msgid) > 0 or len(msgidcomments) > 0
 
 
 def parse_msgstr(parse_state: PoParseState, unit: pounit) -> bool:
@@ -436,12 +481,24 @@ def parse_header(parse_state: PoParseState, store: pofile) -> pounit | None:
     return parse_unit(parse_state)
 
 
-def parse_units(parse_state: PoParseState, store: pofile) -> None:
+def iterparse_units(parse_state: PoParseState, store: pofile) -> Iterator[pounit]:
+    """
+    Parses the units one by one, yielding each one as soon as it is parsed.
+
+    The header is used to configure *store*, but the units are not added to
+    it. The lines of the parsed units are released as parsing goes on.
+    """
     unit = parse_header(parse_state, store)
     while unit:
         if not unit.obsolete:
             unit.infer_state()
-        store.addunit(unit)
+        yield unit
+        parse_state.release_lines()
         unit = parse_unit(parse_state)
     if not parse_state.eof:
         raise PoParseError(parse_state)
+
+
+def parse_units(parse_state: PoParseState, store: pofile) -> None:
+    for unit in iterparse_units(parse_state, store):
+        store.addunit(unit)
@@ -135,8 +135,6 @@ from copy import deepcopy
 from dataclasses import dataclass
 from typing import TypeVar
 
-from lxml import etree
-
 from translate.lang import data
 from translate.misc.multistring import multistring
 from translate.misc.quote import (
@@ -148,7 +146,6 @@ from translate.misc.quote import (
     xwiki_properties_decode,
     xwiki_properties_encode,
 )
-from translate.misc.xml_helpers import get_safe_xml_parser
 from translate.storage import base
 
 labelsuffixes = (".label", ".title")
@@ -1457,6 +1454,9 @@ class XWikiPageProperties(xwikifile):
 
     @staticmethod
     def get_parser():
+        # lxml is only loaded for the XWiki formats
+        from translate.misc.xml_helpers import get_safe_xml_parser  # ruff:ignore[import-outside-top-level]
+
         return get_safe_xml_parser(strip_cdata=False)
 
     def extract_language(self) -> None:
@@ -1469,6 +1469,8 @@ class XWikiPageProperties(xwikifile):
                 self.setsourcelanguage(language_node.text)
 
     def parse(self, propsrc) -> None:
+        from lxml import etree  # ruff:ignore[import-outside-top-level]
+
         if propsrc != b"\n":
             self.root = etree.XML(propsrc, self.get_parser())
             content = "".join(self.root.find("content").itertext())
@@ -1493,12 +1495,16 @@ class XWikiPageProperties(xwikifile):
             newroot.set("locale", language_node.text)
 
     def write_xwiki_xml(self, newroot, out) -> None:
+        from lxml import etree  # ruff:ignore[import-outside-top-level]
+
         xml_content = etree.tostring(newroot, encoding=self.encoding, method="xml")
         out.write(self.XML_HEADER.encode(self.encoding))
         out.write(xml_content)
         out.write(b"\n")
 
     def serialize(self, out) -> None:
+        from lxml import etree  # ruff:ignore[import-outside-top-level]
+
         if self.root is None:
             self.root = etree.XML(self.XWIKI_BASIC_XML, self.get_parser())
         newroot = deepcopy(self.root)
@@ -1527,6 +1533,8 @@ class XWikiFullPage(XWikiPageProperties):
     Name = "XWiki Full Page"
 
     def parse(self, propsrc) -> None:
+        from lxml import etree  # ruff:ignore[import-outside-top-level]
+
         if propsrc != b"\n":
             self.root = etree.XML(propsrc, self.get_parser())
             content = "".join(self.root.find("content").itertext()).replace("\n", "\\n")
@@ -1546,6 +1554,8 @@ class XWikiFullPage(XWikiPageProperties):
         return translation or value
 
     def serialize(self, out) -> None:
+        from lxml import etree  # ruff:ignore[import-outside-top-level]
+
         unit_title = self.findid("title")
         unit_content = self.findid("content")
         if self.root is None:
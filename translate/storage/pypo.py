@@ -28,7 +28,9 @@ from __future__ import annotations
 import copy
 import logging
 import re
+import sys
 from functools import lru_cache
+from io import BytesIO
 from itertools import chain
 from string import punctuation
 from typing import IO, TYPE_CHECKING
@@ -40,7 +42,7 @@ from translate.misc.multistring import multistring
 from translate.storage import pocommon, poparser
 
 if TYPE_CHECKING:
-    from collections.abc import Generator, Iterable
+    from collections.abc import Generator, Iterable, Iterator
 
 logger = logging.getLogger(__name__)
 
@@ -67,6 +69,33 @@ po_open_parenthesis_chars = {"{", "("}
 po_punctuation = set(punctuation)
 
 
+def detectnewline(text: bytes) -> bytes:
+    """Returns the newline used after the first msgid in *text*."""
+    # Find first newline after first msgid
+    newline = b"\n"
+    msgid_pos = max(0, text.find(b"\rmsgid ") + 1, text.find(b"\nmsgid ") + 1)
+    for i, ch in enumerate(text[msgid_pos:]):
+        # Iteration over bytes yields numbers in Python 3
+        if ch == 10:  # LF
+            break
+        if ch == 13:  # CR
+            # Check for CR, CRLF, or unusual patterns like \r\r\n
+            j = msgid_pos + i + 1
+            # Count consecutive CRs to handle patterns like \r\r\n
+            while j < len(text) and text[j] == 13:  # CR
+                j += 1
+            # Check if followed by LF
+            if j < len(text) and text[j] == 10:  # LF
+                # Use the entire pattern (CR(s) + LF) as the line ending
+                newline = text[msgid_pos + i : j + 1]
+            else:
+                # Just CR without LF
+                newline = b"\r"
+            break
+
+    return newline
+
+
 def splitlines(text: bytes) -> tuple[list[bytes], str]:
     r"""
     Split lines based on first newline char.
@@ -89,29 +118,47 @@ def splitlines(text: bytes) -> tuple[list[bytes], str]:
     # by gettext, but some editors might create it, so better handle it.
     if text[:3] == b"\xef\xbb\xbf":
         text = text[3:]
-    # Find first newline after first msgid
-    newline = b"\n"
-    msgid_pos = max(0, text.find(b"\rmsgid ") + 1, text.find(b"\nmsgid ") + 1)
-    for i, ch in enumerate(text[msgid_pos:]):
-        # Iteration over bytes yields numbers in Python 3
-        if ch == 10:  # LF
+    newline = detectnewline(text)
+    return [x + newline for x in text.split(newline)], newline.decode()
+
+
+def iterlines(
+    input: IO[bytes], chunksize: int = 1 << 16
+) -> tuple[Iterator[bytes], str]:
+    """
+    Split lines like :func:`splitlines`, reading the file only as needed.
+
+    :return: An iterator over the lines and the newline used.
+    """
+    text = input.read(chunksize)
+    while True:
+        msgid_pos = max(0, text.find(b"\rmsgid ") + 1, text.find(b"\nmsgid ") + 1)
+        rest = text[msgid_pos:]
+        if b"msgid " in text and (b"\n" in rest or b"\r" in rest.rstrip(b"\r")):
+            # The newline can be detected
             break
-        if ch == 13:  # CR
-            # Check for CR, CRLF, or unusual patterns like \r\r\n
-            j = msgid_pos + i + 1
-            # Count consecutive CRs to handle patterns like \r\r\n
-            while j < len(text) and text[j] == 13:  # CR
-                j += 1
-            # Check if followed by LF
-            if j < len(text) and text[j] == 10:  # LF
-                # Use the entire pattern (CR(s) + LF) as the line ending
-                newline = text[msgid_pos + i : j + 1]
-            else:
-                # Just CR without LF
-                newline = b"\r"
+        chunk = input.read(chunksize)
+        if not chunk:
             break
-
-    return [x + newline for x in text.split(newline)], newline.decode()
+        text += chunk
+    if text[:3] == b"\xef\xbb\xbf":
+        text = text[3:]
+    newline = detectnewline(text)
+    return _readlines(input, text, newline, chunksize), newline.decode()
+
+
+def _readlines(
+    input: IO[bytes], text: bytes, newline: bytes, chunksize: int
+) -> Iterator[bytes]:
+    while True:
+        *lines, text = text.split(newline)
+        for line in lines:
+            yield line + newline
+        chunk = input.read(chunksize)
+        if not chunk:
+            break
+        text += chunk
+    yield text + newline
 
 
 def escapehandler(match: re.Match) -> str:
@@ -216,6 +263,37 @@ def extractstr(string: str) -> str:
     return f'{string[left:]}"'
 
 
+class _lazylist:
+    """
+    A list field of :class:`pounit` which is only created when it is used.
+
+    Most units leave most of their fields empty, so until a field is looked
+    at, the slot of the same name with a leading underscore holds a shared
+    empty tuple instead of a list of its own.
+    """
+
+    __slots__ = ("slotname",)
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.slotname = f"_{name}"
+
+    def __get__(self, unit, owner=None) -> list[str]:
+        if unit is None:
+            return self  # ty:ignore[invalid-return-type]
+        value = getattr(unit, self.slotname)
+        if value is _EMPTY:
+            value = []
+            setattr(unit, self.slotname, value)
+        return value
+
+    def __set__(self, unit, value: list[str]) -> None:
+        setattr(unit, self.slotname, value)
+
+
+#: The value of list fields of units that are not used yet
+_EMPTY: tuple = ()
+
+
 class pounit(pocommon.pounit):
     # othercomments = []      #   # this is another comment
     # automaticcomments = []  #   #. comment extracted from the source code
@@ -229,21 +307,74 @@ class pounit(pocommon.pounit):
     # msgid = []
     # msgstr = []
 
+    # The attributes of units are kept in slots, as large files have many of
+    # them. The base classes don't declare slots, so units still have an
+    # instance dictionary, which stays empty unless other attributes are set.
+    __slots__ = (
+        "_automaticcomments",
+        "_context",
+        "_docpath",
+        "_line_number",
+        "_msgctxt",
+        "_msgid_plural",
+        "_msgid_pluralcomments",
+        "_msgidcomments",
+        "_msgstrlen_cache",
+        "_othercomments",
+        "_prev_context",
+        "_prev_msgctxt",
+        "_prev_msgid",
+        "_prev_msgid_plural",
+        "_prev_source",
+        "_prev_target",
+        "_rich_source",
+        "_rich_target",
+        "_source_cache",
+        "_source_cache_key",
+        "_sourcecomments",
+        "_state_n",
+        "_store",
+        "_target_cache",
+        "_typecomments",
+        "_typecomments_cache",
+        "msgid",
+        "msgstr",
+        "obsolete",
+        "wrapper",
+    )
+
+    othercomments = _lazylist()
+    automaticcomments = _lazylist()
+    sourcecomments = _lazylist()
+    typecomments = _lazylist()
+    msgidcomments = _lazylist()
+    prev_msgctxt = _lazylist()
+    prev_msgid = _lazylist()
+    prev_msgid_plural = _lazylist()
+    msgctxt = _lazylist()
+    msgid_pluralcomments = _lazylist()
+    msgid_plural = _lazylist()
+
     # Our homegrown way to indicate what must be copied in a shallow
     # fashion
     __shallow__ = ["_store", "wrapper"]
 
     def __init__(self, source=None, wrapper: PoWrapper | None = None, **kwargs) -> None:
+        self._store = None
+        self._rich_source = None
+        self._rich_target = None
+        self._state_n = 0
+        self._line_number = None
         self.wrapper: PoWrapper | None = wrapper
         self.obsolete: bool = False
         self._initallcomments(blankall=True)
-        self.prev_msgctxt: list[str] = []
-        self.prev_msgid: list[str] = []
-        self.prev_msgid_plural: list[str] = []
-        self.msgctxt: list[str] = []
+        self._prev_msgctxt = _EMPTY
+        self._prev_msgid = _EMPTY
+        self._prev_msgid_plural = _EMPTY
+        self._msgctxt = _EMPTY
         self.msgid: list[str] = []
-        self.msgid_pluralcomments: list[str] = []
-        self.msgid_plural: list[str] = []
+        self._msgid_pluralcomments = _EMPTY
+        self._msgid_plural = _EMPTY
         self.msgstr: list[str] | dict[int, list[str]] = []
         self._msgstrlen_cache: int | None = None
         self._typecomments_cache: list[str] | None = None
@@ -261,12 +392,12 @@ class pounit(pocommon.pounit):
     def _initallcomments(self, blankall=False) -> None:
         """Initialises allcomments."""
         if blankall:
-            self.othercomments = []
-            self.automaticcomments = []
-            self.sourcecomments = []
-            self.typecomments = []
+            self._othercomments = _EMPTY
+            self._automaticcomments = _EMPTY
+            self._sourcecomments = _EMPTY
+            self._typecomments = _EMPTY
             self._typecomments_cache = []
-            self.msgidcomments = []
+            self._msgidcomments = _EMPTY
 
     def _get_all_comments(self):
         return [
@@ -305,15 +436,19 @@ class pounit(pocommon.pounit):
         """Unescaped msgid."""
         # The raw fields are public mutable lists, so use their current contents
         # as the key rather than relying solely on the source setter.
-        source_cache_key = (*self.msgid, None, *self.msgid_plural)
+        source_cache_key = (*self.msgid, None, *self._msgid_plural)
         if self._source_cache is None or self._source_cache_key != source_cache_key:
             singular = unquotefrompo(self.msgid)
             if self.hasplural():
                 self._source_cache = (
                     singular,
-                    unquotefrompo(self.msgid_plural),
+                    unquotefrompo(self._msgid_plural),
                 )
+                if self._store is not None and self._store.intern_strings:
+                    self._source_cache = tuple(map(sys.intern, self._source_cache))
             else:
+                if self._store is not None and self._store.intern_strings:
+                    singular = sys.intern(singular)
                 self._source_cache = singular
             self._source_cache_key = source_cache_key
         if isinstance(self._source_cache, tuple):
@@ -330,12 +465,13 @@ class pounit(pocommon.pounit):
         self._rich_source = None
         self._invalidate_source_cache()
         self.msgid, self.msgid_plural = self._set_source_vars(source)
+        self._update_store_index()
 
     def _get_prev_source(self):
         """Returns the unescaped msgid."""
-        singular = unquotefrompo(self.prev_msgid)
-        if self.prev_msgid_plural:
-            pluralform = unquotefrompo(self.prev_msgid_plural)
+        singular = unquotefrompo(self._prev_msgid)
+        if self._prev_msgid_plural:
+            pluralform = unquotefrompo(self._prev_msgid_plural)
             return multistring([singular, pluralform])
         return singular
 
@@ -356,7 +492,7 @@ class pounit(pocommon.pounit):
     @property
     def prev_context(self):
         """Unescaped previous msgctxt."""
-        return unquotefrompo(self.prev_msgctxt)
+        return unquotefrompo(self._prev_msgctxt)
 
     @prev_context.setter
     def prev_context(self, context) -> None:
@@ -421,9 +557,9 @@ class pounit(pocommon.pounit):
         parts: list[Iterable[str]] = []
         newline = self.newline
         if origin == "translator" or origin is None:
-            parts.append(comment[2:] or newline for comment in self.othercomments)
+            parts.append(comment[2:] or newline for comment in self._othercomments)
         if origin in {"programmer", "developer", "source code", None}:
-            parts.append(comment[3:] or newline for comment in self.automaticcomments)
+            parts.append(comment[3:] or newline for comment in self._automaticcomments)
         if not parts:
             raise ValueError("Comment type not valid")
         comments = "".join(chain.from_iterable(parts))
@@ -473,7 +609,7 @@ class pounit(pocommon.pounit):
         # self.__shallow__
         shallow = set(self.__shallow__)
         # Make deep copies of all members which are not in shallow
-        for key, value in self.__dict__.items():
+        for key, value in self._getattributes():
             if key not in shallow:
                 setattr(new_unit, key, copy.deepcopy(value))
         # Make shallow copies of all members which are in shallow
@@ -488,10 +624,18 @@ class pounit(pocommon.pounit):
     def copy(self):
         return copy.deepcopy(self)
 
+    def _getattributes(self) -> Generator[tuple[str, object]]:
+        """Yields the names and values of the attributes set on this unit."""
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get("__slots__", ()):
+                if hasattr(self, name):
+                    yield name, getattr(self, name)
+        yield from getattr(self, "__dict__", {}).items()
+
     def _msgidlen(self):
         if self.hasplural():
             return len(unquotefrompo(self.msgid)) + len(
-                unquotefrompo(self.msgid_plural)
+                unquotefrompo(self._msgid_plural)
             )
         return len(unquotefrompo(self.msgid))
 
@@ -601,24 +745,24 @@ class pounit(pocommon.pounit):
         return (
             is_null(self.msgid)
             and not is_null(self.msgstr)  # ty:ignore[invalid-argument-type]
-            and len(self.msgidcomments) == 0
-            and is_null(self.msgctxt)
+            and len(self._msgidcomments) == 0
+            and is_null(self._msgctxt)
         )
 
     def isblank(self):
         return (
             not self.isheader()
-            and not self.msgidcomments
+            and not self._msgidcomments
             and (self._msgidlen() == 0)
             and (self._msgstrlen() == 0)
-            and (is_null(self.msgctxt))
+            and (is_null(self._msgctxt))
         )
         # TODO: remove:
         # Before, the equivalent of the following was the final return statement:
         # return len(self.source.strip()) == 0
 
     def _extracttypecomment(self) -> Generator[str]:
-        for tc in self.typecomments:
+        for tc in self._typecomments:
             for flag in tc.split(","):
                 value = flag.strip()
                 if not value or value == "#":
@@ -631,7 +775,7 @@ class pounit(pocommon.pounit):
 
     def hastypecomment(self, typecomment: str) -> bool:
         """Check whether the given type comment is present."""
-        if not self.typecomments:
+        if not self._typecomments:
             return False
         self._ensure_typecomments_cache()
         return typecomment in self._typecomments_cache  # ty:ignore[unsupported-operator]
@@ -645,7 +789,7 @@ class pounit(pocommon.pounit):
                 # (commentmarker) ...
         """
         commentmarker = f"({commentmarker})"
-        for comment in self.othercomments:
+        for comment in self._othercomments:
             if comment.replace("#", "", 1).strip().startswith(commentmarker):
                 return True
         return False
@@ -706,7 +850,7 @@ class pounit(pocommon.pounit):
 
     def hasplural(self):
         """Returns whether this pounit contains plural strings..."""
-        return len(self.msgid_plural) > 0
+        return len(self._msgid_plural) > 0
 
     def _getmsgpartstr(self, partname, partlines, partcomments=""):
         if isinstance(partlines, dict):
@@ -773,25 +917,27 @@ class pounit(pocommon.pounit):
                 lines.extend(f"{prefix} {line}{self.newline}" for line in var[1:])
 
         def add_prev_msgid_info(lines, prefix) -> None:
-            add_prev_msgid_lines(lines, prefix, "msgctxt", self.prev_msgctxt)
-            add_prev_msgid_lines(lines, prefix, "msgid", self.prev_msgid)
-            add_prev_msgid_lines(lines, prefix, "msgid_plural", self.prev_msgid_plural)
+            add_prev_msgid_lines(lines, prefix, "msgctxt", self._prev_msgctxt)
+            add_prev_msgid_lines(lines, prefix, "msgid", self._prev_msgid)
+            add_prev_msgid_lines(lines, prefix, "msgid_plural", self._prev_msgid_plural)
 
         lines = []
-        lines.extend(self.othercomments)
+        lines.extend(self._othercomments)
         if self.isobsolete():
-            lines.extend(self.typecomments)
+            lines.extend(self._typecomments)
             obsoletelines = []
             add_prev_msgid_info(obsoletelines, prefix="#~|")
-            if self.msgctxt:
-                obsoletelines.append(self._getmsgpartstr("#~ msgctxt", self.msgctxt))
+            if self._msgctxt:
+                obsoletelines.append(self._getmsgpartstr("#~ msgctxt", self._msgctxt))
             obsoletelines.append(
-                self._getmsgpartstr("#~ msgid", self.msgid, self.msgidcomments)
+                self._getmsgpartstr("#~ msgid", self.msgid, self._msgidcomments)
             )
-            if self.msgid_plural or self.msgid_pluralcomments:
+            if self._msgid_plural or self._msgid_pluralcomments:
                 obsoletelines.append(
                     self._getmsgpartstr(
-                        "#~ msgid_plural", self.msgid_plural, self.msgid_pluralcomments
+                        "#~ msgid_plural",
+                        self._msgid_plural,
+                        self._msgid_pluralcomments,
                     )
                 )
             obsoletelines.append(self._getmsgpartstr("#~ msgstr", self.msgstr))
@@ -804,20 +950,20 @@ class pounit(pocommon.pounit):
         # header this will also discard any comments other than plain
         # othercomments...
         if is_null(self.msgid) and not (
-            self.isheader() or self.getcontext() or self.sourcecomments
+            self.isheader() or self.getcontext() or self._sourcecomments
         ):
             return "".join(lines)
-        lines.extend(self.automaticcomments)
-        lines.extend(self.sourcecomments)
-        lines.extend(self.typecomments)
+        lines.extend(self._automaticcomments)
+        lines.extend(self._sourcecomments)
+        lines.extend(self._typecomments)
         add_prev_msgid_info(lines, prefix="#|")
-        if self.msgctxt:
-            lines.append(self._getmsgpartstr("msgctxt", self.msgctxt))
-        lines.append(self._getmsgpartstr("msgid", self.msgid, self.msgidcomments))
-        if self.msgid_plural or self.msgid_pluralcomments:
+        if self._msgctxt:
+            lines.append(self._getmsgpartstr("msgctxt", self._msgctxt))
+        lines.append(self._getmsgpartstr("msgid", self.msgid, self._msgidcomments))
+        if self._msgid_plural or self._msgid_pluralcomments:
             lines.append(
                 self._getmsgpartstr(
-                    "msgid_plural", self.msgid_plural, self.msgid_pluralcomments
+                    "msgid_plural", self._msgid_plural, self._msgid_pluralcomments
                 )
             )
         lines.append(self._getmsgpartstr("msgstr", self.msgstr))
@@ -832,7 +978,7 @@ class pounit(pocommon.pounit):
 
         """
         locations = []
-        for sourcecomment in self.sourcecomments:
+        for sourcecomment in self._sourcecomments:
             locations += quote.rstripeol(sourcecomment)[3:].split()
         for i, loc in enumerate(locations):
             locations[i] = pocommon.unquote_plus(loc)
@@ -847,6 +993,7 @@ class pounit(pocommon.pounit):
         """
         location = pocommon.quote_plus(location)
         self.sourcecomments.append(f"#: {location}{self.newline}")
+        self._update_store_index()
 
     def _extract_msgidcomments(self, text: str | None = None) -> str:
         """
@@ -856,7 +1003,7 @@ class pounit(pocommon.pounit):
                  unit's msgid.
         """
         if not text:
-            text = unquotefrompo(self.msgidcomments)
+            text = unquotefrompo(self._msgidcomments)
         return text.split(self.newline)[0].replace("_: ", "", 1)
 
     def setmsgidcomment(self, msgidcomment) -> None:
@@ -864,19 +1011,21 @@ class pounit(pocommon.pounit):
             self.msgidcomments = [f'"_: {msgidcomment}\\n"']
         else:
             self.msgidcomments = []
+        self._update_store_index()
 
     msgidcomment = property(_extract_msgidcomments, setmsgidcomment)
 
     def getcontext(self):
         """Get the message context."""
-        return unquotefrompo(self.msgctxt) + self._extract_msgidcomments()
+        return unquotefrompo(self._msgctxt) + self._extract_msgidcomments()
 
     def getpreviouscontext(self):
         """Get the real msgctxt without KDE-style msgidcomments."""
-        return unquotefrompo(self.msgctxt)
+        return unquotefrompo(self._msgctxt)
 
     def setcontext(self, context) -> None:
         self.msgctxt = self.quote(context)
+        self._update_store_index()
 
     def getid(self):
         """Returns a unique identifier for this unit."""
@@ -887,12 +1036,23 @@ class pounit(pocommon.pounit):
         # commented out for conformance to gettext.
         #        id = '\0'.join(self.source.strings)
         id = self.source
-        if self.msgidcomments:
+        if self._msgidcomments:
             id = f"_: {context}\n{id}"
         elif context:
             id = f"{context}\04{id}"
         return id
 
+    def internstrings(self) -> None:
+        """Interns the msgctxt, msgid and location comment lines of this unit."""
+        for lines in (
+            self._msgctxt,
+            self.msgid,
+            self._msgid_plural,
+            self._sourcecomments,
+        ):
+            if lines:
+                lines[:] = map(sys.intern, lines)
+
 
 class pofile(pocommon.pofile[pounit]):
     """A .po file containing various units."""
@@ -923,6 +1083,39 @@ class pofile(pocommon.pofile[pounit]):
         self.units = []
         poparser.parse_units(poparser.PoParseState(lines, self.create_unit), self)
 
+    def iterparse(self, input) -> Iterator[pounit]:
+        """
+        Parses the given file or file name, yielding the units one by one.
+
+        Unlike :meth:`parse`, the units are not added to the store and the
+        file is read only as far as needed, so that files larger than the
+        available memory can be processed. Only the header is kept in the
+        store, which is set up for the encoding and newlines of the file.
+        """
+        if isinstance(input, str):
+            self.filename = input
+            with open(input, "rb") as inputfile:
+                yield from self.iterparse(inputfile)
+            return
+        if isinstance(input, bytes):
+            input = BytesIO(input)
+        elif hasattr(input, "name"):
+            self.filename = input.name
+        elif not getattr(self, "filename", ""):
+            self.filename = ""
+        lines, self.newline = iterlines(input)
+        self.units = []
+        parse_state = poparser.PoParseState(
+            poparser.LineBuffer(lines), self.create_unit
+        )
+        units = poparser.iterparse_units(parse_state, self)
+        for index, unit in enumerate(units):
+            if index == 0 and unit.isheader():
+                self.addunit(unit)
+            else:
+                unit._store = self
+            yield unit
+
     def removeduplicates(self, duplicatestyle: str = "merge") -> None:
         """
         Make sure each msgid is unique ; merge comments etc from
@@ -216,6 +216,7 @@ class RESXFile(lisa.LISAfile):
         if unit.getid() is None:
             self._messagenum += 1
             unit.setid(f"{unit.source.strip(' ')}")
+            self.update_unit_index(unit)
         # adjust the current and previous elements for new ones;
         # otherwise they will not be indented correctly.
         if new:
@@ -104,7 +104,7 @@ class Statistics:
 
     def wordcount(self, text):
         """Returns the number of words in the given text."""
-        return len(self.language.words(text))
+        return self.language.wordcount(text)
 
     def source_wordcount(self):
         """Returns the number of words in the source text."""
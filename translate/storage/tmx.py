@@ -18,7 +18,10 @@
 
 """module for parsing TMX translation memory files."""
 
+from __future__ import annotations
+
 from io import BytesIO
+from typing import TYPE_CHECKING
 
 from lxml import etree
 
@@ -31,6 +34,9 @@ from translate.misc.xml_helpers import (
 )
 from translate.storage import lisa
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 
 class tmxunit(lisa.MultilingualLISAunit):
     """A single unit in the TMX file."""
@@ -219,12 +225,79 @@ class tmxfile(lisa.LISAfile[tmxunit]):
             targetlanguage=targetlanguage,
         )
 
+    def iterparse(self, input) -> Iterator[tmxunit]:
+        """
+        Parses the given file or file name, yielding the units one by one.
+
+        Unlike :meth:`parse`, the units are not added to the store and only
+        the header of the document is kept, so that translation memories
+        larger than the available memory can be processed.
+        """
+        if isinstance(input, str):
+            self.filename = input
+            with open(input, "rb") as inputfile:
+                yield from self.iterparse(inputfile)
+            return
+        if isinstance(input, bytes):
+            input = BytesIO(input)
+        elif hasattr(input, "name"):
+            self.filename = input.name
+        elif not getattr(self, "filename", ""):
+            self.filename = ""
+        self.units = []
+        self._invalidate_indexes()
+        events = etree.iterparse(
+            input,
+            events=("start", "end"),
+            tag=(
+                f"{{*}}{self.rootNode}",
+                "{*}header",
+                f"{{*}}{self.bodyNode}",
+                f"{{*}}{self.UnitClass.rootNode}",
+            ),
+            strip_cdata=False,
+            resolve_entities=False,
+            no_network=True,
+        )
+        for event, element in events:
+            if event == "start":
+                if element.getparent() is None:
+                    self.document = element.getroottree()
+                    self.namespace = element.nsmap.get(None, None)
+                    assert element.tag == self.namespaced(self.rootNode)
+                elif element.tag == self.namespaced(self.bodyNode):
+                    self.body = element
+            elif element.tag == self.namespaced(self.UnitClass.rootNode):
+                # Drop the unit from the document to only keep the header
+                self.body.remove(element)
+                unit = self.UnitClass.createfromxmlElement(element)
+                unit.namespace = self.namespace
+                unit._store = self
+                yield unit
+            elif (
+                element.tag == self.namespaced("header")
+                and not self._source_language_explicit
+            ):
+                self.sourcelanguage = element.get("srclang")
+        self.encoding = self.document.docinfo.encoding
+
     def _invalidate_indexes(self) -> None:
         self.locationindex = {}
         self.sourceindex = {}
         self.id_index = {}
         self.languageindex = {}
 
+    def addunit(self, unit, new=True) -> None:
+        super().addunit(unit, new)
+        # The language index covers all languages of the units, so it is
+        # built again rather than kept up to date
+        if self.id_index:
+            self._invalidate_indexes()
+
+    def removeunit(self, unit) -> None:
+        super().removeunit(unit)
+        self._invalidate_indexes()
+
     def setsourcelanguage(self, sourcelanguage: str) -> None:
         self._source_language_explicit = True
         super().setsourcelanguage(sourcelanguage)
@@ -303,3 +376,68 @@ class tmxfile(lisa.LISAfile[tmxunit]):
                 target_node, getXMLspace(unit.xmlelement, unit._default_xml_space)
             )
         return unit.target
+
+
+class tmxwriter(tmxfile):
+    """
+    A TMX file store that writes its units out as they are added.
+
+    Every unit is written to the output once the next unit is added, so
+    that translation memories larger than the available memory can be
+    written. The file is completed by :meth:`close`.
+    """
+
+    def __init__(self, out, sourcelanguage=None, targetlanguage=None, **kwargs) -> None:
+        """Sets up writing to the binary file object *out*."""
+        super().__init__(
+            sourcelanguage=sourcelanguage, targetlanguage=targetlanguage, **kwargs
+        )
+        self.out = out
+        self._started = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _write(self, text) -> None:
+        self.out.write(self.serialize_hook(text))
+
+    def flush(self) -> None:
+        """Writes out the units added so far."""
+        if not self._started:
+            self._started = True
+            root = self.document.getroot()
+            roottag = etree.tostring(
+                etree.Element(root.tag, root.attrib), encoding="unicode"
+            )
+            lines = [f'<?xml version="1.0" encoding="{self.encoding.upper()}"?>']
+            if self.document.docinfo.doctype:
+                lines.append(self.document.docinfo.doctype)
+            lines.append(f"{roottag.removesuffix('/>')}>")
+            lines.extend(
+                f"  {etree.tostring(child, encoding='unicode', with_tail=False)}"
+                for child in root
+                if child is not self.body
+            )
+            lines.append(f"  <{self.bodyNode}>")
+            self._write("\n".join(lines) + "\n")
+        for unit in self.units:
+            etree.indent(unit.xmlelement, level=2)
+            self._write(
+                f"    {etree.tostring(unit.xmlelement, encoding='unicode', with_tail=False)}\n"
+            )
+            self.body.remove(unit.xmlelement)
+        self.units = []
+        self._invalidate_indexes()
+
+    def addunit(self, unit, new=True) -> None:
+        # The previous unit is complete once the next one is added
+        self.flush()
+        super().addunit(unit, new)
+
+    def close(self) -> None:
+        """Writes out the remaining units and the end of the file."""
+        self.flush()
+        self._write(f"  </{self.bodyNode}>\n</{self.rootNode}>\n")
@@ -740,6 +740,7 @@ class Xliff1File(XliffFile[U]):
         # XML tree for that.
         messagenum = len(self.units) + 1
         unit.setid(f"{messagenum}")
+        self.update_unit_index(unit)
         return unit
 
     def switchfile(self, filename: str, createifmissing: bool = False) -> bool:
@@ -95,6 +95,25 @@ class XliffUnit(lisa.LISAunit):
                 nodes.append(target)
         return nodes
 
+    def get_source_dom(self):
+        """Returns the first node of :meth:`getlanguageNodes`."""
+        return next(
+            self.xmlelement.iterchildren(self.namespaced(self.languageNode)), None
+        )
+
+    source_dom = property(get_source_dom, lisa.LISAunit.set_source_dom)
+
+    def get_target_dom(self, lang=None):
+        """Returns the second node of :meth:`getlanguageNodes`, by default."""
+        if lang:
+            return super().get_target_dom(lang)
+        if self.get_source_dom() is None:
+            # The target is only looked for after the source
+            return None
+        return next(self.xmlelement.iterchildren(self.namespaced("target")), None)
+
+    target_dom = property(get_target_dom)
+
     def set_rich_source(self, value, sourcelang="en") -> None:
         sourcelanguageNode = self.get_source_dom()
         if sourcelanguageNode is None:
@@ -36,15 +36,21 @@ import sys
 from argparse import ArgumentParser
 from collections import defaultdict
 from dataclasses import dataclass
-from functools import cached_property
+from functools import cached_property, lru_cache
 from operator import itemgetter
-from typing import BinaryIO, TypedDict, cast
+from typing import TYPE_CHECKING, BinaryIO, TypedDict, cast
 
-from translate.lang.common import Common
+from translate.lang.common import WORDCOUNT_CACHE_SIZE, Common
 from translate.misc.multistring import multistring
 from translate.storage import factory
 from translate.storage.workflow import StateEnum
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from translate.storage.base import TranslationUnit
+    from translate.tools.statscache import StatsCache
+
 extended_state_strings: dict[StateEnum | int, str] = {
     StateEnum.EMPTY: "empty",
     StateEnum.NEEDS_WORK: "needs-work",
@@ -116,11 +122,25 @@ class ConsoleColor:
 
 
 def wordcount(string):
+    """
+    Returns the number of words in *string*, leaving out markup.
+
+    Like :meth:`~translate.lang.common.Common.wordcount`, recent counts are
+    kept in a bounded cache.
+    """
+    return _wordcount(str(string))
+
+
+@lru_cache(maxsize=WORDCOUNT_CACHE_SIZE)
+def _wordcount(string: str) -> int:
     # TODO: po class should understand KDE style plurals ##
     # string = kdepluralre.sub("", string) #Restore this if you really need support for old kdeplurals
-    string = brtagre.sub("\n", string)
-    string = xmltagre.sub("", string)
-    string = numberre.sub(" ", string)
+    # Most strings contain no markup or dots, so skip the scans they need
+    if "<" in string:
+        string = brtagre.sub("\n", string)
+        string = xmltagre.sub("", string)
+    if "." in string:
+        string = numberre.sub(" ", string)
     # TODO: This should still use the correct language to count in the target
     # language
     return len(Common.words(string))
@@ -177,15 +197,26 @@ class StatsDict(TypedDict, total=False):
 
 
 def calcstats(filename: str | BinaryIO) -> StatsDict:
-    # ignore totally blank or header units
+    """
+    Counts the units and words of a file.
+
+    The units of formats which can be parsed incrementally are counted while
+    the file is being read, so the file doesn't have to fit in memory.
+    """
     try:
-        store = factory.getobject(filename)
+        _store, units = factory.iterobject(filename)
+        stats: StatsDict = {"filename": filename}
+        stats.update(calcunitstats(units))
     except ValueError as e:
         logger.warning("Error in %s: %s", filename, e)
         return {}
+    return stats
 
+
+def calcunitstats(units: Iterable[TranslationUnit]) -> StatsDict:
+    """Counts the units and words of the given units."""
     # Initialize counters
-    stats: StatsDict = {"filename": filename}
+    stats: StatsDict = {}
     stats["translated"] = 0
     stats["fuzzy"] = 0
     stats["untranslated"] = 0
@@ -200,7 +231,8 @@ def calcstats(filename: str | BinaryIO) -> StatsDict:
     extended_stats: dict[str, ExtendedStatsDict] = {}
 
     # Single pass through all units
-    for unit in store.units:
+    for unit in units:
+        # ignore totally blank or header units
         if not unit.istranslatable():
             continue
 
@@ -462,10 +494,27 @@ def percent(denominator: int, devisor: int) -> int:
 
 
 class StatCollector:
-    def __init__(self, items: list[str], incomplete_only=False) -> None:
+    def __init__(
+        self,
+        items: list[str],
+        incomplete_only=False,
+        jobs: int = 1,
+        cache: StatsCache | None = None,
+    ) -> None:
+        """
+        Counts the files in *items*, recursing into directories.
+
+        :param jobs: The number of processes to count the files with.
+        :param cache: An optional cache of the statistics of earlier runs, so
+            that files which didn't change are not parsed again.
+        """
         self.incomplete_only = incomplete_only
+        self.jobs = jobs
+        self.cache = cache
         self._results: list[StatsDict] = []
+        self._filenames: list[str] = []
         self._handle_items(items)
+        self._count_files()
 
     def render(self, renderer_class: type[Renderer]) -> None:
         if renderer_class in {ShortWordsRenderer, ShortStringsRenderer}:
@@ -510,11 +559,58 @@ class StatCollector:
                 self._handle_single_file(pathname)
 
     def _handle_single_file(self, filename) -> None:
-        try:
-            stats = calcstats(filename)
-            self._results.append(stats)
-        except Exception:  # This happens if we have a broken file.
-            logger.exception("Broken file")
+        self._filenames.append(filename)
+
+    def _count_files(self) -> None:
+        """
+        Counts the files found, in the order they were found.
+
+        Files are looked up in the cache first, and the remaining ones are
+        counted in worker processes if there are several jobs.
+        """
+        cache = self.cache
+        keys: list[str | None] = [None] * len(self._filenames)
+        results: list[StatsDict | None] = [None] * len(self._filenames)
+        pending = []
+        for index, filename in enumerate(self._filenames):
+            if cache is not None:
+                try:
+                    keys[index] = cache.getkey(filename)
+                except OSError:
+                    keys[index] = None
+                cached = cache.get(keys[index])
+                if cached is not None:
+                    results[index] = cast("StatsDict", {"filename": filename, **cached})
+                    continue
+            pending.append(index)
+
+        def store(index, stats) -> None:
+            results[index] = stats
+            if cache is not None:
+                cache.set(keys[index], stats)
+
+        if self.jobs > 1 and len(pending) > 1:
+            from concurrent.futures import ProcessPoolExecutor  # ruff:ignore[import-outside-top-level]
+
+            with ProcessPoolExecutor(
+                max_workers=min(self.jobs, len(pending))
+            ) as executor:
+                futures = {
+                    index: executor.submit(calcstats, self._filenames[index])
+                    for index in pending
+                }
+                for index, future in futures.items():
+                    try:
+                        store(index, future.result())
+                    except Exception:  # This happens if we have a broken file.
+                        logger.exception("Broken file")
+        else:
+            for index in pending:
+                try:
+                    store(index, calcstats(self._filenames[index]))
+                except Exception:  # This happens if we have a broken file.
+                    logger.exception("Broken file")
+        self._results.extend(stats for stats in results if stats is not None)
 
     @property
     def longest_filename(self):
@@ -589,14 +685,36 @@ def main(arguments=None) -> None:
         "--no-color", action="store_true", help="show output without color"
     )
 
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="JOBS",
+        help="count files in JOBS parallel processes, 0 uses all CPUs (default: 1)",
+    )
+    parser.add_argument(
+        "--stats-cache",
+        metavar="FILE",
+        help="reuse the statistics of unchanged files kept in FILE",
+    )
+
     parser.add_argument("files", nargs="+")
 
     args = parser.parse_args(arguments)
 
     logging.basicConfig(format="%(name)s: %(levelname)s: %(message)s")
     ConsoleColor.color_mode = not args.no_color
+    jobs = args.jobs if args.jobs > 0 else os.cpu_count() or 1
 
-    StatCollector(args.files, args.incomplete_only).render(args.style)
+    if args.stats_cache:
+        from translate.tools import statscache  # ruff:ignore[import-outside-top-level]
+
+        with statscache.StatsCache(os.path.expanduser(args.stats_cache)) as cache:
+            collector = StatCollector(args.files, args.incomplete_only, jobs, cache)
+        collector.render(args.style)
+        print(f"stats cache: {cache.getstats()}", file=sys.stderr)
+    else:
+        StatCollector(args.files, args.incomplete_only, jobs).render(args.style)
 
 
 if __name__ == "__main__":
@@ -28,7 +28,10 @@ for examples and usage instructions.
 """
 
 import locale
+import logging
+import os
 import re
+from collections import Counter
 
 from translate.lang import data
 from translate.misc import optrecurse
@@ -36,6 +39,8 @@ from translate.misc.multistring import multistring
 from translate.storage import factory
 from translate.storage.poheader import poheader
 
+logger = logging.getLogger(__name__)
+
 
 class GrepMatch:
     """Just a small data structure that represents a search match."""
@@ -137,7 +142,69 @@ def find_matches(unit, part, strings, re_search):
     return matches
 
 
+def _chain(char, node):
+    """
+    Follows the trie from *node*, reached with *char*, for as long as there
+    is only one way to go on.
+
+    :return: The characters on the way, and the node where the way branches
+        or a string ends.
+    """
+    chars = [char]
+    while len(node) == 1 and "" not in node:
+        ((char, node),) = node.items()
+        chars.append(char)
+    return "".join(chars), node
+
+
+def trie_regex(strings):
+    """
+    Returns a regular expression matching any of the literal *strings*.
+
+    Strings with a common prefix share a branch of the expression, so that
+    searching for many strings only compares each character of the text with
+    the characters that can follow at that point, much like an Aho-Corasick
+    automaton. This is a lot faster than an alternation of all the strings.
+    """
+    trie = {}
+    for string in strings:
+        node = trie
+        for char in string:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    # The branches are built from the leaves up without recursion, as long
+    # strings make for deep tries
+    chains = {}
+    order = []
+    pending = [trie]
+    while pending:
+        node = pending.pop()
+        order.append(node)
+        chains[id(node)] = [
+            _chain(char, child) for char, child in sorted(node.items()) if char
+        ]
+        pending.extend(end for _literal, end in chains[id(node)])
+    branches = {}
+    for node in reversed(order):
+        alternatives = [
+            re.escape(literal) + branches.pop(id(end))
+            for literal, end in chains.pop(id(node))
+        ]
+        if "" in node:
+            branch = f"(?:{'|'.join(alternatives)})?" if alternatives else ""
+        elif len(alternatives) == 1:
+            branch = alternatives[0]
+        else:
+            branch = f"(?:{'|'.join(alternatives)})"
+        branches[id(node)] = branch
+    return branches[id(trie)]
+
+
 class GrepFilter:
+    #: The :class:`~translate.search.grepindex.GrepIndex` to find candidates in
+    index = None
+
     def __init__(
         self,
         searchstring,
@@ -150,12 +217,22 @@ class GrepFilter:
         encoding="utf-8",
         max_matches=0,
     ) -> None:
-        """Builds a checkfilter using the given checker."""
-        if isinstance(searchstring, str):
-            self.searchstring = searchstring
+        """
+        Builds a checkfilter using the given checker.
+
+        :param searchstring: The string to search for, or a list of strings
+            to search for all at once.
+        """
+        if isinstance(searchstring, (str, bytes)):
+            searchstrings = [searchstring]
         else:
-            self.searchstring = searchstring.decode(encoding)
-        self.searchstring = data.normalize(self.searchstring)
+            searchstrings = list(searchstring)
+        self.searchstrings = [
+            data.normalize(
+                string if isinstance(string, str) else string.decode(encoding)
+            )
+            for string in searchstrings
+        ]
         if searchparts:
             # For now we still support the old terminology, except for the old 'source'
             # which has a new meaning now.
@@ -170,32 +247,96 @@ class GrepFilter:
             self.search_locations = False
         self.ignorecase = ignorecase
         if self.ignorecase:
-            self.searchstring = self.searchstring.lower()
+            self.searchstrings = [string.lower() for string in self.searchstrings]
+        # The first string is kept for single searches
+        self.searchstring = self.searchstrings[0] if self.searchstrings else ""
         self.useregexp = useregexp
         if self.useregexp:
-            self.searchpattern = re.compile(self.searchstring)
+            self.searchpatterns = [re.compile(string) for string in self.searchstrings]
+            self.searchpattern = re.compile(self.regexp())
+        elif len(self.searchstrings) > 1:
+            try:
+                self.searchpattern = re.compile(trie_regex(self.searchstrings))
+            except RecursionError:
+                # Too many strings that are prefixes of each other nest too
+                # deeply for the regular expression parser
+                self.searchpattern = re.compile(
+                    "|".join(re.escape(string) for string in self.searchstrings)
+                )
+        #: The number of units each of several search strings matched
+        self.matchcounts = Counter()
         self.invertmatch = invertmatch
         self.keeptranslations = keeptranslations
         self.accelchar = accelchar
         self.max_matches = max_matches
 
-    def matches(self, teststr):
-        if teststr is None:
-            return False
+    def regexp(self):
+        """Returns the regular expression matching any of the search strings."""
+        if len(self.searchstrings) == 1:
+            # Kept as it is, as it may start with global flags like (?i)
+            return self.searchstrings[0]
+        return "|".join(f"(?:{string})" for string in self.searchstrings)
+
+    def preparestring(self, teststr):
+        """Normalizes *teststr* the way the search strings were normalized."""
         teststr = data.normalize(teststr)
         if self.ignorecase:
             teststr = teststr.lower()
         if self.accelchar:
-            teststr = re.sub(self.accelchar + self.accelchar, "#", teststr)
-            teststr = re.sub(self.accelchar, "", teststr)
-        if self.useregexp:
-            found = self.searchpattern.search(teststr)
-        else:
-            found = teststr.find(self.searchstring) != -1
+            teststr = teststr.replace(self.accelchar + self.accelchar, "#")
+            teststr = teststr.replace(self.accelchar, "")
+        return teststr
+
+    def search(self, teststr):
+        """Checks whether any search string is found in the prepared *teststr*."""
+        if self.useregexp or len(self.searchstrings) > 1:
+            return self.searchpattern.search(teststr) is not None
+        return self.searchstring in teststr
+
+    def matches(self, teststr):
+        if teststr is None:
+            return False
+        found = self.search(self.preparestring(teststr))
         if self.invertmatch:
             found = not found
         return found
 
+    def matchingstrings(self, teststrs):
+        """Returns the search strings found in any of the prepared *teststrs*."""
+        teststrs = [teststr for teststr in teststrs if self.search(teststr)]
+        if not teststrs:
+            return []
+        if self.useregexp:
+            return [
+                string
+                for string, pattern in zip(
+                    self.searchstrings, self.searchpatterns, strict=True
+                )
+                if any(pattern.search(teststr) for teststr in teststrs)
+            ]
+        return [
+            string
+            for string in self.searchstrings
+            if any(string in teststr for teststr in teststrs)
+        ]
+
+    def getteststrings(self, unit):
+        """Yields the strings of *unit* in the parts that are searched."""
+        if self.search_source:
+            if isinstance(unit.source, multistring):
+                yield from unit.source.strings
+            else:
+                yield unit.source
+        if self.search_target:
+            if isinstance(unit.target, multistring):
+                yield from unit.target.strings
+            else:
+                yield unit.target
+        if self.search_notes:
+            yield unit.getnotes()
+        if self.search_locations:
+            yield " ".join(unit.getlocations())
+
     def filterunit(self, unit):
         """Runs filters on an element."""
         if unit.isheader():
@@ -204,36 +345,61 @@ class GrepFilter:
         if self.keeptranslations and unit.target:
             return True
 
-        if self.search_source:
-            if isinstance(unit.source, multistring):
-                strings = unit.source.strings
-            else:
-                strings = [unit.source]
-            for string in strings:
-                if self.matches(string):
-                    return True
-
-        if self.search_target:
-            if isinstance(unit.target, multistring):
-                strings = unit.target.strings
-            else:
-                strings = [unit.target]
-            for string in strings:
-                if self.matches(string):
-                    return True
+        if len(self.searchstrings) > 1 and not self.invertmatch:
+            # Find all the search strings that match, to report them
+            found = self.matchingstrings(
+                self.preparestring(teststr)
+                for teststr in self.getteststrings(unit)
+                if teststr is not None
+            )
+            self.matchcounts.update(found)
+            return bool(found)
+        return any(self.matches(teststr) for teststr in self.getteststrings(unit))
+
+    def indexquery(self):
+        """
+        Returns what units have to contain to match, to search the index with.
+
+        :return: The alternatives of :func:`~translate.search.grepindex.querypieces`
+            for all search strings, or None if any unit might be selected.
+        """
+        from translate.search import grepindex  # ruff:ignore[import-outside-top-level]
+
+        if self.invertmatch or self.keeptranslations:
+            return None
+        query = []
+        for searchstring in self.searchstrings:
+            pieces = grepindex.querypieces(searchstring, self.useregexp, self.accelchar)
+            if pieces is None:
+                return None
+            query.extend(pieces)
+        return query
+
+    def searchparts(self):
+        """Returns the names of the parts of units that are searched."""
+        return [
+            part
+            for part, search in (
+                ("source", self.search_source),
+                ("target", self.search_target),
+                ("notes", self.search_notes),
+                ("locations", self.search_locations),
+            )
+            if search
+        ]
 
-        if self.search_notes and self.matches(unit.getnotes()):
-            return True
-        return bool(
-            self.search_locations and self.matches(" ".join(unit.getlocations()))
-        )
+    def filterfile(self, thefile, units=None):
+        """
+        Runs filters on a translation file object.
 
-    def filterfile(self, thefile):
-        """Runs filters on a translation file object."""
+        :param units: The units of *thefile* to filter, if they are not all in
+            it, as when it is parsed incrementally.
+        """
+        self.matchcounts.clear()
         thenewfile = type(thefile)()
         thenewfile.setsourcelanguage(thefile.sourcelanguage)
         thenewfile.settargetlanguage(thefile.targetlanguage)
-        for unit in thefile.units:
+        for unit in thefile.units if units is None else units:
             if self.filterunit(unit):
                 thenewfile.addunit(unit)
 
@@ -242,17 +408,20 @@ class GrepFilter:
         return thenewfile
 
     def getmatches(self, units):
-        if not self.searchstring:
+        if not any(self.searchstrings):
             return [], []
 
-        searchstring = self.searchstring
-        flags = re.LOCALE | re.MULTILINE | re.UNICODE
+        flags = re.MULTILINE | re.UNICODE
 
         if self.ignorecase:
             flags |= re.IGNORECASE
-        if not self.useregexp:
-            searchstring = re.escape(searchstring)
-        self.re_search = re.compile(f"({searchstring})", flags)
+        if self.useregexp:
+            searchstring = self.regexp()
+        elif len(self.searchstrings) > 1:
+            searchstring = trie_regex(self.searchstrings)
+        else:
+            searchstring = re.escape(self.searchstring)
+        self.re_search = re.compile(searchstring, flags)
 
         matches = []
         indexes = []
@@ -298,7 +467,9 @@ class GrepOptionParser(optrecurse.RecursiveOptionParser):
             self, args, values
         )
         # some intelligence as to what reasonable people might give on the command line
-        if args:
+        if options.patternsfile:
+            options.searchstring = self.readpatterns(options.patternsfile)
+        elif args:
             options.searchstring = args[0]
             args = args[1:]
         else:
@@ -321,6 +492,18 @@ class GrepOptionParser(optrecurse.RecursiveOptionParser):
             options.input = options.input[0]
         return (options, args)
 
+    def readpatterns(self, filename):
+        """Reads the search strings in *filename*, one per line."""
+        try:
+            with open(filename, encoding="utf-8") as patternsfile:
+                patterns = [line.rstrip("\r\n") for line in patternsfile]
+        except OSError as e:
+            self.error(f"Cannot read search strings: {e}")
+        patterns = [pattern for pattern in patterns if pattern]
+        if not patterns:
+            self.error(f"No search strings in {filename}")
+        return patterns
+
     def set_usage(self, usage=None) -> None:
         """Sets the usage string - if usage not given, uses getusagestring for each option."""
         if usage is None:
@@ -341,13 +524,64 @@ class GrepOptionParser(optrecurse.RecursiveOptionParser):
             options.accelchar,
             locale.getpreferredencoding(),
         )
-        self.recursiveprocess(options)
+        if options.patternsfile:
+            # Report which of the search strings matched in every file
+            logger.setLevel(logging.INFO)
+        if options.indexfile:
+            from translate.search import grepindex  # ruff:ignore[import-outside-top-level]
+
+            with grepindex.GrepIndex(os.path.expanduser(options.indexfile)) as index:
+                options.checkfilter.index = index
+                self.recursiveprocess(options)
+        else:
+            self.recursiveprocess(options)
+
+    def canprocessinparallel(self, options) -> bool:
+        # The index can only be used from a single process
+        return not options.indexfile and super().canprocessinparallel(options)
 
 
 def rungrep(inputfile, outputfile, templatefile, checkfilter) -> bool:
     """Reads in inputfile, filters using checkfilter, writes to outputfile."""
-    fromfile = factory.getobject(inputfile)
-    tofile = checkfilter.filterfile(fromfile)
+    index = checkfilter.index
+    path = getattr(inputfile, "name", None)
+    candidates = None
+    if index is not None and isinstance(path, str) and os.path.isfile(path):
+        if not index.isfresh(path):
+            fromfile, units = factory.iterobject(inputfile)
+            units = index.indexunits(path, units)
+            return writegrep(inputfile, outputfile, checkfilter, fromfile, units)
+        query = checkfilter.indexquery()
+        if query is not None:
+            found = index.search(query, checkfilter.searchparts())
+            candidates = found.get(os.path.abspath(path))
+            if not candidates:
+                return False
+    fromfile, units = factory.iterobject(inputfile)
+    if candidates is not None:
+        units = (
+            unit
+            for seq, unit in enumerate(units)
+            if seq in candidates or unit.isheader()
+        )
+    return writegrep(inputfile, outputfile, checkfilter, fromfile, units)
+
+
+def logmatchcounts(inputfile, checkfilter) -> None:
+    """Logs how many units of *inputfile* the search strings that matched matched."""
+    for searchstring, count in checkfilter.matchcounts.most_common():
+        logger.info(
+            "%s: %d units match %s",
+            getattr(inputfile, "name", ""),
+            count,
+            searchstring,
+        )
+
+
+def writegrep(inputfile, outputfile, checkfilter, fromfile, units) -> bool:
+    """Filters the *units* of *fromfile*, writes the selected ones to outputfile."""
+    tofile = checkfilter.filterfile(fromfile, units)
+    logmatchcounts(inputfile, checkfilter)
     if tofile.isempty():
         return False
     tofile.serialize(outputfile)
@@ -385,6 +619,22 @@ def cmdlineparser():
         metavar="SEARCHPARTS",
         help="searches the given parts (source, target, notes and locations)",
     )
+    parser.add_option(
+        "-f",
+        "--patterns-file",
+        dest="patternsfile",
+        metavar="FILE",
+        help="search for all the strings in FILE, one per line, "
+        "instead of a single search string",
+    )
+    parser.add_option(
+        "",
+        "--index",
+        dest="indexfile",
+        metavar="INDEX",
+        help="keep the text of the input files in a full-text index in INDEX, "
+        "to only read the files and messages that can match",
+    )
     parser.add_option(
         "-I",
         "--ignore-case",
@@ -35,8 +35,15 @@ from translate.storage.poheader import poheader
 logger = logging.getLogger(__name__)
 
 
-def mergestores(store1, store2, mergeblanks, mergefuzzy, mergecomments):
-    """Take any new translations in store2 and write them into store1."""
+def mergestores(
+    store1, store2, mergeblanks, mergefuzzy, mergecomments, mergenormalized=False
+):
+    """
+    Take any new translations in store2 and write them into store1.
+
+    With *mergenormalized*, units of store2 whose source only differs in case
+    and whitespace from a unit in store1 are merged too, and marked fuzzy.
+    """
     for unit2 in store2.units:
         if unit2.isheader():
             if isinstance(store1, poheader):
@@ -45,6 +52,10 @@ def mergestores(store1, store2, mergeblanks, mergefuzzy, mergecomments):
         unit1 = store1.findid(unit2.getid())
         if unit1 is None:
             unit1 = store1.findunit(unit2.source)
+        normalized = False
+        if unit1 is None and mergenormalized:
+            unit1 = store1.findnormalizedunit(unit2.source)
+            normalized = unit1 is not None
         if unit1 is None:
             logger.error("The template does not contain the following unit:\n%s", unit2)
         else:
@@ -53,6 +64,8 @@ def mergestores(store1, store2, mergeblanks, mergefuzzy, mergecomments):
             if not mergefuzzy and unit2.isfuzzy():
                 continue
             unit1.merge(unit2, overwrite=True, comments=mergecomments)
+            if normalized:
+                unit1.markfuzzy()
     return store1
 
 
@@ -78,6 +91,7 @@ def mergestore(
     mergeblanks="no",
     mergefuzzy="no",
     mergecomments="yes",
+    mergenormalized="no",
 ) -> int:
     try:
         mergecomments = str2bool(mergecomments)
@@ -91,14 +105,26 @@ def mergestore(
         mergefuzzy = str2bool(mergefuzzy)
     except ValueError as error:
         raise ValueError(f"invalid mergefuzzy value: {mergefuzzy!r}") from error
-    inputstore = factory.getobject(inputfile)
+    try:
+        mergenormalized = str2bool(mergenormalized)
+    except ValueError as error:
+        raise ValueError(
+            f"invalid mergenormalized value: {mergenormalized!r}"
+        ) from error
+    # The template and the translations to merge share most source strings
+    inputstore = factory.getobject(inputfile, intern_strings=True)
     if templatefile is None:
         # just merge nothing
         templatestore = type(inputstore)()
     else:
-        templatestore = factory.getobject(templatefile)
+        templatestore = factory.getobject(templatefile, intern_strings=True)
     outputstore = mergestores(
-        templatestore, inputstore, mergeblanks, mergefuzzy, mergecomments
+        templatestore,
+        inputstore,
+        mergeblanks,
+        mergefuzzy,
+        mergecomments,
+        mergenormalized,
     )
     if outputstore.isempty():
         return 0
@@ -147,6 +173,14 @@ def main() -> None:
         default="yes",
         help="whether to merge comments as well as translations (yes/no). Default is yes.",
     )
+    mergenormalizedoption = convert.optparse.Option(
+        "",
+        "--mergenormalized",
+        dest="mergenormalized",
+        action="store",
+        default="no",
+        help="whether to merge translations whose source only differs in case and whitespace, marking them fuzzy (yes/no). Default is no.",
+    )
     parser = convert.ConvertOptionParser(
         formats, usetemplates=True, description=__doc__
     )
@@ -156,6 +190,8 @@ def main() -> None:
     parser.passthrough.append("mergefuzzy")
     parser.add_option(mergecommentsoption)
     parser.passthrough.append("mergecomments")
+    parser.add_option(mergenormalizedoption)
+    parser.passthrough.append("mergenormalized")
     parser.run()
 
 
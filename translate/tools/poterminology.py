@@ -21,40 +21,252 @@ See: https://docs.translatehouse.org/projects/translate-toolkit/en/latest/comman
 for examples and usage instructions.
 """
 
+from __future__ import annotations
+
 import contextlib
+import json
 import logging
 import os
 import re
 import sys
-from collections.abc import Callable
+from collections import deque
 from operator import itemgetter
-from typing import NamedTuple
+from typing import TYPE_CHECKING, NamedTuple
 
 from translate.lang import factory as lang_factory
 from translate.misc import file_discovery, optrecurse
 from translate.storage import factory, po
-from translate.storage.base import TranslationUnit
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+    from translate.storage.base import TranslationUnit
 
 logger = logging.getLogger(__name__)
 
 
-# Lightweight structure to store only the necessary information from a unit
-# instead of storing the entire unit object
 class UnitInfo(NamedTuple):
+    """What is needed of a unit to count the terms it contains."""
+
+    #: The cleaned text the terms are taken from
     source: str
+    filename: str
+    #: The cleaned source text in lowercase, to recognize full message terms
+    message: str
+    #: The source text in lowercase, to recognize terms with notes
+    rawmessage: str
+    #: The cleaned target text of full message terms
     target: str
     locations: frozenset
     sourcenotes: frozenset
     transnotes: frozenset
 
 
+class TermStats:
+    """
+    Statistics of the occurrences of a term.
+
+    These are all that is needed to decide whether the term belongs in the
+    terminology, so they are kept instead of the occurrences themselves.
+    """
+
+    __slots__ = (
+        "besttarget",
+        "count",
+        "filecounts",
+        "locations",
+        "sourcenotes",
+        "sources",
+        "targets",
+        "transnotes",
+    )
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.sources: set[str] = set()
+        self.filecounts: dict[str, int] = {}
+        self.locations: set[str] = set()
+        # The files of the full message occurrences of every translation
+        self.targets: dict[str, dict[str, int]] = {}
+        # The translation of the first full message occurrence
+        self.besttarget: str | None = None
+        self.sourcenotes: set[str] = set()
+        self.transnotes: set[str] = set()
+
+    def add(self, term: str, info: UnitInfo) -> None:
+        """Counts an occurrence of *term* in the unit described by *info*."""
+        self.count += 1
+        self.sources.add(info.source)
+        self.filecounts[info.filename] = self.filecounts.get(info.filename, 0) + 1
+        self.locations.update(info.locations)
+        term = term.lower()
+        if term == info.message:
+            if info.target:
+                files = self.targets.setdefault(info.target, {})
+                files[info.filename] = files.get(info.filename, 0) + 1
+            if term == info.rawmessage:
+                self.sourcenotes.update(info.sourcenotes)
+                self.transnotes.update(info.transnotes)
+            if self.besttarget is None:
+                self.besttarget = info.target
+
+    def update(self, other: TermStats) -> None:
+        """Adds the occurrences counted in *other*, which come after these."""
+        self.count += other.count
+        self.sources.update(other.sources)
+        for filename, count in other.filecounts.items():
+            self.filecounts[filename] = self.filecounts.get(filename, 0) + count
+        self.locations.update(other.locations)
+        for target, otherfiles in other.targets.items():
+            files = self.targets.setdefault(target, {})
+            for filename, count in otherfiles.items():
+                files[filename] = files.get(filename, 0) + count
+        if self.besttarget is None:
+            self.besttarget = other.besttarget
+        self.sourcenotes.update(other.sourcenotes)
+        self.transnotes.update(other.transnotes)
+
+    def forgetmessages(self) -> None:
+        """Forgets the full message occurrences, when counted for another term."""
+        self.targets = {}
+        self.besttarget = None
+        self.sourcenotes = set()
+        self.transnotes = set()
+
+    def dumps(self) -> str:
+        """Returns the statistics as JSON."""
+        return json.dumps(
+            [
+                self.count,
+                list(self.sources),
+                self.filecounts,
+                list(self.locations),
+                self.targets,
+                self.besttarget,
+                list(self.sourcenotes),
+                list(self.transnotes),
+            ]
+        )
+
+    @classmethod
+    def loads(cls, data: str) -> TermStats:
+        """Returns the statistics stored as JSON by :meth:`dumps`."""
+        stats = cls()
+        (
+            stats.count,
+            sources,
+            stats.filecounts,
+            locations,
+            stats.targets,
+            stats.besttarget,
+            sourcenotes,
+            transnotes,
+        ) = json.loads(data)
+        stats.sources = set(sources)
+        stats.locations = set(locations)
+        stats.sourcenotes = set(sourcenotes)
+        stats.transnotes = set(transnotes)
+        return stats
+
+
+class GlossaryDatabase:
+    """
+    Glossary that keeps the statistics of at most *maxterms* terms in memory.
+
+    When there are more, the statistics in memory are added to a temporary
+    SQLite database, which can then hold several rows of statistics for a
+    term. These rows are combined, in the order they were added, when the
+    term is needed again.
+    """
+
+    def __init__(self, maxterms: int) -> None:
+        import sqlite3  # ruff:ignore[import-outside-top-level]
+
+        self.maxterms = maxterms
+        self.terms: dict[str, TermStats] = {}
+        # An empty name gives a database in a temporary file
+        self.connection = sqlite3.connect("")
+        self.connection.executescript(
+            """
+            CREATE TABLE terms (
+                id INTEGER PRIMARY KEY,
+                term TEXT NOT NULL,
+                stats TEXT NOT NULL
+            );
+            CREATE INDEX terms_term ON terms (term, id);
+            """
+        )
+
+    def flush(self) -> None:
+        """Moves the statistics in memory to the database."""
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO terms (term, stats) VALUES (?, ?)",
+                ((term, stats.dumps()) for term, stats in self.terms.items()),
+            )
+        self.terms.clear()
+
+    def get(self, term: str) -> TermStats | None:
+        """Returns the statistics of *term* collected since the last flush."""
+        return self.terms.get(term)
+
+    def __contains__(self, term: str) -> bool:
+        return (
+            term in self.terms
+            or self.connection.execute(
+                "SELECT 1 FROM terms WHERE term = ?", (term,)
+            ).fetchone()
+            is not None
+        )
+
+    def __len__(self) -> int:
+        self.flush()
+        return self.connection.execute(
+            "SELECT COUNT(DISTINCT term) FROM terms"
+        ).fetchone()[0]
+
+    def __setitem__(self, term: str, stats: TermStats) -> None:
+        if term not in self.terms and len(self.terms) >= self.maxterms:
+            self.flush()
+        self.terms[term] = stats
+
+    def pop(self, term: str) -> TermStats:
+        rows = self.connection.execute(
+            "SELECT stats FROM terms WHERE term = ? ORDER BY id", (term,)
+        ).fetchall()
+        if not rows:
+            return self.terms.pop(term)
+        self.connection.execute("DELETE FROM terms WHERE term = ?", (term,))
+        stats = TermStats.loads(rows[0][0])
+        for (data,) in rows[1:]:
+            stats.update(TermStats.loads(data))
+        if term in self.terms:
+            stats.update(self.terms.pop(term))
+        return stats
+
+    def items(self) -> Iterator[tuple[str, TermStats]]:
+        self.flush()
+        term = stats = None
+        for rowterm, data in self.connection.execute(
+            "SELECT term, stats FROM terms ORDER BY term, id"
+        ):
+            if rowterm == term:
+                stats.update(TermStats.loads(data))
+                continue
+            if term is not None:
+                yield term, stats
+            term, stats = rowterm, TermStats.loads(data)
+        if term is not None:
+            yield term, stats
+
+
 def create_termunit(
     term: str,
     unit: TranslationUnit | None,
     targets: dict[str, list[str]],
-    locations: set[str],
-    sourcenotes: set[str],
-    transnotes: set[str],
+    locations: Iterable[str],
+    sourcenotes: Iterable[str],
+    transnotes: Iterable[str],
     filecounts: dict[str, int],
 ) -> po.pounit:
     termunit = po.pounit(term)
@@ -91,6 +303,7 @@ class TerminologyExtractor:
         sourcelanguage: str = "en",
         invert: bool = False,
         stopfile: str | None = None,
+        maxterms: int | None = None,
     ) -> None:
         self.foldtitle = foldtitle
         self.ignorecase = ignorecase
@@ -128,7 +341,9 @@ class TerminologyExtractor:
         )
 
         self.units = 0
-        self.glossary = {}
+        self.glossary: dict[str, TermStats] | GlossaryDatabase = (
+            {} if maxterms is None else GlossaryDatabase(maxterms)
+        )
 
     def parse_stopword_file(self) -> None:
         actions = {
@@ -201,14 +416,36 @@ class TerminologyExtractor:
         """Return stoplist frozenset for input word."""
         return self.stopwords.get(self.stopmap(word), defaultset)
 
-    def addphrases(self, words, skips, translation, partials=True) -> None:
+    def addterm(self, term, info) -> None:
+        """Counts an occurrence of *term* in the unit described by *info*."""
+        stats = self.glossary.get(term)
+        if stats is None:
+            stats = self.glossary[term] = TermStats()
+        stats.add(term, info)
+
+    def pluralroot(self, word):
+        """
+        Returns the term *word* is counted as.
+
+        Plurals are counted as the singular when that is found too, and the
+        occurrences of a plural found before are moved to its singular.
+        """
+        if len(word) > 3 and word[-1] == "s" and word[0:-1] in self.glossary:
+            return word[0:-1]
+        if len(word) > 2 and f"{word}s" in self.glossary:
+            stats = self.glossary.pop(f"{word}s")
+            stats.forgetmessages()
+            self.glossary[word] = stats
+        return word
+
+    def addphrases(self, words, skips, info, partials=True) -> None:
         """Adds (sub)phrases with non-skipwords and more than one word."""
         if (
             len(words) > skips + 1
             and "skip" not in self.stopword(words[0])
             and "skip" not in self.stopword(words[-1])
         ):
-            self.glossary.setdefault(" ".join(words), []).append(translation)
+            self.addterm(" ".join(words), info)
         if partials:
             part = list(words)
             while len(part) > 2:
@@ -219,7 +456,7 @@ class TerminologyExtractor:
                     and "skip" not in self.stopword(part[0])
                     and "skip" not in self.stopword(part[-1])
                 ):
-                    self.glossary.setdefault(" ".join(part), []).append(translation)
+                    self.addterm(" ".join(part), info)
 
     def processunits(self, units, fullinputpath) -> None:
         sourcelang = lang_factory.getlanguage(self.sourcelanguage)
@@ -239,19 +476,23 @@ class TerminologyExtractor:
             if len(source) <= 1:
                 continue
 
-            # Extract unit information once and store it in a lightweight structure
-            # instead of storing the entire unit object multiple times
-            locations = frozenset(locre.sub("", loc) for loc in unit.getlocations())
+            # Full message terms are recognized in the unit source also when
+            # inverted, and their translation taken from the unit target
+            message = target if self.invert else source
+            fulltarget = source if self.invert else target
+            if self.ignorecase or (self.foldtitle and fulltarget.istitle()):
+                fulltarget = fulltarget.lower()
             source_note = unit.getnotes("source code")
             trans_note = unit.getnotes("translator")
-            sourcenotes = frozenset([source_note] if source_note else [])
-            transnotes = frozenset([trans_note] if trans_note else [])
-            unit_info = UnitInfo(
-                source=unit.source,
-                target=unit.target,
-                locations=locations,
-                sourcenotes=sourcenotes,
-                transnotes=transnotes,
+            info = UnitInfo(
+                source=source,
+                filename=fullinputpath,
+                message=message.lower(),
+                rawmessage=unit.source.strip().lower(),
+                target=fulltarget,
+                locations=frozenset(locre.sub("", loc) for loc in unit.getlocations()),
+                sourcenotes=frozenset([source_note] if source_note else []),
+                transnotes=frozenset([trans_note] if trans_note else []),
             )
 
             for sentence in sourcelang.sentences(source):
@@ -269,26 +510,15 @@ class TerminologyExtractor:
                             if stopre.match(stword) is not None:
                                 ignore = rematchignore
                                 break
-                    translation = (source, target, unit_info, fullinputpath)
                     if "word" not in ignore:
-                        # reduce plurals
-                        root = word
-                        if (
-                            len(word) > 3
-                            and word[-1] == "s"
-                            and word[0:-1] in self.glossary
-                        ):
-                            root = word[0:-1]
-                        elif len(root) > 2 and f"{root}s" in self.glossary:
-                            self.glossary[root] = self.glossary.pop(f"{root}s")
-                        self.glossary.setdefault(root, []).append(translation)
+                        self.addterm(self.pluralroot(word), info)
                     if self.termlength > 1:
                         if "phrase" in ignore:
                             # add trailing phrases in previous words
                             while len(words) > 2:
                                 if "skip" in self.stopword(words.pop(0)):
                                     skips -= 1
-                                self.addphrases(words, skips, translation)
+                                self.addphrases(words, skips, info)
                             words = []
                             skips = 0
                         else:
@@ -299,17 +529,36 @@ class TerminologyExtractor:
                                 while len(words) > self.termlength + skips:
                                     if "skip" in self.stopword(words.pop(0)):
                                         skips -= 1
-                                self.addphrases(words, skips, translation)
+                                self.addphrases(words, skips, info)
                             else:
-                                self.addphrases(
-                                    words, skips, translation, partials=False
-                                )
+                                self.addphrases(words, skips, info, partials=False)
                 if self.termlength > 1:
                     # add trailing phrases in sentence after reaching end
                     while self.termlength > 1 and len(words) > 2:
                         if "skip" in self.stopword(words.pop(0)):
                             skips -= 1
-                        self.addphrases(words, skips, translation)
+                        self.addphrases(words, skips, info)
+
+    def addglossary(self, glossary, units=0) -> None:
+        """
+        Adds the terms of *glossary*, collected by another extractor.
+
+        The terms are combined as if the units they were found in, *units*
+        in all, were processed after the ones already processed here.
+        """
+        self.units += units
+        for term, other in glossary.items():
+            if " " not in term:
+                root = self.pluralroot(term)
+                if root != term:
+                    # The plural full messages aren't messages of the singular
+                    other.forgetmessages()
+                    term = root
+            stats = self.glossary.get(term)
+            if stats is None:
+                self.glossary[term] = other
+            else:
+                stats.update(other)
 
     def extract_terms(
         self,
@@ -318,9 +567,9 @@ class TerminologyExtractor:
                 str,
                 TranslationUnit | None,
                 dict[str, list[str]],
-                set[str],
-                set[str],
-                set[str],
+                Iterable[str],
+                Iterable[str],
+                Iterable[str],
                 dict[str, int],
             ],
             po.pounit,
@@ -332,41 +581,14 @@ class TerminologyExtractor:
     ) -> dict[str, tuple[int, TranslationUnit]]:
         terms: dict[str, tuple[int, TranslationUnit]] = {}
         logger.info("%d terms from %d units", len(self.glossary), self.units)
-        for term, translations in self.glossary.items():
-            if len(translations) <= 1:
+        for term, stats in self.glossary.items():
+            if stats.count <= 1:
                 continue
-            filecounts: dict[str, int] = {}
-            sources: set[str] = set()
-            locations: set[str] = set()
-            sourcenotes: set[str] = set()
-            transnotes: set[str] = set()
-            targets: dict[str, list[str]] = {}
-            fullmsg = False
-            bestunit: TranslationUnit | None = None
-            for source, target, unit_info, filename in translations:
-                sources.add(source)
-                filecounts[filename] = filecounts.setdefault(filename, 0) + 1
-                # Check if this is a full message match
-                if term.lower() == self.clean(unit_info.source).lower():
-                    fullmsg = True
-                    target = self.clean(unit_info.target)
-                    if self.ignorecase or (self.foldtitle and target.istitle()):
-                        target = target.lower()
-                    if target:
-                        targets.setdefault(target, []).append(filename)
-                    if term.lower() == unit_info.source.strip().lower():
-                        sourcenotes.update(unit_info.sourcenotes)
-                        transnotes.update(unit_info.transnotes)
-                    # Create a unit object only when needed as the bestunit
-                    if bestunit is None:
-                        bestunit = po.pounit(term)
-                        bestunit.target = target
-                # Collect locations from unit_info
-                locations.update(unit_info.locations)
-
-            numsources = len(sources)
+            filecounts = stats.filecounts
+            fullmsg = stats.besttarget is not None
+            numsources = len(stats.sources)
             numfiles = len(filecounts)
-            numlocs = len(locations)
+            numlocs = len(stats.locations)
             if numfiles < inputmin or 0 < numlocs < locmin:
                 continue
             if fullmsg:
@@ -376,12 +598,31 @@ class TerminologyExtractor:
                 continue
 
             locmax = 2 * locmin
+            locations = sorted(stats.locations)
             if numlocs > locmax:
-                locations = set(list(locations)[0:locmax])
-                locations.add(f"(poterminology) {numlocs - locmax} more locations")
+                locations = locations[0:locmax]
+                locations.append(f"(poterminology) {numlocs - locmax} more locations")
 
+            bestunit: TranslationUnit | None = None
+            if fullmsg:
+                bestunit = po.pounit(term)
+                bestunit.target = stats.besttarget
+            targets = {
+                target: [
+                    filename
+                    for filename, count in files.items()
+                    for _occurrence in range(count)
+                ]
+                for target, files in stats.targets.items()
+            }
             termunit = create_termunit(
-                term, bestunit, targets, locations, sourcenotes, transnotes, filecounts
+                term,
+                bestunit,
+                targets,
+                locations,
+                sorted(stats.sourcenotes),
+                sorted(stats.transnotes),
+                filecounts,
             )
             terms[term] = ((10 * numfiles) + numsources, termunit)
         return terms
@@ -432,6 +673,38 @@ class TerminologyExtractor:
         return termitems
 
 
+_workerstate: tuple[TerminologyExtractor, optrecurse.optparse.Values] | None = None
+
+
+def _initworker(options) -> None:
+    """Prepares a worker process of :meth:`TerminologyOptionParser.parallelprocess`."""
+    global _workerstate  # ruff:ignore[global-statement]
+    # Problems with the stopword list were already reported by the parent
+    logging.disable(logging.WARNING)
+    _workerstate = (TerminologyOptionParser.getextractor(options), options)
+
+
+def _collectterms(fullinputpath):
+    """
+    Collects the terms of a single file in a worker process.
+
+    :return: The number of units in the file, its glossary and the error
+        information formatted for the errorlevel (or None if there was no
+        error).
+    """
+    assert _workerstate is not None
+    extractor, options = _workerstate
+    extractor.units = 0
+    extractor.glossary = {}
+    try:
+        with open(fullinputpath, "rb") as inputfile:
+            store = factory.getobject(inputfile)
+        extractor.processunits(store.units, fullinputpath)
+    except Exception:
+        return 0, {}, TerminologyOptionParser.formaterrorinfo(options, sys.exc_info())
+    return extractor.units, extractor.glossary, None
+
+
 class TerminologyOptionParser(optrecurse.RecursiveOptionParser):
     """a specialized Option Parser for the terminology tool..."""
 
@@ -499,7 +772,13 @@ class TerminologyOptionParser(optrecurse.RecursiveOptionParser):
         """Parses the arguments, and runs recursiveprocess with the resulting options."""
         self.files = 0
         options, _args = self.parse_args()
-        self.extractor = TerminologyExtractor(
+        self.extractor = self.getextractor(options, maxterms=options.maxterms)
+        self.recursiveprocess(options)
+
+    @staticmethod
+    def getextractor(options, maxterms=None) -> TerminologyExtractor:
+        """Creates the extractor for the given options."""
+        return TerminologyExtractor(
             foldtitle=options.foldtitle,
             ignorecase=options.ignorecase,
             accelchars=options.accelchars,
@@ -507,8 +786,8 @@ class TerminologyOptionParser(optrecurse.RecursiveOptionParser):
             sourcelanguage=options.sourcelanguage,
             invert=options.invert,
             stopfile=options.stopfile,
+            maxterms=maxterms,
         )
-        self.recursiveprocess(options)
 
     def recursiveprocess(self, options) -> None:
         """Recurse through directories and process files."""
@@ -528,6 +807,11 @@ class TerminologyOptionParser(optrecurse.RecursiveOptionParser):
             options.output = os.path.join(options.output, "pootle-terminology.pot")
 
         progress_bar = optrecurse.ProgressBar(options.progress, inputfiles)
+        jobs = self.getjobs(options)
+        if jobs > 1 and len(inputfiles) > 1:
+            self.parallelprocess(options, inputfiles, progress_bar, jobs)
+            self.outputterminology(options)
+            return
         for inputpath in inputfiles:
             self.files += 1
             fullinputpath = self.getfullinputpath(options, inputpath)
@@ -544,6 +828,52 @@ class TerminologyOptionParser(optrecurse.RecursiveOptionParser):
             progress_bar.report_progress(inputpath, success)
         self.outputterminology(options)
 
+    def parallelprocess(self, options, inputfiles, progress_bar, jobs) -> None:
+        """
+        Collects the terms of the input files in a pool of *jobs* processes.
+
+        Every worker collects the terms of a single file at a time, which are
+        added to the glossary here in the order of *inputfiles*, so the
+        terminology is the same as when processing the files one by one.
+        Workers only get a few files ahead, so that their glossaries waiting
+        to be added do not take up more and more memory.
+        """
+        from concurrent.futures import ProcessPoolExecutor  # ruff:ignore[import-outside-top-level]
+
+        with ProcessPoolExecutor(
+            max_workers=jobs, initializer=_initworker, initargs=(options,)
+        ) as executor:
+            tasks = deque()
+            for inputpath in inputfiles:
+                fullinputpath = self.getfullinputpath(options, inputpath)
+                future = executor.submit(_collectterms, fullinputpath)
+                tasks.append((inputpath, fullinputpath, future))
+                if len(tasks) > 2 * jobs:
+                    self.addcollectedterms(options, progress_bar, *tasks.popleft())
+            while tasks:
+                self.addcollectedterms(options, progress_bar, *tasks.popleft())
+
+    def addcollectedterms(
+        self, options, progress_bar, inputpath, fullinputpath, future
+    ) -> None:
+        """Adds the terms a worker collected from an input file."""
+        self.files += 1
+        message = f"Error processing: input {fullinputpath}"
+        success = False
+        try:
+            units, glossary, errorinfo = future.result()
+        except Exception:
+            self.warning(message, options, sys.exc_info())
+        else:
+            if errorinfo is None:
+                self.extractor.addglossary(glossary, units)
+                success = True
+            else:
+                if errorinfo:
+                    message += f": {errorinfo}"
+                self.warning(message)
+        progress_bar.report_progress(inputpath, success)
+
     def processfile(
         self, fileprocessor, options, fullinputpath, fulloutputpath, fulltemplatepath
     ) -> bool:
@@ -700,6 +1030,15 @@ def main() -> None:
         help=f"output sort order(s): {', '.join(TerminologyExtractor.sortorders_default)} (may repeat option, default is all in above order)",
     )
 
+    parser.add_option(
+        "",
+        "--max-terms",
+        type="int",
+        dest="maxterms",
+        metavar="COUNT",
+        help="keep at most COUNT terms in memory, and the others in a temporary file",
+    )
+
     parser.add_option(
         "",
         "--source-language",
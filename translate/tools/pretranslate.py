@@ -24,6 +24,9 @@ See: https://docs.translatehouse.org/projects/translate-toolkit/en/latest/comman
 for examples and usage instructions.
 """
 
+import os
+import weakref
+
 from translate.convert import convert
 from translate.search import match
 from translate.storage import factory
@@ -31,22 +34,52 @@ from translate.storage import factory
 # We don't want to reinitialise the TM each time, so let's store it here.
 tmmatcher = None
 
+# The fuzzy matches found by every matcher, so that source strings shared by
+# the files of a run are only matched once against the TM
+_fuzzycaches = weakref.WeakKeyDictionary()
+
+# Matching fewer source strings in parallel doesn't make up for starting the
+# worker processes
+PARALLEL_MIN_SOURCES = 200
+
+_workermatcher = None
+
+
+def memory(
+    tmfiles, max_candidates=1, min_similarity=75, max_length=1000, tm_index=None
+):
+    """
+    Returns the TM store to use. Only initialises on first call.
 
-def memory(tmfiles, max_candidates=1, min_similarity=75, max_length=1000):
-    """Returns the TM store to use. Only initialises on first call."""
+    If tm_index is given, the TM files are read through the persistent
+    :class:`~translate.search.tmindex.TMIndex` stored in that file, which is
+    updated first for TM files that changed.
+    """
     global tmmatcher  # ruff:ignore[global-statement]
     # Only initialise first time
-    if tmmatcher is None:
-        if isinstance(tmfiles, list):
-            tmstore = [factory.getobject(tmfile) for tmfile in tmfiles]
-        else:
-            tmstore = factory.getobject(tmfiles)
+    if tmmatcher is None and tm_index is not None:
+        from translate.search import tmindex  # ruff:ignore[import-outside-top-level]
+
+        with tmindex.TMIndex(tm_index) as index:
+            index.update(tmfiles)
+            tmmatcher = tmindex.tmindexmatcher(
+                index,
+                max_candidates=max_candidates,
+                min_similarity=min_similarity,
+                max_length=max_length,
+            )
+    elif tmmatcher is None:
         tmmatcher = match.matcher(
-            tmstore,
+            [],
             max_candidates=max_candidates,
             min_similarity=min_similarity,
             max_length=max_length,
         )
+        # The matcher keeps its own copy of the units, so large translation
+        # memories don't have to be held in memory as a whole
+        for tmfile in tmfiles if isinstance(tmfiles, list) else [tmfiles]:
+            tmstore, units = factory.iterobject(tmfile, intern_strings=True)
+            tmmatcher.extendtm(units, store=tmstore)
     return tmmatcher
 
 
@@ -57,18 +90,21 @@ def pretranslate_file(
     tm=None,
     min_similarity=75,
     fuzzymatching=True,
+    tm_index=None,
+    jobs=1,
 ) -> int:
     """
     Pretranslate any factory supported file with old translations and
     translation memory.
     """
-    input_store = factory.getobject(input_file)
+    # The input, old translations and translation memory share most strings
+    input_store = factory.getobject(input_file, intern_strings=True)
     template_store = None
     if template_file is not None:
-        template_store = factory.getobject(template_file)
+        template_store = factory.getobject(template_file, intern_strings=True)
 
     output = pretranslate_store(
-        input_store, template_store, tm, min_similarity, fuzzymatching
+        input_store, template_store, tm, min_similarity, fuzzymatching, tm_index, jobs
     )
     output.serialize(output_file)
     return 1
@@ -106,7 +142,7 @@ def match_source(input_unit, template_store):
     """Returns a matching unit from a template. matching based on unit id."""
     # hack for weird mozilla single letter strings, we don't want to
     # match them by anything but locations
-    if len(input_unit.source) > 1:
+    if template_store is not None and len(input_unit.source) > 1:
         return template_store.findunit(input_unit.source)
     return None
 
@@ -120,8 +156,129 @@ def match_fuzzy(input_unit, matchers):
     return None
 
 
+def _initmatchworker(matcher) -> None:
+    """Prepares a worker process of :func:`matches_many`."""
+    global _workermatcher  # ruff:ignore[global-statement]
+    _workermatcher = matcher
+
+
+def _matchesjob(texts):
+    """Matches some of the source strings in a worker process."""
+    return _workermatcher.matches_many(texts)
+
+
+def matches_many(matcher, texts, jobs=1):
+    """
+    Returns ``matcher.matches_many(texts)``, matching in *jobs* processes.
+
+    Matching happens in this process when *jobs* is 1, for a few *texts*,
+    or when this is a worker process already. With 0 all CPUs are used.
+    """
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+    if jobs == 1 or len(texts) < PARALLEL_MIN_SOURCES:
+        return matcher.matches_many(texts)
+    import multiprocessing  # ruff:ignore[import-outside-top-level]
+
+    if multiprocessing.parent_process() is not None:
+        return matcher.matches_many(texts)
+    from concurrent.futures import ProcessPoolExecutor  # ruff:ignore[import-outside-top-level]
+
+    # Texts of similar length are compared to the same candidates, so every
+    # worker gets texts of similar length
+    order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+    chunksize = -(-len(texts) // (4 * jobs))
+    chunks = [order[i : i + chunksize] for i in range(0, len(order), chunksize)]
+    results = [None] * len(texts)
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_initmatchworker, initargs=(matcher,)
+    ) as executor:
+        for chunk, found in zip(
+            chunks,
+            executor.map(_matchesjob, ([texts[i] for i in chunk] for chunk in chunks)),
+            strict=True,
+        ):
+            for i, matches in zip(chunk, found, strict=True):
+                results[i] = matches
+    return results
+
+
+def match_fuzzy_many(sources, matchers, jobs=1):
+    """
+    Return fuzzy matches for several source strings from a queue of matchers.
+
+    Every distinct source string is matched only once by a matcher, also
+    across calls, so the files of a run that share a translation memory
+    matcher don't match the same strings against it again. Source strings
+    are only passed on to the next matcher if no match was found.
+
+    :param jobs: The number of processes to match in, see :func:`matches_many`.
+    :return: Dictionary with the first fuzzy match of every source string
+        that has one.
+    """
+    fuzzy_matches = {}
+    pending = list(dict.fromkeys(sources))
+    for matcher in matchers:
+        if not pending:
+            break
+        # Changing the candidates or parameters changes the matches
+        signature = (
+            matcher.generation,
+            matcher.MAX_CANDIDATES,
+            matcher.MIN_SIMILARITY,
+            matcher.MAX_LENGTH,
+        )
+        cached = _fuzzycaches.get(matcher)
+        if cached is None or cached[0] != signature:
+            cached = _fuzzycaches[matcher] = (signature, {})
+        cache = cached[1]
+        unknown = [source for source in pending if source not in cache]
+        for source, fuzzycandidates in zip(
+            unknown, matches_many(matcher, unknown, jobs), strict=True
+        ):
+            cache[source] = fuzzycandidates[0] if fuzzycandidates else None
+        for source in pending:
+            if cache[source] is not None:
+                fuzzy_matches[source] = cache[source]
+        pending = [source for source in pending if source not in fuzzy_matches]
+    return fuzzy_matches
+
+
+def match_template(input_unit, template_store, merge_on="id"):
+    """Returns a matching unit from a template. matching based on merge_on."""
+    if not template_store:
+        return None
+    # :param:`merge_on` supports `location` and `id` for now
+    if merge_on == "location":
+        return match_template_location(input_unit, template_store)
+    return match_template_id(input_unit, template_store)
+
+
+def fuzzy_sources(input_units, template_store, merge_on="id"):
+    """
+    Returns the source strings :func:`pretranslate_unit` will fuzzy match
+    for the given units.
+    """
+    sources = []
+    for input_unit in input_units:
+        if not input_unit.istranslatable():
+            continue
+        matching_unit = match_template(input_unit, template_store, merge_on)
+        if matching_unit and matching_unit.gettargetlen() > 0:
+            continue
+        matching_unit = match_source(input_unit, template_store)
+        if not matching_unit or not matching_unit.gettargetlen():
+            sources.append(input_unit.source)
+    return sources
+
+
 def pretranslate_unit(
-    input_unit, template_store, matchers=None, mark_reused=False, merge_on="id"
+    input_unit,
+    template_store,
+    matchers=None,
+    mark_reused=False,
+    merge_on="id",
+    fuzzy_matches=None,
 ):
     """
     Pretranslate a unit or return unchanged if no translation was found.
@@ -132,16 +289,12 @@ def pretranslate_unit(
         objects.
     :param mark_reused: Whether to mark old translations as reused or not.
     :param merge_on: Where will the merge matching happen on.
+    :param fuzzy_matches: Optional fuzzy matches by source string, as
+        returned by :func:`match_fuzzy_many`, to use instead of matching
+        the unit.
     """
-    matching_unit = None
-
     # Do template matching
-    if template_store:
-        # :param:`merge_on` supports `location` and `id` for now
-        if merge_on == "location":
-            matching_unit = match_template_location(input_unit, template_store)
-        else:
-            matching_unit = match_template_id(input_unit, template_store)
+    matching_unit = match_template(input_unit, template_store, merge_on)
 
     if matching_unit and matching_unit.gettargetlen() > 0:
         input_unit.merge(matching_unit, authoritative=True)
@@ -151,7 +304,10 @@ def pretranslate_unit(
 
         if not matching_unit or not matching_unit.gettargetlen():
             # do fuzzy matching
-            matching_unit = match_fuzzy(input_unit, matchers)
+            if fuzzy_matches is None:
+                matching_unit = match_fuzzy(input_unit, matchers)
+            else:
+                matching_unit = fuzzy_matches.get(input_unit.source)
 
         if matching_unit and matching_unit.gettargetlen() > 0:
             # FIXME: should we dispatch here instead of this crude attr check
@@ -174,9 +330,20 @@ def pretranslate_unit(
 
 
 def pretranslate_store(
-    input_store, template_store, tm=None, min_similarity=75, fuzzymatching=True
+    input_store,
+    template_store,
+    tm=None,
+    min_similarity=75,
+    fuzzymatching=True,
+    tm_index=None,
+    jobs=1,
 ):
-    """Do the actual pretranslation of a whole store."""
+    """
+    Do the actual pretranslation of a whole store.
+
+    :param jobs: The number of processes to fuzzy match in, see
+        :func:`matches_many`.
+    """
     # preparation
     matchers = []
     # prepare template
@@ -205,16 +372,33 @@ def pretranslate_store(
     if tm and fuzzymatching:
         # FIXME: max_length hardcoded
         matcher = memory(
-            tm, max_candidates=1, min_similarity=min_similarity, max_length=1000
+            tm,
+            max_candidates=1,
+            min_similarity=min_similarity,
+            max_length=1000,
+            tm_index=tm_index,
         )
         matcher.addpercentage = False
         matchers.append(matcher)
 
+    # Fuzzy match all units at once
+    fuzzy_matches = None
+    if matchers:
+        fuzzy_matches = match_fuzzy_many(
+            fuzzy_sources(input_store.units, template_store, input_store.merge_on),
+            matchers,
+            jobs,
+        )
+
     # Main loop
     for input_unit in input_store.units:
         if input_unit.istranslatable():
             pretranslate_unit(
-                input_unit, template_store, matchers, merge_on=input_store.merge_on
+                input_unit,
+                template_store,
+                matchers,
+                merge_on=input_store.merge_on,
+                fuzzy_matches=fuzzy_matches,
             )
 
     return input_store
@@ -242,6 +426,15 @@ def main(argv=None) -> None:
         help="The file to use as translation memory when fuzzy matching",
     )
     parser.passthrough.append("tm")
+    parser.dependencies.append("tm")
+    parser.add_option(
+        "",
+        "--tm-index",
+        dest="tm_index",
+        default=None,
+        help="Keep the translation memory in a persistent index in this file",
+    )
+    parser.passthrough.append("tm_index")
     defaultsimilarity = 75
     parser.add_option(
         "-s",
@@ -260,6 +453,8 @@ def main(argv=None) -> None:
         help="Disable fuzzy matching",
     )
     parser.passthrough.append("fuzzymatching")
+    # Files processed one by one are fuzzy matched in parallel instead
+    parser.passthrough.append("jobs")
     parser.run(argv)
 
 
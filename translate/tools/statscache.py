@@ -0,0 +1,73 @@
+#
+# Copyright 2026 Translate Toolkit contributors
+#
+# This file is part of the Translate Toolkit.
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+"""
+Persistent cache of file statistics.
+
+The cache keeps the statistics counted by :mod:`~translate.tools.pocount` for
+every file in an SQLite database, so that files which did not change since an
+earlier run don't have to be parsed again. Statistics are keyed by the content
+of the file and the class it is parsed with, so copies of a file share their
+statistics wherever they are. The least recently used statistics are dropped
+when the cache grows beyond its size.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+
+from translate import __version__
+from translate.misc.sqlitecache import SQLiteCache
+from translate.storage import factory
+
+
+class StatsCache(SQLiteCache):
+    """Statistics of files stored in an SQLite database."""
+
+    #: The number of new statistics to keep in memory before writing them out
+    flushsize = 1000
+
+    @staticmethod
+    def getkey(filename) -> str | None:
+        """
+        Returns the key of the statistics of *filename*.
+
+        :return: The key, or None if the file can't be counted.
+        """
+        try:
+            storeclass = factory.getclass(filename)
+        except ValueError:
+            return None
+        digest = hashlib.sha256(
+            f"{__version__}\0{storeclass.__module__}.{storeclass.__qualname__}\0".encode()
+        )
+        with open(filename, "rb") as handle:
+            hashlib.file_digest(handle, lambda: digest)
+        return digest.hexdigest()
+
+    def encode(self, value) -> str | None:
+        """Converts the statistics to JSON, leaving out the filename."""
+        if not value:
+            return None
+        return json.dumps(
+            {name: stat for name, stat in value.items() if name != "filename"}
+        )
+
+    def decode(self, text):
+        return json.loads(text)